@@ -0,0 +1,176 @@
+# backend_api\backends.py
+"""
+Storage backend registry.
+
+Purpose: pick the CaseRepository implementation by name (Settings.backend)
+- A backend is a function (settings, slow_query_log) -> Storage,
+  registered with @register_backend("name")
+- Storage bundles the repository with what the lifespan needs around it:
+  executor thread counts, connection pools for metrics, and cleanup
+- Built in:
+  - "sqlite": pooled, migrated database file (+ optional read pool)
+  - "sqlite-group": the same, with writes batched by group commit
+  - "memory": InMemoryCaseRepository; RAM only, optionally warm-started
+    from (and saved to) a snapshot file
+
+Rule: backends only build storage; the service and caches are wired in
+dependencies.build_case_service.
+"""
+
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Union
+
+from backend_api.db import ConnectionPool, get_pragma_profile
+from backend_api.migrations import run_migrations
+from backend_api.replica import SnapshotReplica
+from backend_api.repositories.group_commit import GroupCommitCaseRepository
+from backend_api.repositories.inmemory import InMemoryCaseRepository
+from backend_api.repositories.sqlite import SQLiteCaseRepository
+from backend_api.repository_contract import CaseRepository
+from backend_api.settings import Settings
+from backend_api.slow_query_log import SlowQueryLog
+
+
+Pool = Union[ConnectionPool, SnapshotReplica]
+
+
+@dataclass
+class Storage:
+    repository: CaseRepository
+    # Executor threads the service should use for this repository
+    readers: int
+    writers: int = 1
+    # Named pools, exported as metrics ("write", "read")
+    pools: Dict[str, Pool] = field(default_factory=dict)
+    # Run in reverse order by close(), after the repository is closed
+    cleanups: List[Callable[[], None]] = field(default_factory=list)
+
+    def close(self) -> None:
+        """Release what the backend opened; the repository must be closed first."""
+        while self.cleanups:
+            self.cleanups.pop()()
+
+
+Backend = Callable[[Settings, Optional[SlowQueryLog]], Storage]
+
+_BACKENDS: Dict[str, Backend] = {}
+
+
+def register_backend(name: str) -> Callable[[Backend], Backend]:
+    """Register a storage backend under `name`, replacing any earlier one."""
+    def register(backend: Backend) -> Backend:
+        _BACKENDS[name] = backend
+        return backend
+
+    return register
+
+
+def available_backends() -> List[str]:
+    return sorted(_BACKENDS)
+
+
+def open_storage(
+    settings: Settings,
+    slow_query_log: Optional[SlowQueryLog] = None,
+) -> Storage:
+    """Build the storage selected by `settings.backend`."""
+    try:
+        backend = _BACKENDS[settings.backend]
+    except KeyError:
+        raise ValueError(
+            f"Unknown storage backend {settings.backend!r} "
+            f"(available: {', '.join(available_backends())})"
+        ) from None
+    return backend(settings, slow_query_log)
+
+
+def _open_read_pool(
+    settings: Settings,
+    slow_query_log: Optional[SlowQueryLog],
+) -> Optional[Pool]:
+    """The connections plain reads use, or None to read from the primary."""
+    if settings.read_connections == "primary":
+        return None
+    pragmas = get_pragma_profile(settings.pragma_profile)
+    if settings.read_connections == "snapshot":
+        return SnapshotReplica(
+            settings.database_path,
+            refresh_interval=settings.snapshot_refresh_interval,
+            size=settings.read_pool_size,
+            pragmas=pragmas,
+            slow_query_log=slow_query_log,
+        )
+    return ConnectionPool(
+        settings.database_path,
+        size=settings.read_pool_size,
+        timeout=settings.pool_timeout,
+        pragmas=pragmas,
+        slow_query_log=slow_query_log,
+        read_only=True,
+    )
+
+
+def _open_sqlite(
+    settings: Settings,
+    slow_query_log: Optional[SlowQueryLog],
+    group_commit: bool,
+) -> Storage:
+    pool = ConnectionPool(
+        settings.database_path,
+        size=settings.pool_size,
+        timeout=settings.pool_timeout,
+        pragmas=get_pragma_profile(settings.pragma_profile),
+        slow_query_log=slow_query_log,
+    )
+    storage = Storage(repository=None, readers=0, pools={"write": pool})
+    storage.cleanups.append(pool.close)
+    try:
+        with pool.connection() as conn:
+            run_migrations(conn)
+        # Opened after the migrations: a read-only connection needs the
+        # file to exist and a snapshot should include the schema
+        read_pool = _open_read_pool(settings, slow_query_log)
+        read_connection = None
+        if read_pool is not None:
+            storage.pools["read"] = read_pool
+            storage.cleanups.append(read_pool.close)
+            read_connection = read_pool.connection
+
+        # One reader thread per read connection. With group commit, many
+        # request writes wait on the executor while one group-commit
+        # thread does all the database writing.
+        storage.readers = read_pool.size if read_pool is not None else max(pool.size - 1, 1)
+        if group_commit:
+            storage.repository = GroupCommitCaseRepository(
+                pool.connection,
+                max_batch=settings.group_commit_max_batch,
+                max_delay=settings.group_commit_max_delay,
+                read_connection_factory=read_connection,
+            )
+            storage.writers = settings.group_commit_max_batch
+        else:
+            storage.repository = SQLiteCaseRepository(pool.connection, read_connection)
+    except Exception:
+        storage.close()
+        raise
+    return storage
+
+
+@register_backend("sqlite")
+def sqlite_backend(settings: Settings, slow_query_log: Optional[SlowQueryLog]) -> Storage:
+    return _open_sqlite(settings, slow_query_log, group_commit=False)
+
+
+@register_backend("sqlite-group")
+def sqlite_group_backend(settings: Settings, slow_query_log: Optional[SlowQueryLog]) -> Storage:
+    return _open_sqlite(settings, slow_query_log, group_commit=True)
+
+
+@register_backend("memory")
+def memory_backend(settings: Settings, slow_query_log: Optional[SlowQueryLog]) -> Storage:
+    # No connections, so the pool, pragma and slow-query settings do not apply.
+    # With a snapshot path the repository loads it here and saves on close.
+    return Storage(
+        InMemoryCaseRepository(snapshot_path=settings.memory_snapshot_path),
+        readers=settings.reader_threads,
+    )
@@ -0,0 +1,129 @@
+# backend_api\benchmarks\models.py
+"""
+Memory and construction benchmark for the Case domain model.
+
+Compares the slotted Case against the previous __dict__-based class:
+- bytes per case, measured with tracemalloc over `--count` objects
+- cases constructed per second
+- rows mapped per second from SQLite: sqlite3.Row + lookups by name
+  (the old _row_to_case) vs. the positional cursor row factory
+
+Usage:
+    python -m backend_api.benchmarks.models --count 1000000
+"""
+
+import argparse
+import gc
+import sqlite3
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+from backend_api.migrations import run_migrations
+from backend_api.models import Case
+
+
+class DictCase:
+    """The Case layout before slots, kept here as the baseline."""
+
+    def __init__(self, id, title, description, status, version=1):
+        self.id = id
+        self.title = title
+        self.description = description
+        self.status = status
+        self.version = version
+
+
+def _build(cls: type, count: int) -> List[object]:
+    # Shared strings, as the in-memory repository mostly holds few
+    # distinct statuses; the benchmark measures the object overhead
+    title, description, status = "Title", "Description", "open"
+    return [cls(i, title, description, status) for i in range(count)]
+
+
+def measure_model(cls: type, count: int) -> Dict[str, float]:
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    objects = _build(cls, count)
+    elapsed = time.perf_counter() - started
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+
+    return {"bytes_per_case": size / count, "cases_per_sec": count / elapsed}
+
+
+def _seeded_database(rows: int) -> sqlite3.Connection:
+    conn = sqlite3.connect(":memory:")
+    run_migrations(conn)
+    conn.executemany(
+        "INSERT INTO cases (title, description, status) VALUES (?, ?, ?)",
+        (("Title", "Description", "open") for _ in range(rows)),
+    )
+    conn.commit()
+    return conn
+
+
+def _by_name(conn: sqlite3.Connection) -> List[Case]:
+    conn.row_factory = sqlite3.Row
+    rows = conn.execute(
+        "SELECT id, title, description, status, version FROM cases"
+    ).fetchall()
+    return [
+        Case(
+            id=row["id"],
+            title=row["title"],
+            description=row["description"],
+            status=row["status"],
+            version=row["version"],
+        )
+        for row in rows
+    ]
+
+
+def _positional(conn: sqlite3.Connection) -> List[Case]:
+    cursor = conn.cursor()
+    cursor.row_factory = lambda _cursor, row: Case(*row)
+    return cursor.execute(
+        "SELECT id, title, description, status, version FROM cases"
+    ).fetchall()
+
+
+def measure_mapping(
+    conn: sqlite3.Connection,
+    mapper: Callable[[sqlite3.Connection], List[Case]],
+) -> float:
+    started = time.perf_counter()
+    count = len(mapper(conn))
+    return count / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=1_000_000)
+    parser.add_argument(
+        "--rows",
+        type=int,
+        default=200_000,
+        help="rows read from SQLite for the mapping benchmark",
+    )
+    args = parser.parse_args()
+
+    print(f"{'model':<12}{'bytes/case':>12}{'cases/s':>14}")
+    for cls in (DictCase, Case):
+        result = measure_model(cls, args.count)
+        print(
+            f"{cls.__name__:<12}{result['bytes_per_case']:>12.0f}"
+            f"{result['cases_per_sec']:>14,.0f}"
+        )
+
+    conn = _seeded_database(args.rows)
+    print(f"\n{'row mapping':<12}{'rows/s':>26}")
+    for name, mapper in (("by name", _by_name), ("positional", _positional)):
+        print(f"{name:<12}{measure_mapping(conn, mapper):>26,.0f}")
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()
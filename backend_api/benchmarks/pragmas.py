@@ -0,0 +1,137 @@
+# backend_api\benchmarks\pragmas.py
+"""
+Read/write concurrency benchmark for the SQLite pragma presets.
+
+Runs writer threads (INSERT + commit) next to reader threads (full scans
+of the cases table) against a fresh database file per preset, and reports
+operations per second and lock errors.
+
+Usage:
+    python -m backend_api.benchmarks.pragmas --seconds 3 --writers 2 --readers 4
+"""
+
+import argparse
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Dict, List
+
+from backend_api.db import PRAGMA_PRESETS, PragmaProfile, apply_pragmas
+from backend_api.migrations import run_migrations
+
+
+def _connect(path: str, profile: PragmaProfile) -> sqlite3.Connection:
+    conn = sqlite3.connect(path, check_same_thread=False)
+    apply_pragmas(conn, profile)
+    return conn
+
+
+def run_profile(
+    profile: PragmaProfile,
+    seconds: float,
+    writers: int,
+    readers: int,
+    seed_rows: int,
+) -> Dict[str, float]:
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "bench.db")
+
+        setup = _connect(path, profile)
+        run_migrations(setup)
+        setup.executemany(
+            "INSERT INTO cases (title, description, status) VALUES (?, ?, ?)",
+            (("seed", "seed row", "open") for _ in range(seed_rows)),
+        )
+        setup.commit()
+        setup.close()
+
+        counts = {"writes": 0, "reads": 0, "errors": 0}
+        lock = threading.Lock()
+        stop = threading.Event()
+
+        def writer() -> None:
+            conn = _connect(path, profile)
+            done = errors = 0
+            while not stop.is_set():
+                try:
+                    conn.execute(
+                        "INSERT INTO cases (title, description, status) VALUES (?, ?, ?)",
+                        ("bench", "written by benchmark", "open"),
+                    )
+                    conn.commit()
+                    done += 1
+                except sqlite3.OperationalError:
+                    conn.rollback()
+                    errors += 1
+            conn.close()
+            with lock:
+                counts["writes"] += done
+                counts["errors"] += errors
+
+        def reader() -> None:
+            conn = _connect(path, profile)
+            done = errors = 0
+            while not stop.is_set():
+                try:
+                    conn.execute("SELECT id, title, description, status FROM cases").fetchall()
+                    done += 1
+                except sqlite3.OperationalError:
+                    errors += 1
+            conn.close()
+            with lock:
+                counts["reads"] += done
+                counts["errors"] += errors
+
+        threads: List[threading.Thread] = [
+            threading.Thread(target=writer) for _ in range(writers)
+        ] + [threading.Thread(target=reader) for _ in range(readers)]
+
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        time.sleep(seconds)
+        stop.set()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+    return {
+        "writes_per_sec": counts["writes"] / elapsed,
+        "reads_per_sec": counts["reads"] / elapsed,
+        "lock_errors": counts["errors"],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--seed-rows", type=int, default=1000)
+    parser.add_argument(
+        "--profiles",
+        nargs="+",
+        default=list(PRAGMA_PRESETS),
+        choices=list(PRAGMA_PRESETS),
+    )
+    args = parser.parse_args()
+
+    print(f"{'profile':<12}{'writes/s':>12}{'reads/s':>12}{'lock errors':>14}")
+    for name in args.profiles:
+        result = run_profile(
+            PRAGMA_PRESETS[name],
+            seconds=args.seconds,
+            writers=args.writers,
+            readers=args.readers,
+            seed_rows=args.seed_rows,
+        )
+        print(
+            f"{name:<12}{result['writes_per_sec']:>12.0f}"
+            f"{result['reads_per_sec']:>12.0f}{result['lock_errors']:>14}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+# backend_api\benchmarks\report.py
+"""
+Latency summaries and JSON result files for the benchmark suite.
+
+- `summarize`: ops/sec and p50/p95/p99 from per-operation samples
+- `write_results` / `load_results`: one JSON document per run, with
+  enough metadata (commit, Python, arguments) to compare runs later
+- `compare`: per-benchmark change of p50 and throughput against a
+  baseline file
+"""
+
+import json
+import math
+import platform
+import subprocess
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+
+def percentile(sorted_samples: Sequence[float], fraction: float) -> float:
+    """Nearest-rank percentile of already sorted samples."""
+    if not sorted_samples:
+        return 0.0
+    rank = max(math.ceil(fraction * len(sorted_samples)), 1)
+    return sorted_samples[rank - 1]
+
+
+def summarize(
+    samples: List[float],
+    elapsed: float,
+    errors: int = 0,
+) -> Dict[str, float]:
+    """
+    Summarize latencies (seconds) of operations that took `elapsed`
+    seconds of wall-clock time in total. Latencies are reported in ms.
+    """
+    ordered = sorted(samples)
+    count = len(ordered)
+    return {
+        "count": count,
+        "errors": errors,
+        "ops_per_sec": count / elapsed if elapsed > 0 else 0.0,
+        "mean_ms": (sum(ordered) / count * 1000) if count else 0.0,
+        "p50_ms": percentile(ordered, 0.50) * 1000,
+        "p95_ms": percentile(ordered, 0.95) * 1000,
+        "p99_ms": percentile(ordered, 0.99) * 1000,
+        "max_ms": (ordered[-1] * 1000) if count else 0.0,
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def write_results(
+    path: str,
+    results: Dict[str, Dict[str, Dict[str, float]]],
+    arguments: Dict[str, Any],
+) -> None:
+    document = {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "arguments": arguments,
+        "results": results,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(document, f, indent=2, sort_keys=True)
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def print_table(title: str, results: Dict[str, Dict[str, float]]) -> None:
+    print(f"\n{title}")
+    print(
+        f"{'benchmark':<34}{'ops/s':>12}{'p50 ms':>10}"
+        f"{'p95 ms':>10}{'p99 ms':>10}{'errors':>8}"
+    )
+    for name, summary in results.items():
+        print(
+            f"{name:<34}{summary['ops_per_sec']:>12,.0f}{summary['p50_ms']:>10.3f}"
+            f"{summary['p95_ms']:>10.3f}{summary['p99_ms']:>10.3f}"
+            f"{summary['errors']:>8}"
+        )
+
+
+def compare(
+    baseline: Dict[str, Any],
+    current: Dict[str, Dict[str, Dict[str, float]]],
+) -> None:
+    """Print the relative change of each benchmark present in both runs."""
+    print(f"\nCompared with {baseline.get('commit') or 'baseline'}")
+    print(f"{'benchmark':<46}{'p50':>10}{'ops/s':>10}")
+    for group, benchmarks in current.items():
+        for name, summary in benchmarks.items():
+            before = baseline.get("results", {}).get(group, {}).get(name)
+            if not before:
+                continue
+            p50 = _change(before["p50_ms"], summary["p50_ms"])
+            ops = _change(before["ops_per_sec"], summary["ops_per_sec"])
+            print(f"{group + ' ' + name:<46}{p50:>10}{ops:>10}")
+
+
+def _change(before: float, after: float) -> str:
+    if not before:
+        return "n/a"
+    return f"{(after - before) / before:+.1%}"
@@ -0,0 +1,396 @@
+# backend_api\benchmarks\suite.py
+"""
+Throughput and latency benchmark suite for the cases API.
+
+Runs each storage backend from backend_api.backends, built exactly as
+the application builds it but on a temporary database file: "sqlite",
+"sqlite-group" (group commit) and "memory" (InMemoryCaseRepository):
+- repository: every CaseRepository method, called directly
+- http: every endpoint, through the ASGI app in-process with
+  `--concurrency` concurrent clients; "GET /cases/ (repeated)" polls the
+  same page, which the response cache serves unless
+  `--no-response-cache` is given
+Each benchmark reports ops/sec and p50/p95/p99 latency. Results can be
+written to JSON and compared with an earlier run.
+
+Usage:
+    python -m backend_api.benchmarks.suite --rows 10000 --concurrency 16 \\
+        --output bench.json
+    python -m backend_api.benchmarks.suite --compare bench.json
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Tuple
+
+import httpx
+
+from backend_api.backends import Storage, open_storage
+from backend_api.dependencies import build_case_service, get_case_service
+from backend_api.main import app
+from backend_api.repository_contract import CaseRepository
+from backend_api.response_cache import ResponseCache
+from backend_api.settings import Settings
+from backend_api.benchmarks.report import (
+    compare,
+    load_results,
+    print_table,
+    summarize,
+    write_results,
+)
+
+
+BACKENDS = ("sqlite", "sqlite-group", "memory")
+DEFAULTS = Settings()
+BATCH_SIZE = 100
+PAGE_SIZE = 100
+
+# Small vocabulary, so search terms match a realistic share of cases
+WORDS = (
+    "printer network login password invoice refund email server laptop "
+    "screen backup access license update crash slow error report phone "
+    "account payment delivery order vpn"
+).split()
+
+# name, number of operations, operation(i)
+Operation = Tuple[str, int, Callable[[int], object]]
+# method, url, httpx request keyword arguments
+Request = Tuple[str, str, dict]
+
+
+@contextmanager
+def open_repository(backend: str) -> Iterator[Storage]:
+    """Storage for `backend` from the registry, on a throwaway database file."""
+    with tempfile.TemporaryDirectory() as directory:
+        settings = Settings(
+            backend=backend,
+            database_path=os.path.join(directory, "cases.db"),
+            # Reads go through the primary, as the benchmark always has
+            read_connections="primary",
+        )
+        storage = open_storage(settings)
+        try:
+            yield storage
+        finally:
+            storage.repository.close()
+            storage.close()
+
+
+def _case_fields(rng: random.Random, status: str = "open") -> Tuple[str, str, str]:
+    title = " ".join(rng.choices(WORDS, k=2)).capitalize()
+    description = " ".join(rng.choices(WORDS, k=12))
+    return title, description, status
+
+
+def seed(repository: CaseRepository, rows: int, rng: random.Random) -> List[int]:
+    """Insert `rows` cases (every fourth closed) and return their IDs."""
+    ids: List[int] = []
+    for start in range(0, rows, 1000):
+        items = [
+            _case_fields(rng, "closed" if (start + i) % 4 == 0 else "open")
+            for i in range(min(1000, rows - start))
+        ]
+        ids.extend(case.id for case in repository.create_many(items))
+    return ids
+
+
+def _fresh_ids(repository: CaseRepository, count: int, rng: random.Random) -> List[int]:
+    # Mutations get their own open cases, so every call can succeed
+    return [
+        case.id
+        for case in repository.create_many([_case_fields(rng) for _ in range(count)])
+    ]
+
+
+def _repository_operations(
+    repository: CaseRepository,
+    ids: List[int],
+    iterations: int,
+    rng: random.Random,
+) -> Iterator[Operation]:
+    # A generator: setup between yields runs outside the timed loops
+    scans = max(iterations // 100, 1)
+    batches = max(iterations // 10, 1)
+
+    yield "create", iterations, lambda i: repository.create(*_case_fields(rng))
+    yield "create_many", batches, lambda i: repository.create_many(
+        [_case_fields(rng) for _ in range(BATCH_SIZE)]
+    )
+    yield "get_by_id", iterations, lambda i: repository.get_by_id(rng.choice(ids))
+    yield "get_page", iterations, lambda i: repository.get_page(
+        PAGE_SIZE, after=rng.choice(ids)
+    )
+    yield "get_page status", iterations, lambda i: repository.get_page(
+        PAGE_SIZE, after=rng.choice(ids), status="open"
+    )
+    yield "search", iterations, lambda i: repository.search(rng.choice(WORDS), 20)
+    yield "count", iterations, lambda i: repository.count()
+    yield "count_by_status", iterations, lambda i: repository.count_by_status()
+    yield "get_all", scans, lambda i: repository.get_all()
+    yield "iter_all", scans, lambda i: sum(1 for _ in repository.iter_all())
+
+    updated = _fresh_ids(repository, iterations, rng)
+    yield "update", iterations, lambda i: repository.update(
+        updated[i], *_case_fields(rng)
+    )
+    yield "update_unless_closed", iterations, lambda i: repository.update_unless_closed(
+        updated[i], *_case_fields(rng)
+    )
+
+    statuses = _fresh_ids(repository, batches * BATCH_SIZE, rng)
+    yield "update_status_many", batches, lambda i: repository.update_status_many(
+        statuses[i * BATCH_SIZE:(i + 1) * BATCH_SIZE], "open"
+    )
+
+    deleted = _fresh_ids(repository, iterations, rng)
+    yield "delete", iterations, lambda i: repository.delete(deleted[i])
+
+    deleted = _fresh_ids(repository, iterations, rng)
+    yield "delete_unless_closed", iterations, lambda i: repository.delete_unless_closed(
+        deleted[i]
+    )
+
+    deleted = _fresh_ids(repository, batches * BATCH_SIZE, rng)
+    yield "delete_many", batches, lambda i: repository.delete_many(
+        deleted[i * BATCH_SIZE:(i + 1) * BATCH_SIZE]
+    )
+
+
+def run_repository_benchmarks(
+    repository: CaseRepository,
+    ids: List[int],
+    iterations: int,
+    rng: random.Random,
+) -> Dict[str, Dict[str, float]]:
+    results = {}
+    for name, count, operation in _repository_operations(repository, ids, iterations, rng):
+        samples: List[float] = []
+        errors = 0
+        started = time.perf_counter()
+        for i in range(count):
+            call_started = time.perf_counter()
+            try:
+                operation(i)
+            except Exception:
+                errors += 1
+                continue
+            samples.append(time.perf_counter() - call_started)
+        results[name] = summarize(samples, time.perf_counter() - started, errors)
+    return results
+
+
+def _http_operations(
+    repository: CaseRepository,
+    ids: List[int],
+    requests: int,
+    rng: random.Random,
+) -> Iterator[Tuple[str, int, Callable[[int], Request]]]:
+    scans = max(requests // 100, 1)
+    batches = max(requests // 10, 1)
+
+    def case_json() -> dict:
+        title, description, status = _case_fields(rng)
+        return {"title": title, "description": description, "status": status}
+
+    yield "POST /cases/", requests, lambda i: ("POST", "/cases/", {"json": case_json()})
+    yield "POST /cases/bulk", batches, lambda i: (
+        "POST",
+        "/cases/bulk",
+        {"json": [case_json() for _ in range(BATCH_SIZE)]},
+    )
+    yield "GET /cases/{id}", requests, lambda i: (
+        "GET", f"/cases/{rng.choice(ids)}", {}
+    )
+    yield "GET /cases/", requests, lambda i: (
+        "GET",
+        "/cases/",
+        {"params": {"limit": PAGE_SIZE, "after": rng.choice(ids)}},
+    )
+    yield "GET /cases/ (repeated)", requests, lambda i: (
+        "GET",
+        "/cases/",
+        {"params": {"limit": PAGE_SIZE}, "headers": {"Accept-Encoding": "gzip"}},
+    )
+    yield "GET /cases/?status=", requests, lambda i: (
+        "GET",
+        "/cases/",
+        {"params": {"limit": PAGE_SIZE, "after": rng.choice(ids), "status": "open"}},
+    )
+    yield "GET /cases/search", requests, lambda i: (
+        "GET", "/cases/search", {"params": {"q": rng.choice(WORDS)}}
+    )
+    yield "GET /cases/stats", requests, lambda i: ("GET", "/cases/stats", {})
+    yield "GET /cases/export", scans, lambda i: ("GET", "/cases/export", {})
+
+    updated = _fresh_ids(repository, requests, rng)
+    yield "PUT /cases/{id}", requests, lambda i: (
+        "PUT", f"/cases/{updated[i]}", {"json": case_json()}
+    )
+
+    deleted = _fresh_ids(repository, requests, rng)
+    yield "DELETE /cases/{id}", requests, lambda i: (
+        "DELETE", f"/cases/{deleted[i]}", {}
+    )
+
+    statuses = _fresh_ids(repository, batches * BATCH_SIZE, rng)
+    yield "POST /cases/bulk/status", batches, lambda i: (
+        "POST",
+        "/cases/bulk/status",
+        {"json": {"ids": statuses[i * BATCH_SIZE:(i + 1) * BATCH_SIZE], "status": "open"}},
+    )
+
+    deleted = _fresh_ids(repository, batches * BATCH_SIZE, rng)
+    yield "POST /cases/bulk/delete", batches, lambda i: (
+        "POST",
+        "/cases/bulk/delete",
+        {"json": {"ids": deleted[i * BATCH_SIZE:(i + 1) * BATCH_SIZE]}},
+    )
+
+
+async def _load(
+    client: httpx.AsyncClient,
+    build: Callable[[int], Request],
+    count: int,
+    concurrency: int,
+) -> Dict[str, float]:
+    samples: List[float] = []
+    errors = 0
+    # Shared by all workers; safe because they run on one event loop
+    indexes = iter(range(count))
+
+    async def worker() -> None:
+        nonlocal errors
+        for i in indexes:
+            method, url, kwargs = build(i)
+            started = time.perf_counter()
+            try:
+                response = await client.request(method, url, **kwargs)
+            except httpx.HTTPError:
+                errors += 1
+                continue
+            if response.status_code >= 400:
+                errors += 1
+                continue
+            samples.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(samples, time.perf_counter() - started, errors)
+
+
+async def run_http_benchmarks(
+    repository: CaseRepository,
+    ids: List[int],
+    requests: int,
+    concurrency: int,
+    rng: random.Random,
+    cache_size: int = DEFAULTS.case_cache_size,
+    writers: int = 1,
+    response_cache: bool = True,
+) -> Dict[str, Dict[str, float]]:
+    # The service is wired like the application lifespan does, around
+    # the benchmark's repository instead of cases.db
+    service = build_case_service(repository, cache_size=cache_size, writers=writers)
+    app.dependency_overrides[get_case_service] = lambda: service
+    app.state.response_cache = (
+        ResponseCache(DEFAULTS.response_cache_size, ttl=DEFAULTS.response_cache_ttl)
+        if response_cache
+        else None
+    )
+    results = {}
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for name, count, build in _http_operations(repository, ids, requests, rng):
+                results[name] = await _load(client, build, count, concurrency)
+    finally:
+        app.dependency_overrides.pop(get_case_service, None)
+        app.state.response_cache = None
+        service.close()
+    return results
+
+
+def run_suite(
+    backends: Tuple[str, ...] = BACKENDS,
+    rows: int = 10_000,
+    iterations: int = 1000,
+    requests: int = 1000,
+    concurrency: int = 10,
+    cache_size: int = DEFAULTS.case_cache_size,
+    random_seed: int = 0,
+    repository_benchmarks: bool = True,
+    http_benchmarks: bool = True,
+    response_cache: bool = True,
+) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """Run the selected benchmarks; results are grouped as "<backend> <kind>"."""
+    results = {}
+    for backend in backends:
+        rng = random.Random(random_seed)
+        with open_repository(backend) as storage:
+            repository = storage.repository
+            ids = seed(repository, rows, rng)
+            if repository_benchmarks:
+                results[f"{backend} repository"] = run_repository_benchmarks(
+                    repository, ids, iterations, rng
+                )
+            if http_benchmarks:
+                results[f"{backend} http"] = asyncio.run(
+                    run_http_benchmarks(
+                        repository,
+                        ids,
+                        requests,
+                        concurrency,
+                        rng,
+                        cache_size,
+                        writers=storage.writers,
+                        response_cache=response_cache,
+                    )
+                )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--backends", nargs="+", default=list(BACKENDS), choices=BACKENDS)
+    parser.add_argument("--rows", type=int, default=10_000, help="cases seeded per backend")
+    parser.add_argument("--iterations", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--cache-size", type=int, default=DEFAULTS.case_cache_size)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--skip-repository", action="store_true")
+    parser.add_argument("--skip-http", action="store_true")
+    parser.add_argument("--no-response-cache", action="store_true")
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--compare", help="JSON file of an earlier run")
+    args = parser.parse_args()
+
+    results = run_suite(
+        backends=tuple(args.backends),
+        rows=args.rows,
+        iterations=args.iterations,
+        requests=args.requests,
+        concurrency=args.concurrency,
+        cache_size=args.cache_size,
+        random_seed=args.seed,
+        repository_benchmarks=not args.skip_repository,
+        http_benchmarks=not args.skip_http,
+        response_cache=not args.no_response_cache,
+    )
+
+    for group, benchmarks in results.items():
+        print_table(group, benchmarks)
+    if args.compare:
+        compare(load_results(args.compare), results)
+    if args.output:
+        write_results(args.output, results, vars(args))
+        print(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
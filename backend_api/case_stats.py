@@ -0,0 +1,112 @@
+# backend_api\case_stats.py
+"""
+Consistency check and rebuild for the `case_stats` summary table.
+
+Purpose: `case_stats` holds case counts per status, kept up to date by
+triggers (see migration 5), so GET /cases/stats never scans `cases`.
+Rule: no FastAPI imports; used by operators, never on the request path
+- `check_case_stats` compares the counters with a real COUNT(*)
+- `rebuild_case_stats` recomputes them in one transaction
+
+Usage:
+    python -m backend_api.case_stats              # check, exit 1 on drift
+    python -m backend_api.case_stats --rebuild    # recompute the counters
+"""
+
+import argparse
+import sqlite3
+import sys
+from typing import Dict, Tuple
+
+from backend_api.migrations import run_migrations
+from backend_api.settings import load_settings
+
+
+def _stored_counts(conn: sqlite3.Connection) -> Dict[str, int]:
+    return dict(conn.execute("SELECT status, count FROM case_stats").fetchall())
+
+
+def _actual_counts(conn: sqlite3.Connection) -> Dict[str, int]:
+    return dict(
+        conn.execute("SELECT status, COUNT(*) FROM cases GROUP BY status").fetchall()
+    )
+
+
+def check_case_stats(conn: sqlite3.Connection) -> Dict[str, Tuple[int, int]]:
+    """
+    Return {status: (stored, actual)} for every status whose counter is
+    wrong. An empty dict means the summary table is consistent.
+    """
+    # Read both sides from one snapshot so a concurrent write cannot
+    # show up as drift
+    conn.execute("BEGIN")
+    try:
+        stored = _stored_counts(conn)
+        actual = _actual_counts(conn)
+    finally:
+        conn.rollback()
+
+    return {
+        status: (stored.get(status, 0), actual.get(status, 0))
+        for status in stored.keys() | actual.keys()
+        if stored.get(status, 0) != actual.get(status, 0)
+    }
+
+
+def rebuild_case_stats(conn: sqlite3.Connection) -> Dict[str, int]:
+    """Recompute every counter from `cases` and return the new counts."""
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        conn.execute("DELETE FROM case_stats")
+        conn.execute(
+            """
+            INSERT INTO case_stats (status, count)
+            SELECT status, COUNT(*) FROM cases GROUP BY status
+            """
+        )
+        counts = _stored_counts(conn)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+    return counts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    # Same file as the application, unless given explicitly
+    parser.add_argument("--database", default=None)
+    parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="recompute the counters instead of only checking them",
+    )
+    args = parser.parse_args()
+    database = args.database or load_settings().database_path
+
+    # isolation_level=None: transactions are managed explicitly above
+    conn = sqlite3.connect(database, isolation_level=None)
+    try:
+        run_migrations(conn)
+
+        if args.rebuild:
+            for status, count in sorted(rebuild_case_stats(conn).items()):
+                print(f"{status:<12}{count:>10}")
+            return
+
+        drift = check_case_stats(conn)
+        if not drift:
+            print("case_stats is consistent")
+            return
+
+        print(f"{'status':<12}{'stored':>10}{'actual':>10}")
+        for status, (stored, actual) in sorted(drift.items()):
+            print(f"{status:<12}{stored:>10}{actual:>10}")
+        sys.exit(1)
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
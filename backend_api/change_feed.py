@@ -0,0 +1,160 @@
+# backend_api\change_feed.py
+"""
+Change feed: one change-log reader fanned out to many subscribers.
+
+Purpose: let consumers follow case mutations instead of polling GET /cases/
+- `ChangeBroadcaster` polls the change log once per `poll_interval` while
+  anyone is subscribed, and hands each new batch to every subscriber,
+  so N open streams cost one query, not N
+- `follow_changes` replays the log from a subscriber's cursor, then
+  switches to the live batches without gaps or duplicates
+- A subscriber that falls `max_backlog` batches behind is dropped; its
+  stream ends and the client resumes from its last seen seq
+
+Rule: framework-agnostic; main.py turns the changes into SSE events.
+"""
+
+import asyncio
+from typing import AsyncIterator, List, Optional, Set
+
+from backend_api.models import CaseChange
+from backend_api.services.async_case_service import AsyncCaseService
+
+
+# Queued to a subscriber whose stream must end (lagging or shutdown)
+_END = None
+
+
+class ChangeBroadcaster:
+    def __init__(
+        self,
+        service: AsyncCaseService,
+        poll_interval: float = 0.5,
+        batch_size: int = 500,
+        max_backlog: int = 100,
+    ):
+        self._service = service
+        self._poll_interval = poll_interval
+        self._batch_size = batch_size
+        self._max_backlog = max_backlog
+
+        self._subscribers: Set["asyncio.Queue[Optional[List[CaseChange]]]"] = set()
+        self._cursor = 0
+        self._task: Optional[asyncio.Task] = None
+        self._starting = asyncio.Lock()
+        self._closed = False
+
+    @property
+    def subscribers(self) -> int:
+        return len(self._subscribers)
+
+    async def subscribe(self) -> "asyncio.Queue[Optional[List[CaseChange]]]":
+        """
+        Register a subscriber; it receives every change after the cursor
+        the broadcaster was at when it subscribed.
+        """
+        if self._closed:
+            raise RuntimeError("Change feed is closed")
+
+        queue: "asyncio.Queue[Optional[List[CaseChange]]]" = asyncio.Queue(
+            maxsize=self._max_backlog
+        )
+        async with self._starting:
+            if self._task is None or self._task.done():
+                # Nobody was listening, so start from the newest change.
+                # The cursor must be set before the subscriber reads its
+                # backlog, or changes in between would be missed.
+                self._cursor = await self._service.last_change()
+                self._task = asyncio.create_task(self._poll())
+            self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: "asyncio.Queue[Optional[List[CaseChange]]]") -> None:
+        self._subscribers.discard(queue)
+
+    async def close(self) -> None:
+        """End every stream and stop polling."""
+        self._closed = True
+        for queue in list(self._subscribers):
+            self._end(queue)
+        self._subscribers.clear()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    def _end(self, queue: "asyncio.Queue[Optional[List[CaseChange]]]") -> None:
+        # Make room so the end marker always fits
+        while queue.full():
+            queue.get_nowait()
+        queue.put_nowait(_END)
+
+    def _publish(self, changes: List[CaseChange]) -> None:
+        for queue in list(self._subscribers):
+            if queue.full():
+                self._subscribers.discard(queue)
+                self._end(queue)
+            else:
+                queue.put_nowait(changes)
+
+    async def _poll(self) -> None:
+        # Runs only while someone is subscribed
+        while self._subscribers:
+            try:
+                changes = await self._service.list_changes(
+                    self._cursor, self._batch_size
+                )
+            except Exception:
+                # Storage hiccup: keep the subscribers and try again
+                changes = []
+            if changes:
+                self._cursor = changes[-1].seq
+                self._publish(changes)
+            if len(changes) < self._batch_size:
+                await asyncio.sleep(self._poll_interval)
+
+
+async def follow_changes(
+    service: AsyncCaseService,
+    broadcaster: ChangeBroadcaster,
+    after: int,
+    batch_size: int = 500,
+    heartbeat: Optional[float] = None,
+) -> AsyncIterator[Optional[CaseChange]]:
+    """
+    Yield every change after `after`: first the backlog from the log, then
+    live changes as they are committed. Ends when the broadcaster drops
+    the subscriber or shuts down.
+
+    With a `heartbeat`, None is yielded after that many idle seconds so
+    the caller can keep its connection alive.
+    """
+    # Subscribe before reading the backlog, so nothing committed in
+    # between is missed; the overlap is skipped by seq below
+    queue = await broadcaster.subscribe()
+    try:
+        last = after
+        while True:
+            changes = await service.list_changes(last, batch_size)
+            for change in changes:
+                yield change
+                last = change.seq
+            if len(changes) < batch_size:
+                break
+
+        while True:
+            try:
+                changes = await asyncio.wait_for(queue.get(), heartbeat)
+            except asyncio.TimeoutError:
+                yield None
+                continue
+            if changes is _END:
+                return
+            for change in changes:
+                if change.seq > last:
+                    yield change
+                    last = change.seq
+    finally:
+        broadcaster.unsubscribe(queue)
@@ -1,24 +1,395 @@
 # backend_api\db.py
 
 """
-Purpose: provide a safe connection factory
-Rule: no FastAPI imports, no globals, no shared connections
+Purpose: provide safe SQLite connections
+Rule: no FastAPI imports, no shared connections outside a pool
+- connection_factory: one short-lived connection per operation
+- ConnectionPool: bounded set of long-lived connections, owned by the
+  application lifespan and handed to repositories
 """
 
+import dataclasses
 import sqlite3
+import threading
+import time
+from collections import deque
 from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Deque, Dict, Iterator, Optional
+
+from backend_api.slow_query_log import SlowQueryLog
+
+
+DATABASE_PATH = "cases.db"
+# Durable unless a deployment opts into "throughput", which may lose the
+# last acknowledged commits on power loss
+DEFAULT_PRAGMA_PROFILE = "durable"
+
+
+@dataclass(frozen=True)
+class PragmaProfile:
+    """
+    SQLite settings applied to every new connection.
+
+    None means "leave the SQLite default alone".
+    """
+
+    journal_mode: Optional[str] = None
+    synchronous: Optional[str] = None
+    cache_size: Optional[int] = None  # pages, or KiB when negative
+    mmap_size: Optional[int] = None  # bytes
+    temp_store: Optional[str] = None
+    busy_timeout: Optional[int] = None  # milliseconds
+
+
+PRAGMA_PRESETS: Dict[str, PragmaProfile] = {
+    # Plain SQLite defaults: rollback journal, synchronous=FULL
+    "default": PragmaProfile(),
+    # WAL for concurrent readers, but still fsync on every commit
+    "durable": PragmaProfile(
+        journal_mode="WAL",
+        synchronous="FULL",
+        cache_size=-16000,
+        temp_store="MEMORY",
+        busy_timeout=5000,
+    ),
+    # WAL with fsync only at checkpoints: a power loss may drop the last
+    # commits, but the database is never corrupted
+    "throughput": PragmaProfile(
+        journal_mode="WAL",
+        synchronous="NORMAL",
+        cache_size=-64000,
+        mmap_size=256 * 1024 * 1024,
+        temp_store="MEMORY",
+        busy_timeout=5000,
+    ),
+}
+
+
+def get_pragma_profile(name: str) -> PragmaProfile:
+    try:
+        return PRAGMA_PRESETS[name]
+    except KeyError:
+        raise ValueError(f"Unknown pragma profile: {name}") from None
+
+
+def apply_pragmas(conn: sqlite3.Connection, profile: PragmaProfile) -> None:
+    """Apply a PragmaProfile to an open connection."""
+    # Values are interpolated because PRAGMA does not accept parameters;
+    # integers are coerced and keywords come from the profile, not users.
+    if profile.journal_mode is not None:
+        conn.execute(f"PRAGMA journal_mode = {profile.journal_mode}").fetchone()
+    if profile.synchronous is not None:
+        conn.execute(f"PRAGMA synchronous = {profile.synchronous}")
+    if profile.cache_size is not None:
+        conn.execute(f"PRAGMA cache_size = {int(profile.cache_size)}")
+    if profile.mmap_size is not None:
+        conn.execute(f"PRAGMA mmap_size = {int(profile.mmap_size)}").fetchone()
+    if profile.temp_store is not None:
+        conn.execute(f"PRAGMA temp_store = {profile.temp_store}")
+    if profile.busy_timeout is not None:
+        conn.execute(f"PRAGMA busy_timeout = {int(profile.busy_timeout)}").fetchone()
 
 
 @contextmanager
-def connection_factory():
+def connection_factory(database: str = DATABASE_PATH):
     """
     Create a SQLite connection that is:
     - Created and used in the same thread
     - Properly closed after use
     """
-    conn = sqlite3.connect("cases.db")
+    conn = sqlite3.connect(database)
     conn.row_factory = sqlite3.Row
     try:
         yield conn
     finally:
         conn.close()
+
+
+# Set for the current request (and copied into executor threads) when its
+# reads must see the primary, e.g. right after the client wrote
+_read_from_primary: ContextVar[bool] = ContextVar("read_from_primary", default=False)
+
+
+@contextmanager
+def read_your_writes() -> Iterator[None]:
+    """Route reads inside the block to the primary database."""
+    token = _read_from_primary.set(True)
+    try:
+        yield
+    finally:
+        _read_from_primary.reset(token)
+
+
+def set_read_your_writes(enabled: bool) -> None:
+    """Like read_your_writes(), for the rest of the current context."""
+    _read_from_primary.set(enabled)
+
+
+def reads_from_primary() -> bool:
+    return _read_from_primary.get()
+
+
+def read_only_uri(database: str) -> str:
+    """URI that opens `database` read-only; SQLite rejects any write."""
+    if database == ":memory:":
+        raise ValueError("An in-memory database cannot be opened read-only")
+    return Path(database).absolute().as_uri() + "?mode=ro"
+
+
+class PoolTimeout(Exception):
+    """Raised when no pooled connection became available in time."""
+
+
+@dataclass
+class PoolStats:
+    """Point-in-time snapshot of a ConnectionPool."""
+
+    size: int
+    open: int
+    idle: int
+    in_use: int
+    checkouts: int
+    waits: int
+    wait_time: float
+    timeouts: int
+    created: int
+    recycled: int
+
+
+class _PooledConnection:
+    """A pooled connection plus the bookkeeping needed to recycle it."""
+
+    __slots__ = ("conn", "created_at", "last_used")
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+
+
+class ConnectionPool:
+    """
+    Bounded, thread-safe pool of SQLite connections.
+
+    - At most `size` connections are open at once
+    - Checkout blocks for up to `timeout` seconds, then raises PoolTimeout
+    - Connections older than `recycle` seconds are closed and replaced
+    - Connections idle longer than `health_check_interval` seconds are
+      pinged before being handed out; broken ones are replaced
+    - `pragmas` is applied to every connection the pool opens
+    - with a `slow_query_log`, every statement on pooled connections is
+      timed and slow ones are recorded
+    - `read_only` opens connections with mode=ro and query_only, for
+      routing reads away from the primary's connections
+
+    `pool.connection` has the same shape as `connection_factory`, so it can
+    be passed to SQLiteCaseRepository unchanged.
+    """
+
+    def __init__(
+        self,
+        database: str = DATABASE_PATH,
+        size: int = 5,
+        timeout: float = 30.0,
+        recycle: Optional[float] = 3600.0,
+        health_check_interval: Optional[float] = 30.0,
+        pragmas: Optional[PragmaProfile] = None,
+        slow_query_log: Optional[SlowQueryLog] = None,
+        read_only: bool = False,
+    ):
+        if size < 1:
+            raise ValueError("Pool size must be at least 1")
+
+        self._database = database
+        self._size = size
+        self._timeout = timeout
+        self._recycle = recycle
+        self._health_check_interval = health_check_interval
+        self._pragmas = pragmas
+        self._slow_query_log = slow_query_log
+        self._read_only = read_only
+        if read_only:
+            self._target = read_only_uri(database)
+            # The journal mode belongs to the database and is set by the
+            # primary; a read-only connection cannot change it
+            if pragmas is not None:
+                self._pragmas = dataclasses.replace(pragmas, journal_mode=None)
+        else:
+            self._target = database
+
+        self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)
+        self._idle: Deque[_PooledConnection] = deque()
+        self._open = 0
+        self._closed = False
+
+        self._checkouts = 0
+        self._waits = 0
+        self._wait_time = 0.0
+        self._timeouts = 0
+        self._created = 0
+        self._recycled = 0
+
+    @property
+    def database(self) -> str:
+        return self._database
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def _connect(self) -> _PooledConnection:
+        # Connections move between threadpool workers, so the same-thread
+        # check is disabled; the pool guarantees one user at a time.
+        connect = (
+            self._slow_query_log.connect
+            if self._slow_query_log is not None
+            else sqlite3.connect
+        )
+        conn = connect(self._target, check_same_thread=False, uri=self._read_only)
+        conn.row_factory = sqlite3.Row
+        try:
+            if self._pragmas is not None:
+                apply_pragmas(conn, self._pragmas)
+            if self._read_only:
+                # Belt and braces next to mode=ro
+                conn.execute("PRAGMA query_only = ON")
+        except sqlite3.Error:
+            conn.close()
+            raise
+        return _PooledConnection(conn)
+
+    def _is_usable(self, pooled: _PooledConnection) -> bool:
+        now = time.monotonic()
+
+        if self._recycle is not None and now - pooled.created_at > self._recycle:
+            return False
+
+        if (
+            self._health_check_interval is not None
+            and now - pooled.last_used > self._health_check_interval
+        ):
+            try:
+                pooled.conn.execute("SELECT 1").fetchone()
+            except sqlite3.Error:
+                return False
+
+        return True
+
+    def _discard(self, pooled: _PooledConnection) -> None:
+        try:
+            pooled.conn.close()
+        except sqlite3.Error:
+            pass
+
+    def _acquire(self) -> _PooledConnection:
+        deadline = None
+        waited_since = None
+
+        with self._available:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Connection pool is closed")
+
+                if self._idle:
+                    pooled = self._idle.pop()
+                    break
+
+                if self._open < self._size:
+                    # Reserve the slot; the connection is opened outside the lock
+                    self._open += 1
+                    pooled = None
+                    break
+
+                if waited_since is None:
+                    waited_since = time.monotonic()
+                    deadline = waited_since + self._timeout
+                    self._waits += 1
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._timeouts += 1
+                    self._wait_time += time.monotonic() - waited_since
+                    raise PoolTimeout(
+                        f"No connection available within {self._timeout}s"
+                    )
+                self._available.wait(remaining)
+
+            if waited_since is not None:
+                self._wait_time += time.monotonic() - waited_since
+            self._checkouts += 1
+
+        if pooled is not None and self._is_usable(pooled):
+            return pooled
+
+        if pooled is not None:
+            self._discard(pooled)
+            with self._lock:
+                self._recycled += 1
+
+        try:
+            pooled = self._connect()
+        except Exception:
+            with self._available:
+                self._open -= 1
+                self._available.notify()
+            raise
+
+        with self._lock:
+            self._created += 1
+        return pooled
+
+    def _release(self, pooled: _PooledConnection) -> None:
+        try:
+            # Never hand an open transaction to the next user
+            if pooled.conn.in_transaction:
+                pooled.conn.rollback()
+            broken = False
+        except sqlite3.Error:
+            broken = True
+
+        with self._available:
+            if broken or self._closed:
+                self._open -= 1
+                self._discard(pooled)
+            else:
+                pooled.last_used = time.monotonic()
+                self._idle.append(pooled)
+            self._available.notify()
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Check out a connection for the duration of the `with` block."""
+        pooled = self._acquire()
+        try:
+            yield pooled.conn
+        finally:
+            self._release(pooled)
+
+    def stats(self) -> PoolStats:
+        with self._lock:
+            idle = len(self._idle)
+            return PoolStats(
+                size=self._size,
+                open=self._open,
+                idle=idle,
+                in_use=self._open - idle,
+                checkouts=self._checkouts,
+                waits=self._waits,
+                wait_time=self._wait_time,
+                timeouts=self._timeouts,
+                created=self._created,
+                recycled=self._recycled,
+            )
+
+    def close(self) -> None:
+        """Close idle connections; checked-out ones close when released."""
+        with self._available:
+            self._closed = True
+            while self._idle:
+                self._discard(self._idle.pop())
+                self._open -= 1
+            self._available.notify_all()
@@ -7,18 +7,93 @@ Rule: FastAPI allowed here, nowhere else
 - This is the composition root for the application
 - Uses FastAPI dependency injection
 - Wires infrastructure -> repository -> service
+- The storage backend itself is chosen by settings (see backends.py)
 - Keeps business logic framework-agnostic
 """
 
 
-from backend_api.db import connection_factory
-from backend_api.repositories.sqlite import SQLiteCaseRepository
-from backend_api.services.case_service import CaseService
+from typing import Optional
 
+from fastapi import Request
 
-def get_case_service() -> CaseService:
+from backend_api.db import set_read_your_writes
+from backend_api.metrics import MetricsRegistry, register_cache_metrics
+from backend_api.repositories.caching import CachingCaseRepository
+from backend_api.repositories.executor import ExecutorCaseRepository
+from backend_api.repositories.instrumented import InstrumentedCaseRepository
+from backend_api.repository_contract import CaseRepository
+from backend_api.services.async_case_service import AsyncCaseService
+from backend_api.services.instrumented import InstrumentedCaseService
+from backend_api.settings import Settings
+
+
+# Defaults for callers that wire a service by hand (tests, benchmarks);
+# the application passes its loaded settings
+_DEFAULTS = Settings()
+# Requests sending this header with a true value read from the primary
+READ_YOUR_WRITES_HEADER = "X-Read-Your-Writes"
+
+
+def build_case_service(
+    repository: CaseRepository,
+    cache_size: int = _DEFAULTS.case_cache_size,
+    cache_ttl: float = _DEFAULTS.case_cache_ttl,
+    cache_not_found: bool = False,
+    readers: int = _DEFAULTS.reader_threads,
+    writers: int = 1,
+    metrics: Optional[MetricsRegistry] = None,
+    replica_lag: Optional[float] = None,
+) -> AsyncCaseService:
+    """
+    Wire an AsyncCaseService around any repository implementation.
+
+    Unless `cache_size` is 0, lookups by ID go through a read-through
+    cache that is invalidated by writes; when reads may lag the primary by
+    up to `replica_lag` seconds, cached cases expire at least that often.
+    Storage calls then run on
+    dedicated reader/writer threads (more than one writer only for a
+    repository that batches writes itself). With a `metrics` registry, the
+    storage backend and the service are wrapped in timing decorators.
+    Called once from the application lifespan; the result is shared by
+    all requests and must be closed on shutdown.
+    """
+    if metrics is not None:
+        repository = InstrumentedCaseRepository(repository, metrics)
+    if cache_size > 0:
+        if replica_lag is not None:
+            # A case read from an old snapshot must not outlive the next one
+            cache_ttl = min(cache_ttl, replica_lag)
+        repository = CachingCaseRepository(
+            repository,
+            max_size=cache_size,
+            ttl=cache_ttl,
+            cache_not_found=cache_not_found,
+        )
+        if metrics is not None:
+            register_cache_metrics(metrics, repository)
+
+    service = AsyncCaseService(
+        ExecutorCaseRepository(repository, readers=readers, writers=writers)
+    )
+    if metrics is not None:
+        service = InstrumentedCaseService(service, metrics)
+    return service
+
+
+async def read_consistency(request: Request) -> None:
+    """
+    Route the request's reads to the primary when it asks to see its own writes.
+
+    Async on purpose: it must run in the request's own context, which the
+    executor copies into the storage threads.
+    """
+    value = request.headers.get(READ_YOUR_WRITES_HEADER, "")
+    if value.lower() in ("1", "true", "yes"):
+        set_read_your_writes(True)
+
+
+def get_case_service(request: Request) -> AsyncCaseService:
     """
-    Provide a CaseService with its concrete dependencies.
+    Provide the application-wide CaseService.
     """
-    repository = SQLiteCaseRepository(connection_factory)
-    return CaseService(repository)
+    return request.app.state.case_service
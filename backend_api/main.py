@@ -6,23 +6,185 @@ Responsibilities:
 - Define HTTP endpoints
 - Handle HTTP-specific concerns (status codes, errors)
 - Delegate business logic to services
+
+All handlers are `async def` and await the AsyncCaseService, whose
+storage calls run on dedicated executors instead of FastAPI's threadpool.
 """
 
-from fastapi import FastAPI, HTTPException, Depends, Response
-from backend_api.dependencies import get_case_service
-from backend_api.schemas import CaseCreate, CaseRead
-from backend_api.services.case_service import CaseService
+from contextlib import asynccontextmanager
+from typing import AsyncIterable, AsyncIterator, List, Optional, Union
+
+from fastapi import (
+    Body,
+    FastAPI,
+    HTTPException,
+    Depends,
+    Header,
+    Query,
+    Request,
+    Response,
+)
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from backend_api.backends import open_storage
+from backend_api.change_feed import ChangeBroadcaster, follow_changes
+from backend_api.db import reads_from_primary
+from backend_api.dependencies import (
+    build_case_service,
+    get_case_service,
+    read_consistency,
+)
+from backend_api.metrics import (
+    CONTENT_TYPE as METRICS_CONTENT_TYPE,
+    MetricsMiddleware,
+    MetricsRegistry,
+    register_pool_metrics,
+    register_response_cache_metrics,
+    register_slow_query_metrics,
+)
+from backend_api.models import Case, CaseChange
+from backend_api.response_cache import ResponseCache
+from backend_api.schemas import (
+    MAX_BULK_ITEMS,
+    BulkDelete,
+    BulkItemRead,
+    BulkResponse,
+    BulkStatusUpdate,
+    CaseChangeRead,
+    CaseCreate,
+    CaseDeltaRead,
+    CaseRead,
+    CaseSearchHit,
+    CaseStats,
+    CaseStatus,
+    ExportFormat,
+    SlowQueryRead,
+)
+from backend_api.serialization import (
+    case_json,
+    cases_json,
+    change_json,
+    changes_json,
+    delta_json,
+)
+from backend_api.services.async_case_service import AsyncCaseService
+from backend_api.services.case_service import BulkItemResult, VersionConflictError
+from backend_api.settings import load_settings
+from backend_api.slow_query_log import SlowQueryLog
+
+
+class RawJSONResponse(Response):
+    """Response whose content is already encoded JSON bytes (see serialization.py)."""
+
+    media_type = "application/json"
+
+
+# Read once at import; tests and tools swap in their own with
+# dataclasses.replace before the lifespan runs
+settings = load_settings()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One storage backend (pools and schema bootstrap included) and one
+    # service for the lifetime of the application
+    app.state.settings = settings
+    app.state.slow_query_log = (
+        SlowQueryLog(settings.slow_query_threshold, settings.slow_query_log_size)
+        if settings.slow_query_log_enabled
+        else None
+    )
+    app.state.storage = open_storage(settings, app.state.slow_query_log)
+    app.state.metrics = MetricsRegistry() if settings.metrics_enabled else None
+    if app.state.metrics is not None:
+        if app.state.storage.pools:
+            register_pool_metrics(app.state.metrics, app.state.storage.pools)
+        if app.state.slow_query_log is not None:
+            register_slow_query_metrics(app.state.metrics, app.state.slow_query_log)
+    # How far plain reads may lag the primary; caches expire at least this often
+    replica_lag = None
+    if "read" in app.state.storage.pools and settings.read_connections == "snapshot":
+        replica_lag = settings.snapshot_refresh_interval
+    app.state.case_service = build_case_service(
+        app.state.storage.repository,
+        cache_size=settings.case_cache_size,
+        cache_ttl=settings.case_cache_ttl,
+        readers=app.state.storage.readers,
+        writers=app.state.storage.writers,
+        metrics=app.state.metrics,
+        replica_lag=replica_lag,
+    )
+    app.state.response_cache = None
+    if settings.response_cache_enabled:
+        ttl = settings.response_cache_ttl
+        if replica_lag is not None:
+            # A body built from an old snapshot must not outlive the next one
+            ttl = min(ttl, replica_lag)
+        app.state.response_cache = ResponseCache(settings.response_cache_size, ttl=ttl)
+        if app.state.metrics is not None:
+            register_response_cache_metrics(app.state.metrics, app.state.response_cache)
+    app.state.change_feed = ChangeBroadcaster(
+        app.state.case_service,
+        poll_interval=settings.change_feed_poll_interval,
+    )
+    try:
+        yield
+    finally:
+        # app.state outlives the lifespan; cached bodies must not
+        app.state.response_cache = None
+        await app.state.change_feed.close()
+        app.state.case_service.close()
+        app.state.storage.close()
+
+
+app = FastAPI(lifespan=lifespan, dependencies=[Depends(read_consistency)])
+app.add_middleware(MetricsMiddleware)
 
-app = FastAPI()
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics(request: Request):
+    """Prometheus text exposition of the application's metrics."""
+    registry = getattr(request.app.state, "metrics", None)
+    if registry is None:
+        raise HTTPException(status_code=404, detail="Metrics are disabled")
+    return PlainTextResponse(registry.render(), media_type=METRICS_CONTENT_TYPE)
+
+
+def _slow_query_log(request: Request) -> SlowQueryLog:
+    log = getattr(request.app.state, "slow_query_log", None)
+    if log is None:
+        raise HTTPException(status_code=404, detail="Slow-query log is disabled")
+    return log
+
+
+@app.get("/admin/slow-queries", response_model=list[SlowQueryRead])
+async def get_slow_queries(log: SlowQueryLog = Depends(_slow_query_log)):
+    """Slowest recent statements, newest first, with their query plans."""
+    return [
+        SlowQueryRead(
+            sql=entry.sql,
+            params=entry.params,
+            rows=entry.rows,
+            duration_ms=entry.duration * 1000,
+            vm_steps=entry.vm_steps,
+            plan=entry.plan,
+            recorded_at=entry.recorded_at,
+        )
+        for entry in log.entries()
+    ]
+
+
+@app.delete("/admin/slow-queries", status_code=204)
+async def clear_slow_queries(log: SlowQueryLog = Depends(_slow_query_log)):
+    log.clear()
 
 
 @app.post("/cases/", status_code=201, response_model=CaseRead)
-def create_case(
+async def create_case(
     payload: CaseCreate,
-    service: CaseService = Depends(get_case_service),
+    service: AsyncCaseService = Depends(get_case_service),
 ):
     try:
-        case = service.create_case(
+        case = await service.create_case(
             title=payload.title,
             description=payload.description,
             status=payload.status.value,
@@ -33,53 +195,375 @@ def create_case(
     return CaseRead.model_validate(case)
 
 
-@app.get("/cases/", response_model=list[CaseRead])
-def get_cases(
-    service: CaseService = Depends(get_case_service),
+def _bulk_response(results: List[BulkItemResult]) -> BulkResponse:
+    succeeded = sum(1 for r in results if r.ok)
+    return BulkResponse(
+        succeeded=succeeded,
+        failed=len(results) - succeeded,
+        results=[
+            BulkItemRead(
+                index=r.index,
+                id=r.case_id,
+                ok=r.ok,
+                case=CaseRead.model_validate(r.case) if r.case else None,
+                error=r.error,
+            )
+            for r in results
+        ],
+    )
+
+
+@app.post("/cases/bulk", response_model=BulkResponse)
+async def create_cases_bulk(
+    payload: List[CaseCreate] = Body(..., min_length=1, max_length=MAX_BULK_ITEMS),
+    service: AsyncCaseService = Depends(get_case_service),
+):
+    results = await service.create_cases(
+        [(p.title, p.description, p.status.value) for p in payload]
+    )
+    return _bulk_response(results)
+
+
+@app.post("/cases/bulk/status", response_model=BulkResponse)
+async def update_case_statuses_bulk(
+    payload: BulkStatusUpdate,
+    service: AsyncCaseService = Depends(get_case_service),
+):
+    results = await service.update_case_statuses(payload.ids, payload.status.value)
+    return _bulk_response(results)
+
+
+@app.post("/cases/bulk/delete", response_model=BulkResponse)
+async def delete_cases_bulk(
+    payload: BulkDelete,
+    service: AsyncCaseService = Depends(get_case_service),
+):
+    results = await service.delete_cases(payload.ids)
+    return _bulk_response(results)
+
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+
+@app.get("/cases/", response_model=Union[list[CaseRead], CaseDeltaRead])
+async def get_cases(
+    request: Request,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[int] = Query(None, ge=0),
+    status: Optional[CaseStatus] = None,
+    modified_since: Optional[int] = Query(None, ge=0),
+    service: AsyncCaseService = Depends(get_case_service),
 ):
-    cases = service.get_all_cases()
-    return [CaseRead.model_validate(c) for c in cases]
+    """
+    List cases, one keyset page at a time.
+
+    With `modified_since` (0 for a first full sync), return a CaseDeltaRead
+    instead: the cases changed and the IDs deleted after that row version,
+    plus the cursor to send next time.
+    """
+    if modified_since is not None and (after is not None or status is not None):
+        raise HTTPException(
+            status_code=400,
+            detail="modified_since cannot be combined with after or status",
+        )
+
+    async def build():
+        if modified_since is not None:
+            try:
+                delta = await service.list_modified_since(modified_since, limit)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            return delta_json(delta), {"X-Next-Cursor": str(delta.cursor)}
+
+        cases, next_cursor = await service.list_cases(
+            limit,
+            after=after,
+            status=status.value if status else None,
+        )
+
+        # The body stays a plain list; the cursor for the next page travels
+        # in headers so existing clients keep working.
+        headers = {}
+        if next_cursor is not None:
+            headers["X-Next-Cursor"] = str(next_cursor)
+            next_url = request.url.include_query_params(after=next_cursor)
+            headers["Link"] = f'<{next_url}>; rel="next"'
+
+        # Encoded directly; response_model above only documents the shape
+        return cases_json(cases), headers
+
+    cache: Optional[ResponseCache] = getattr(request.app.state, "response_cache", None)
+    if cache is None:
+        body, headers = await build()
+        return RawJSONResponse(body, headers=headers)
+
+    # Until the next write, repeated polls are served from encoded (and
+    # compressed) bytes. Read-your-writes requests skip the cache, since
+    # entries may come from a lagging read replica.
+    reply = await cache.serve(
+        request.url.path,
+        request.query_params.multi_items(),
+        request.headers,
+        service.generation.value,
+        build,
+        bypass=reads_from_primary(),
+    )
+    return Response(
+        reply.body,
+        status_code=reply.status_code,
+        headers=reply.headers,
+        media_type=reply.media_type,
+    )
+
+
+# Declared before /cases/{case_id} so "stats" is not parsed as an ID
+@app.get("/cases/stats", response_model=CaseStats)
+async def get_case_stats(service: AsyncCaseService = Depends(get_case_service)):
+    """
+    Case counts per status, read from counters rather than a table scan.
+    """
+    counts = await service.count_cases_by_status()
+    by_status = {status: counts.get(status.value, 0) for status in CaseStatus}
+    return CaseStats(total=sum(counts.values()), by_status=by_status)
+
+
+def _sse_event(change: Optional[CaseChange]) -> bytes:
+    if change is None:
+        # Comment line: keeps proxies from closing an idle stream
+        return b": keep-alive\n\n"
+    return (
+        f"id: {change.seq}\nevent: {change.operation.value}\ndata: ".encode()
+        + change_json(change)
+        + b"\n\n"
+    )
+
+
+async def _change_events(
+    changes: AsyncIterable[Optional[CaseChange]],
+) -> AsyncIterator[bytes]:
+    # Tells EventSource clients how long to wait before reconnecting (ms)
+    yield b"retry: 3000\n\n"
+    async for change in changes:
+        yield _sse_event(change)
+
+
+# Declared before /cases/{case_id} so "changes" is not parsed as an ID
+@app.get("/cases/changes", response_model=list[CaseChangeRead])
+async def get_case_changes(
+    request: Request,
+    since: int = Query(0, ge=0),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    last_event_id: Optional[int] = Header(None, ge=0),
+    service: AsyncCaseService = Depends(get_case_service),
+):
+    """
+    Case mutations after sequence number `since`, oldest first.
+
+    - Pull: a JSON list; X-Next-Cursor is the `since` for the next call
+    - Stream: with `Accept: text/event-stream`, a server-sent event per
+      change (id = seq, event = operation), backlog first, then live.
+      Reconnecting clients resume from Last-Event-ID.
+    """
+    if "text/event-stream" in request.headers.get("accept", ""):
+        changes = follow_changes(
+            service,
+            request.app.state.change_feed,
+            last_event_id if last_event_id is not None else since,
+            heartbeat=request.app.state.settings.change_feed_heartbeat,
+        )
+        return StreamingResponse(
+            _change_events(changes),
+            media_type="text/event-stream",
+            # Events must reach the client as they happen, not when a
+            # proxy buffer fills up
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    try:
+        changes = await service.list_changes(since, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    next_cursor = changes[-1].seq if changes else since
+    return RawJSONResponse(
+        changes_json(changes),
+        headers={"X-Next-Cursor": str(next_cursor)},
+    )
+
+
+# Declared before /cases/{case_id} so "search" is not parsed as an ID
+@app.get("/cases/search", response_model=list[CaseSearchHit])
+async def search_cases(
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    service: AsyncCaseService = Depends(get_case_service),
+):
+    """
+    Full-text search over title and description, best match first.
+    """
+    try:
+        hits, next_offset = await service.search_cases(q, limit, offset=offset)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if next_offset is not None:
+        response.headers["X-Next-Offset"] = str(next_offset)
+
+    return [
+        CaseSearchHit(
+            case=CaseRead.model_validate(hit.case),
+            score=hit.score,
+            snippet=hit.snippet,
+        )
+        for hit in hits
+    ]
+
+
+async def _encode_export(
+    cases: AsyncIterable[Case],
+    export_format: ExportFormat,
+    batch_size: int,
+) -> AsyncIterator[bytes]:
+    """Encode cases into chunks of at most `batch_size` rows."""
+    is_json = export_format is ExportFormat.json
+    separator = b"," if is_json else b"\n"
+    terminator = b"" if is_json else b"\n"
+    chunk = []
+    first_chunk = True
+
+    if is_json:
+        yield b"["
+
+    async for case in cases:
+        chunk.append(case_json(case))
+        if len(chunk) == batch_size:
+            prefix = b"" if first_chunk or not is_json else separator
+            yield prefix + separator.join(chunk) + terminator
+            chunk = []
+            first_chunk = False
+
+    if chunk:
+        prefix = b"" if first_chunk or not is_json else separator
+        yield prefix + separator.join(chunk) + terminator
+
+    if is_json:
+        yield b"]"
+
+
+# Declared before /cases/{case_id} so "export" is not parsed as an ID
+@app.get("/cases/export")
+async def export_cases(
+    format: ExportFormat = ExportFormat.ndjson,
+    batch_size: int = Query(500, ge=1, le=10000),
+    service: AsyncCaseService = Depends(get_case_service),
+):
+    """
+    Stream every case as NDJSON or a JSON array.
+
+    Rows are read in keyset pages and encoded batch by batch, so memory
+    use does not grow with the size of the table and a slow client holds
+    no database connection between batches.
+    """
+    total = await service.count_cases()
+    cases = service.export_cases(batch_size=batch_size)
+
+    media_type = (
+        "application/x-ndjson"
+        if format is ExportFormat.ndjson
+        else "application/json"
+    )
+    headers = {
+        # Rows present when the export started; lets clients show progress
+        "X-Total-Count": str(total),
+        "X-Export-Batch-Size": str(batch_size),
+        "Content-Disposition": f'attachment; filename="cases.{format.value}"',
+    }
+
+    return StreamingResponse(
+        _encode_export(cases, format, batch_size),
+        media_type=media_type,
+        headers=headers,
+    )
+
+
+def _etag(case: Case) -> str:
+    return f'"{case.version}"'
+
+
+def _etag_matches(header: str, case: Case) -> bool:
+    """Check an If-None-Match style header against the case's ETag."""
+    if header.strip() == "*":
+        return True
+    tags = [tag.strip().removeprefix("W/") for tag in header.split(",")]
+    return _etag(case) in tags
+
+
+def _expected_version(if_match: Optional[str]) -> Optional[int]:
+    """Turn an If-Match header into the version the update must see."""
+    if if_match is None or if_match.strip() == "*":
+        return None
+    try:
+        return int(if_match.strip().removeprefix("W/").strip('"'))
+    except ValueError:
+        raise HTTPException(status_code=412, detail="Invalid If-Match header")
 
 
 @app.get("/cases/{case_id}", response_model=CaseRead)
-def get_case(
+async def get_case(
     case_id: int,
-    service: CaseService = Depends(get_case_service),
+    if_none_match: Optional[str] = Header(None),
+    service: AsyncCaseService = Depends(get_case_service),
 ):
-    case = service.get_case(case_id)
+    case = await service.get_case(case_id)
     if case is None:
         raise HTTPException(status_code=404, detail="Case not found")
-    return CaseRead.model_validate(case)
+
+    # Unchanged since the client's copy: skip serialization entirely
+    if if_none_match is not None and _etag_matches(if_none_match, case):
+        return Response(status_code=304, headers={"ETag": _etag(case)})
+
+    return RawJSONResponse(case_json(case), headers={"ETag": _etag(case)})
 
 
 @app.put("/cases/{case_id}", response_model=CaseRead)
-def update_case(
+async def update_case(
     case_id: int,
     payload: CaseCreate,
-    service: CaseService = Depends(get_case_service),
+    if_match: Optional[str] = Header(None),
+    service: AsyncCaseService = Depends(get_case_service),
 ):
     try:
-        case = service.update_case(
+        case = await service.update_case(
             case_id,
             title=payload.title,
             description=payload.description,
             status=payload.status.value,
+            expected_version=_expected_version(if_match),
         )
+    except VersionConflictError as e:
+        raise HTTPException(status_code=412, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
     if case is None:
         raise HTTPException(status_code=404, detail="Case not found")
 
-    return CaseRead.model_validate(case)
+    return RawJSONResponse(case_json(case), headers={"ETag": _etag(case)})
 
 
 @app.delete("/cases/{case_id}", status_code=204)
-def delete_case(
+async def delete_case(
     case_id: int,
-    service: CaseService = Depends(get_case_service),
+    service: AsyncCaseService = Depends(get_case_service),
 ):
-    deleted = service.delete_case(case_id)
+    try:
+        deleted = await service.delete_case(case_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
     if not deleted:
         raise HTTPException(status_code=404, detail="Case not found")
 
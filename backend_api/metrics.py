@@ -0,0 +1,392 @@
+# backend_api\metrics.py
+"""
+Prometheus-style metrics without external dependencies.
+
+Purpose: show where request time goes, layer by layer
+- `MetricsRegistry` holds counters, histograms and callback gauges and
+  renders them in the Prometheus text exposition format (GET /metrics)
+- `MetricsMiddleware` times every HTTP request per route template
+- `register_pool_metrics` / `register_cache_metrics` /
+  `register_response_cache_metrics` / `register_slow_query_metrics`
+  expose the connection pool, caches and slow-query counters at scrape
+  time
+Repository and service timings are recorded by the thin decorators in
+repositories/instrumented.py and services/instrumented.py.
+
+Rule: metrics are optional. With no registry, nothing is wrapped and the
+middleware passes requests straight through.
+"""
+
+import math
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from backend_api.db import ConnectionPool
+from backend_api.replica import SnapshotReplica
+from backend_api.repositories.caching import CachingCaseRepository
+from backend_api.response_cache import ResponseCache
+from backend_api.slow_query_log import SlowQueryLog
+
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds; suits both sub-millisecond lookups and slow exports
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(str(value))}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _check(self, values: LabelValues) -> LabelValues:
+        if len(values) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}")
+        return tuple(str(value) for value in values)
+
+    def samples(self) -> Iterable[Tuple[str, str, float]]:
+        """Yield (sample name, formatted labels, value)."""
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        for name, labels, value in self.samples():
+            lines.append(f"{name}{labels} {_format_value(value)}")
+        return lines
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, help, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        key = self._check(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, *labels: str) -> float:
+        with self._lock:
+            return self._values.get(self._check(labels), 0.0)
+
+    def samples(self) -> Iterable[Tuple[str, str, float]]:
+        with self._lock:
+            values = sorted(self._values.items())
+        for key, value in values:
+            yield self.name, _format_labels(self.labelnames, key), value
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, help, labelnames)
+        self._buckets = tuple(sorted(buckets))
+        # labels -> ([count per bucket, non-cumulative], sum, count)
+        self._series: Dict[LabelValues, List] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        key = self._check(labels)
+        # First bucket whose upper bound holds the value; len() is +Inf
+        index = next(
+            (i for i, bound in enumerate(self._buckets) if value <= bound),
+            len(self._buckets),
+        )
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * (len(self._buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def count(self, *labels: str) -> int:
+        with self._lock:
+            series = self._series.get(self._check(labels))
+            return series[2] if series else 0
+
+    def samples(self) -> Iterable[Tuple[str, str, float]]:
+        with self._lock:
+            snapshot = sorted(
+                (key, (list(series[0]), series[1], series[2]))
+                for key, series in self._series.items()
+            )
+        bounds = self._buckets + (math.inf,)
+        for key, (buckets, total, count) in snapshot:
+            cumulative = 0
+            for bound, observed in zip(bounds, buckets):
+                cumulative += observed
+                labels = _format_labels(
+                    self.labelnames + ("le",), key + (_format_value(bound),)
+                )
+                yield f"{self.name}_bucket", labels, cumulative
+            labels = _format_labels(self.labelnames, key)
+            yield f"{self.name}_sum", labels, total
+            yield f"{self.name}_count", labels, count
+
+
+class CallbackGauge(_Metric):
+    """Gauge (or counter) whose values are read from a callback at scrape time."""
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        callback: Callable[[], Dict[LabelValues, float]],
+        labelnames: Sequence[str] = (),
+        kind: str = "gauge",
+    ):
+        super().__init__(name, help, labelnames)
+        self.kind = kind
+        self._callback = callback
+
+    def samples(self) -> Iterable[Tuple[str, str, float]]:
+        for key, value in sorted(self._callback().items()):
+            yield self.name, _format_labels(self.labelnames, key), value
+
+
+class MetricsRegistry:
+    """
+    The application's metrics; one instance per app, owned by the lifespan.
+
+    Metrics are created once by name; asking again returns the same one,
+    so several decorators can share a metric.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, _Metric] = {}
+
+    def _get_or_create(self, name: str, factory: Callable[[], _Metric]) -> _Metric:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = factory()
+            return metric
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._get_or_create(name, lambda: Counter(name, help, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._get_or_create(
+            name, lambda: Histogram(name, help, labelnames, buckets)
+        )
+
+    def callback(
+        self,
+        name: str,
+        help: str,
+        callback: Callable[[], Dict[LabelValues, float]],
+        labelnames: Sequence[str] = (),
+        kind: str = "gauge",
+    ) -> CallbackGauge:
+        # Replaces an earlier callback, e.g. after the pool was recreated
+        metric = CallbackGauge(name, help, callback, labelnames, kind)
+        with self._lock:
+            self._metrics[name] = metric
+        return metric
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+def register_pool_metrics(
+    registry: MetricsRegistry,
+    pools: Dict[str, Union[ConnectionPool, SnapshotReplica]],
+) -> None:
+    """Expose each pool's stats, labelled by its name (e.g. "write", "read")."""
+
+    def connections() -> Dict[LabelValues, float]:
+        values: Dict[LabelValues, float] = {}
+        for pool_name, pool in pools.items():
+            stats = pool.stats()
+            values[(pool_name, "open")] = stats.open
+            values[(pool_name, "idle")] = stats.idle
+            values[(pool_name, "in_use")] = stats.in_use
+        return values
+
+    registry.callback(
+        "case_db_pool_connections",
+        "SQLite connections held by the pool, by state.",
+        connections,
+        labelnames=("pool", "state"),
+    )
+    for name, field, help in (
+        ("case_db_pool_created_total", "created", "Connections opened by the pool."),
+        ("case_db_pool_recycled_total", "recycled", "Connections closed for age or a failed health check."),
+        ("case_db_pool_checkouts_total", "checkouts", "Connections handed out by the pool."),
+        ("case_db_pool_waits_total", "waits", "Checkouts that had to wait for a free connection."),
+        ("case_db_pool_timeouts_total", "timeouts", "Checkouts that gave up waiting."),
+        ("case_db_pool_wait_seconds_total", "wait_time", "Seconds spent waiting for a connection."),
+    ):
+        registry.callback(
+            name,
+            help,
+            lambda field=field: {
+                (pool_name,): getattr(pool.stats(), field)
+                for pool_name, pool in pools.items()
+            },
+            labelnames=("pool",),
+            kind="counter",
+        )
+
+
+def register_slow_query_metrics(registry: MetricsRegistry, log: SlowQueryLog) -> None:
+    registry.callback(
+        "case_db_slow_queries_total",
+        "Statements slower than the slow-query threshold.",
+        lambda: {(): log.recorded},
+        kind="counter",
+    )
+
+
+def register_cache_metrics(registry: MetricsRegistry, cache: CachingCaseRepository) -> None:
+    def events() -> Dict[LabelValues, float]:
+        stats = cache.stats()
+        return {
+            ("hit",): stats.hits,
+            ("miss",): stats.misses,
+            ("eviction",): stats.evictions,
+            ("expiration",): stats.expirations,
+            ("invalidation",): stats.invalidations,
+        }
+
+    registry.callback(
+        "case_cache_events_total",
+        "Case cache lookups and removals, by event.",
+        events,
+        labelnames=("event",),
+        kind="counter",
+    )
+    registry.callback(
+        "case_cache_entries",
+        "Cases currently held by the cache.",
+        lambda: {(): cache.stats().size},
+    )
+
+
+def register_response_cache_metrics(registry: MetricsRegistry, cache: ResponseCache) -> None:
+    def events() -> Dict[LabelValues, float]:
+        stats = cache.stats()
+        return {
+            ("hit",): stats.hits,
+            ("miss",): stats.misses,
+            ("not_modified",): stats.not_modified,
+        }
+
+    registry.callback(
+        "http_response_cache_events_total",
+        "Response cache lookups and 304 answers, by event.",
+        events,
+        labelnames=("event",),
+        kind="counter",
+    )
+    registry.callback(
+        "http_response_cache_entries",
+        "Encoded responses currently held by the response cache.",
+        lambda: {(): cache.stats().size},
+    )
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording latency and status per route template.
+
+    The registry is looked up on `app.state.metrics` per request; when it
+    is None the request is passed through untouched.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        registry: Optional[MetricsRegistry] = None
+        if scope["type"] == "http":
+            registry = getattr(scope["app"].state, "metrics", None)
+        if registry is None:
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        started = time.perf_counter()
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        except Exception:
+            registry.counter(
+                "http_request_exceptions_total",
+                "Requests that raised an unhandled exception.",
+                ("method", "route"),
+            ).inc(scope["method"], _route(scope))
+            raise
+        finally:
+            # Includes streaming the body, so exports are timed in full
+            route = _route(scope)
+            registry.histogram(
+                "http_request_duration_seconds",
+                "HTTP request latency per route template.",
+                ("method", "route"),
+            ).observe(time.perf_counter() - started, scope["method"], route)
+            registry.counter(
+                "http_requests_total",
+                "HTTP requests per route template and status code.",
+                ("method", "route", "status"),
+            ).inc(scope["method"], route, str(status))
+
+
+def _route(scope) -> str:
+    # Route templates keep the label set small (/cases/{case_id}, not /cases/17)
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
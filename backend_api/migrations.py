@@ -0,0 +1,299 @@
+# backend_api\migrations.py
+"""
+Versioned schema migrations for the SQLite backend.
+
+Purpose: create and evolve the database schema once, at startup
+Rule: no FastAPI imports, never called from the request path
+- Each migration has a unique, increasing version number
+- Applied versions are recorded in the `schema_version` table
+- Pending migrations run in order, each in its own transaction
+"""
+
+import sqlite3
+from typing import List, NamedTuple
+
+
+class Migration(NamedTuple):
+    version: int
+    description: str
+    sql: str
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(
+        1,
+        "create cases table",
+        """
+        CREATE TABLE IF NOT EXISTS cases (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT NOT NULL,
+            description TEXT NOT NULL,
+            status TEXT NOT NULL
+        );
+        """,
+    ),
+    Migration(
+        2,
+        "index cases by status for filtered keyset pagination",
+        """
+        CREATE INDEX IF NOT EXISTS idx_cases_status_id ON cases (status, id);
+        """,
+    ),
+    Migration(
+        3,
+        "add version column for optimistic concurrency",
+        """
+        ALTER TABLE cases ADD COLUMN version INTEGER NOT NULL DEFAULT 1;
+        """,
+    ),
+    Migration(
+        4,
+        "full-text index over title and description",
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS cases_fts USING fts5(
+            title,
+            description,
+            content='cases',
+            content_rowid='id'
+        );
+
+        CREATE TRIGGER IF NOT EXISTS cases_fts_after_insert
+        AFTER INSERT ON cases
+        BEGIN
+            INSERT INTO cases_fts (rowid, title, description)
+            VALUES (new.id, new.title, new.description);
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS cases_fts_after_delete
+        AFTER DELETE ON cases
+        BEGIN
+            INSERT INTO cases_fts (cases_fts, rowid, title, description)
+            VALUES ('delete', old.id, old.title, old.description);
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS cases_fts_after_update
+        AFTER UPDATE OF title, description ON cases
+        BEGIN
+            INSERT INTO cases_fts (cases_fts, rowid, title, description)
+            VALUES ('delete', old.id, old.title, old.description);
+            INSERT INTO cases_fts (rowid, title, description)
+            VALUES (new.id, new.title, new.description);
+        END;
+
+        -- Index the rows that existed before this migration
+        INSERT INTO cases_fts (cases_fts) VALUES ('rebuild');
+        """,
+    ),
+    Migration(
+        5,
+        "case counts per status maintained by triggers",
+        """
+        CREATE TABLE IF NOT EXISTS case_stats (
+            status TEXT PRIMARY KEY,
+            count INTEGER NOT NULL
+        ) WITHOUT ROWID;
+
+        CREATE TRIGGER IF NOT EXISTS case_stats_after_insert
+        AFTER INSERT ON cases
+        BEGIN
+            INSERT INTO case_stats (status, count) VALUES (new.status, 1)
+            ON CONFLICT (status) DO UPDATE SET count = count + 1;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS case_stats_after_delete
+        AFTER DELETE ON cases
+        BEGIN
+            UPDATE case_stats SET count = count - 1 WHERE status = old.status;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS case_stats_after_update
+        AFTER UPDATE OF status ON cases
+        WHEN old.status IS NOT new.status
+        BEGIN
+            UPDATE case_stats SET count = count - 1 WHERE status = old.status;
+            INSERT INTO case_stats (status, count) VALUES (new.status, 1)
+            ON CONFLICT (status) DO UPDATE SET count = count + 1;
+        END;
+
+        -- Count the rows that existed before this migration
+        DELETE FROM case_stats;
+        INSERT INTO case_stats (status, count)
+        SELECT status, COUNT(*) FROM cases GROUP BY status;
+        """,
+    ),
+    Migration(
+        6,
+        "append-only change log written by triggers",
+        """
+        -- AUTOINCREMENT: sequence numbers are never reused, so a consumer's
+        -- cursor stays valid even if old entries are pruned
+        CREATE TABLE IF NOT EXISTS case_changes (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            case_id INTEGER NOT NULL,
+            operation TEXT NOT NULL,
+            changed_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            -- The case after the change; NULL for deletes
+            title TEXT,
+            description TEXT,
+            status TEXT,
+            version INTEGER
+        );
+
+        CREATE TRIGGER IF NOT EXISTS case_changes_after_insert
+        AFTER INSERT ON cases
+        BEGIN
+            INSERT INTO case_changes (case_id, operation, title, description, status, version)
+            VALUES (new.id, 'create', new.title, new.description, new.status, new.version);
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS case_changes_after_update
+        AFTER UPDATE ON cases
+        BEGIN
+            INSERT INTO case_changes (case_id, operation, title, description, status, version)
+            VALUES (new.id, 'update', new.title, new.description, new.status, new.version);
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS case_changes_after_delete
+        AFTER DELETE ON cases
+        BEGIN
+            INSERT INTO case_changes (case_id, operation) VALUES (old.id, 'delete');
+        END;
+        """,
+    ),
+    Migration(
+        7,
+        "row versions and tombstones for delta sync",
+        """
+        -- One clock for the whole table: every insert, update and delete
+        -- takes the next value, so "changed since N" is a range scan
+        CREATE TABLE IF NOT EXISTS case_clock (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            value INTEGER NOT NULL
+        );
+        INSERT OR IGNORE INTO case_clock (id, value) VALUES (1, 0);
+
+        ALTER TABLE cases ADD COLUMN row_version INTEGER NOT NULL DEFAULT 0;
+        CREATE INDEX IF NOT EXISTS idx_cases_row_version ON cases (row_version);
+
+        CREATE TABLE IF NOT EXISTS case_tombstones (
+            case_id INTEGER PRIMARY KEY,
+            row_version INTEGER NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_case_tombstones_row_version
+        ON case_tombstones (row_version);
+
+        -- Setting row_version must not count as a change itself, so the
+        -- change log only fires for the case columns from now on
+        DROP TRIGGER IF EXISTS case_changes_after_update;
+        CREATE TRIGGER case_changes_after_update
+        AFTER UPDATE OF title, description, status, version ON cases
+        BEGIN
+            INSERT INTO case_changes (case_id, operation, title, description, status, version)
+            VALUES (new.id, 'update', new.title, new.description, new.status, new.version);
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS case_row_version_after_insert
+        AFTER INSERT ON cases
+        BEGIN
+            UPDATE case_clock SET value = value + 1 WHERE id = 1;
+            UPDATE cases SET row_version = (SELECT value FROM case_clock WHERE id = 1)
+            WHERE id = new.id;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS case_row_version_after_update
+        AFTER UPDATE OF title, description, status, version ON cases
+        BEGIN
+            UPDATE case_clock SET value = value + 1 WHERE id = 1;
+            UPDATE cases SET row_version = (SELECT value FROM case_clock WHERE id = 1)
+            WHERE id = new.id;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS case_row_version_after_delete
+        AFTER DELETE ON cases
+        BEGIN
+            UPDATE case_clock SET value = value + 1 WHERE id = 1;
+            INSERT INTO case_tombstones (case_id, row_version)
+            VALUES (old.id, (SELECT value FROM case_clock WHERE id = 1))
+            ON CONFLICT (case_id) DO UPDATE SET row_version = excluded.row_version;
+        END;
+
+        -- Existing rows get versions in ID order
+        UPDATE cases SET row_version = id;
+        UPDATE case_clock SET value = (SELECT COALESCE(MAX(id), 0) FROM cases)
+        WHERE id = 1;
+        """,
+    ),
+]
+
+
+def current_version(conn: sqlite3.Connection) -> int:
+    """Return the highest applied migration version, or 0."""
+    row = conn.execute("SELECT MAX(version) FROM schema_version").fetchone()
+    return row[0] or 0
+
+
+def run_migrations(
+    conn: sqlite3.Connection,
+    migrations: List[Migration] = MIGRATIONS,
+) -> int:
+    """
+    Apply all pending migrations and return the resulting schema version.
+    """
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS schema_version (
+            version INTEGER PRIMARY KEY,
+            description TEXT NOT NULL,
+            applied_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+        )
+        """
+    )
+    conn.commit()
+
+    applied = current_version(conn)
+
+    for migration in sorted(migrations, key=lambda m: m.version):
+        if migration.version <= applied:
+            continue
+
+        # executescript() would commit on its own, so statements are run
+        # one by one inside an explicit transaction instead
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Another process may have migrated while we waited for the lock
+            if migration.version <= current_version(conn):
+                conn.rollback()
+                continue
+
+            for statement in _split_statements(migration.sql):
+                conn.execute(statement)
+            conn.execute(
+                "INSERT INTO schema_version (version, description) VALUES (?, ?)",
+                (migration.version, migration.description),
+            )
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+        applied = migration.version
+
+    return applied
+
+
+def _split_statements(script: str) -> List[str]:
+    """Split a script into complete SQL statements (trigger bodies included)."""
+    statements = []
+    buffer = ""
+
+    for chunk in script.split(";"):
+        buffer += chunk + ";"
+        if sqlite3.complete_statement(buffer):
+            if buffer.strip(" \n\t;"):
+                statements.append(buffer.strip())
+            buffer = ""
+
+    if buffer.strip(" \n\t;"):
+        statements.append(buffer.strip())
+
+    return statements
@@ -6,9 +6,74 @@ Viktigt: Den här modellen representerar logiken, inte
 vailidering.
 """
 
+from dataclasses import dataclass
+from enum import Enum
+from typing import List, Optional
+
+
+class MutationOutcome(str, Enum):
+    """What happened to one case in a conditional write."""
+
+    applied = "applied"
+    not_found = "not_found"
+    closed = "closed"
+    conflict = "conflict"
+
+
+# slots=True: inga __dict__ per ärende, vilket sparar minne när
+# miljontals ärenden hålls i minnet. Fältordningen matchar kolumnordningen
+# i SQLiteCaseRepository, som bygger ärenden positionellt: Case(*row).
+@dataclass(slots=True)
 class Case:
-    def __init__(self, id: int, title: str, description: str, status: str):
-        self.id = id
-        self.title = title
-        self.description = description
-        self.status = status
+    id: int
+    title: str
+    description: str
+    status: str
+    # Ökas vid varje ändring; används för optimistisk låsning (ETag)
+    version: int = 1
+
+
+class ChangeOperation(str, Enum):
+    """What a change-log entry records."""
+
+    create = "create"
+    update = "update"
+    delete = "delete"
+
+
+@dataclass(slots=True)
+class CaseChange:
+    """En post i ändringsloggen: vad som hände med ett ärende och när."""
+
+    # Löpnummer, stigande i commit-ordning; används som markör (since=)
+    seq: int
+    case_id: int
+    operation: ChangeOperation
+    # UTC, "YYYY-MM-DD HH:MM:SS"
+    changed_at: str
+    # Ärendet som det såg ut efter ändringen; None när det togs bort
+    case: Optional[Case]
+
+
+@dataclass(slots=True)
+class CaseDelta:
+    """Det som ändrats sedan en radversion: ändrade ärenden och borttagna ID:n."""
+
+    # Ärenden som skapats eller ändrats, i ändringsordning
+    cases: List[Case]
+    # ID:n för ärenden som tagits bort (tombstones)
+    deleted: List[int]
+    # Skickas som modified_since i nästa anrop
+    cursor: int
+    # True när limit nåddes och fler ändringar väntar
+    has_more: bool
+
+
+@dataclass(slots=True)
+class SearchHit:
+    """En träff i fritextsökningen: ärendet, relevans och utdrag."""
+
+    case: Case
+    # Högre är bättre
+    score: float
+    snippet: str
@@ -0,0 +1,177 @@
+# backend_api\replica.py
+"""
+Snapshot read replica for SQLite.
+
+Purpose: serve reads from a copy of the database that the writers never touch
+- `SnapshotReplica` copies the primary with SQLite's online backup API
+  into a private file and serves reads from a read-only pool on that copy
+- A background thread refreshes the copy every `refresh_interval`
+  seconds; the new copy is swapped in atomically and the old one is
+  closed once its last connection is returned
+- Reads see the primary as of the last refresh, so they may lag by up to
+  one interval; requests that must see their own writes read the primary
+  instead (see db.read_your_writes)
+
+`replica.connection` has the same shape as `ConnectionPool.connection`, so
+it can be passed to SQLiteCaseRepository as its read connection factory.
+"""
+
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from backend_api.db import ConnectionPool, PoolStats, PragmaProfile
+from backend_api.slow_query_log import SlowQueryLog
+
+
+class SnapshotReplica:
+    def __init__(
+        self,
+        database: str,
+        refresh_interval: Optional[float] = 5.0,
+        size: int = 5,
+        pragmas: Optional[PragmaProfile] = None,
+        slow_query_log: Optional[SlowQueryLog] = None,
+    ):
+        if database == ":memory:":
+            raise ValueError("An in-memory database cannot be replicated")
+
+        self._database = database
+        self._refresh_interval = refresh_interval
+        self._size = size
+        self._pragmas = pragmas
+        self._slow_query_log = slow_query_log
+
+        self._directory = tempfile.mkdtemp(prefix="cases-replica-")
+        self._lock = threading.Lock()
+        self._pool: Optional[ConnectionPool] = None
+        self._path: Optional[str] = None
+        self._generation = 0
+        self._refreshed_at = 0.0
+        self._refreshes = 0
+        self._closed = False
+        self._stop = threading.Event()
+
+        self.refresh()
+
+        self._thread: Optional[threading.Thread] = None
+        if refresh_interval is not None:
+            self._thread = threading.Thread(
+                target=self._run,
+                name="case-replica-refresh",
+                daemon=True,
+            )
+            self._thread.start()
+
+    @property
+    def database(self) -> str:
+        return self._database
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def refreshed_at(self) -> float:
+        """time.time() of the copy currently served."""
+        with self._lock:
+            return self._refreshed_at
+
+    @property
+    def refreshes(self) -> int:
+        with self._lock:
+            return self._refreshes
+
+    def refresh(self) -> None:
+        """Copy the primary now and serve reads from the new copy."""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Replica is closed")
+            self._generation += 1
+            path = os.path.join(self._directory, f"snapshot-{self._generation}.db")
+
+        copied_at = time.time()
+        source = sqlite3.connect(self._database)
+        target = sqlite3.connect(path)
+        try:
+            # One step: the whole copy is taken under a single read transaction
+            source.backup(target)
+            # The copy inherits the primary's WAL mode; a read-only
+            # connection cannot open a WAL file that has no -shm yet
+            target.execute("PRAGMA journal_mode = DELETE")
+        finally:
+            target.close()
+            source.close()
+
+        pool = ConnectionPool(
+            path,
+            size=self._size,
+            pragmas=self._pragmas,
+            slow_query_log=self._slow_query_log,
+            read_only=True,
+        )
+
+        with self._lock:
+            if self._closed:
+                pool.close()
+                _remove(path)
+                raise RuntimeError("Replica is closed")
+            old_pool, old_path = self._pool, self._path
+            self._pool, self._path = pool, path
+            self._refreshed_at = copied_at
+            self._refreshes += 1
+
+        if old_pool is not None:
+            # Checked-out connections are closed when they are returned
+            old_pool.close()
+            _remove(old_path)
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Replica is closed")
+            pool = self._pool
+        with pool.connection() as conn:
+            yield conn
+
+    def stats(self) -> PoolStats:
+        with self._lock:
+            pool = self._pool
+        return pool.stats()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            pool = self._pool
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        pool.close()
+        shutil.rmtree(self._directory, ignore_errors=True)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._refresh_interval):
+            try:
+                self.refresh()
+            except RuntimeError:
+                return
+            except sqlite3.Error:
+                # Keep serving the last good copy; try again next interval
+                continue
+
+
+def _remove(path: str) -> None:
+    # On Windows the file stays locked until its last connection closes;
+    # close() removes the whole directory in the end
+    try:
+        os.remove(path)
+    except OSError:
+        pass
@@ -0,0 +1,245 @@
+# backend_api\repositories\caching.py
+"""
+Read-through cache for any CaseRepository.
+
+Purpose: serve hot `get_by_id` lookups from process memory
+- LRU bounded by `max_size`, entries expire after `ttl` seconds
+- Every write through this repository invalidates the affected IDs
+- Optionally remembers "not found" answers (negative caching)
+
+Note: writes made by other processes are only seen once entries expire,
+so `ttl` bounds staleness when several workers share a database. The
+same holds for a lagging read replica, so the TTL should not exceed its
+refresh interval. Requests that read from the primary (read-your-writes)
+bypass the cache entirely.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from backend_api.db import reads_from_primary
+from backend_api.models import Case, CaseChange, CaseDelta, MutationOutcome, SearchHit
+from backend_api.repository_contract import CaseRepository
+
+
+# Stored for IDs known not to exist (only when negative caching is on)
+_MISSING = object()
+
+
+@dataclass
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    invalidations: int
+    size: int
+    max_size: int
+
+
+class CachingCaseRepository(CaseRepository):
+    def __init__(
+        self,
+        repository: CaseRepository,
+        max_size: int = 10_000,
+        ttl: float = 30.0,
+        cache_not_found: bool = False,
+        not_found_ttl: Optional[float] = None,
+    ):
+        if max_size < 1:
+            raise ValueError("Cache size must be at least 1")
+
+        self._repository = repository
+        self._max_size = max_size
+        self._ttl = ttl
+        self._cache_not_found = cache_not_found
+        self._not_found_ttl = ttl if not_found_ttl is None else not_found_ttl
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[int, Tuple[float, object]]" = OrderedDict()
+        # Bumped on every invalidation; a load that raced with a write is
+        # not stored, so the cache never resurrects a stale case.
+        self._generation = 0
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+
+    @property
+    def inner(self) -> CaseRepository:
+        return self._repository
+
+    def close(self) -> None:
+        self._repository.close()
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                invalidations=self._invalidations,
+                size=len(self._entries),
+                max_size=self._max_size,
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def _invalidate(self, case_ids: Iterable[int]) -> None:
+        with self._lock:
+            self._generation += 1
+            for case_id in case_ids:
+                if self._entries.pop(case_id, None) is not None:
+                    self._invalidations += 1
+
+    def _store(self, case_id: int, value: object, generation: int) -> None:
+        ttl = self._not_found_ttl if value is _MISSING else self._ttl
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries[case_id] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(case_id)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def get_by_id(self, case_id: int) -> Optional[Case]:
+        if reads_from_primary():
+            # The caller must see its own writes: neither serve a cached
+            # case nor cache this read, which takes a different route
+            return self._repository.get_by_id(case_id)
+
+        with self._lock:
+            entry = self._entries.get(case_id)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > time.monotonic():
+                    self._entries.move_to_end(case_id)
+                    self._hits += 1
+                    return None if value is _MISSING else value
+                del self._entries[case_id]
+                self._expirations += 1
+            self._misses += 1
+            generation = self._generation
+
+        case = self._repository.get_by_id(case_id)
+
+        if case is not None:
+            self._store(case_id, case, generation)
+        elif self._cache_not_found:
+            self._store(case_id, _MISSING, generation)
+        return case
+
+    # Reads that are not keyed by ID go straight to the backend
+
+    def get_all(self) -> List[Case]:
+        return self._repository.get_all()
+
+    def iter_all(self, batch_size: int = 500) -> Iterator[Case]:
+        return self._repository.iter_all(batch_size=batch_size)
+
+    def count(self) -> int:
+        return self._repository.count()
+
+    def count_by_status(self) -> Dict[str, int]:
+        return self._repository.count_by_status()
+
+    def get_page(
+        self,
+        limit: int,
+        after: Optional[int] = None,
+        status: Optional[str] = None,
+    ) -> List[Case]:
+        return self._repository.get_page(limit, after=after, status=status)
+
+    def search(self, query: str, limit: int, offset: int = 0) -> List[SearchHit]:
+        return self._repository.search(query, limit, offset=offset)
+
+    def get_changes(self, after: int, limit: int) -> List[CaseChange]:
+        return self._repository.get_changes(after, limit)
+
+    def last_change(self) -> int:
+        return self._repository.last_change()
+
+    def get_modified_since(self, row_version: int, limit: int) -> CaseDelta:
+        return self._repository.get_modified_since(row_version, limit)
+
+    # Writes invalidate the IDs they touch
+
+    def create(self, title: str, description: str, status: str) -> Case:
+        case = self._repository.create(title, description, status)
+        self._invalidate([case.id])
+        return case
+
+    def update(
+        self,
+        case_id: int,
+        title: str,
+        description: str,
+        status: str,
+    ) -> Optional[Case]:
+        try:
+            return self._repository.update(case_id, title, description, status)
+        finally:
+            self._invalidate([case_id])
+
+    def delete(self, case_id: int) -> bool:
+        try:
+            return self._repository.delete(case_id)
+        finally:
+            self._invalidate([case_id])
+
+    def update_unless_closed(
+        self,
+        case_id: int,
+        title: str,
+        description: str,
+        status: str,
+        expected_version: Optional[int] = None,
+    ) -> Tuple[MutationOutcome, Optional[Case]]:
+        try:
+            return self._repository.update_unless_closed(
+                case_id,
+                title,
+                description,
+                status,
+                expected_version=expected_version,
+            )
+        finally:
+            self._invalidate([case_id])
+
+    def delete_unless_closed(self, case_id: int) -> MutationOutcome:
+        try:
+            return self._repository.delete_unless_closed(case_id)
+        finally:
+            self._invalidate([case_id])
+
+    def create_many(self, items: Sequence[Tuple[str, str, str]]) -> List[Case]:
+        cases = self._repository.create_many(items)
+        self._invalidate(case.id for case in cases)
+        return cases
+
+    def update_status_many(
+        self,
+        case_ids: Sequence[int],
+        status: str,
+    ) -> Dict[int, MutationOutcome]:
+        try:
+            return self._repository.update_status_many(case_ids, status)
+        finally:
+            self._invalidate(case_ids)
+
+    def delete_many(self, case_ids: Sequence[int]) -> Dict[int, MutationOutcome]:
+        try:
+            return self._repository.delete_many(case_ids)
+        finally:
+            self._invalidate(case_ids)
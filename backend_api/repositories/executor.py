@@ -0,0 +1,171 @@
+# backend_api\repositories\executor.py
+"""
+Async adapter that runs any CaseRepository on dedicated executors.
+
+Purpose: keep blocking storage calls off the event loop
+- Reads run on a pool of `readers` threads
+- Writes run on ONE writer thread, so writes from this process are
+  serialized before they reach the database. This matches SQLite's
+  single-writer / many-readers locking and avoids SQLITE_BUSY between
+  our own writers.
+  A repository that serializes writes itself (GroupCommitCaseRepository)
+  can be given several `writers`, so concurrent writes reach it together
+  and share a commit.
+- Neither executor is FastAPI's shared threadpool, so slow storage
+  cannot starve the rest of the application
+
+Wrapping SQLiteCaseRepository gives the async SQLite backend; wrapping
+InMemoryCaseRepository (or a cached repository) works the same way.
+"""
+
+import asyncio
+import contextvars
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import AsyncIterator, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
+
+from backend_api.models import Case, CaseChange, CaseDelta, MutationOutcome, SearchHit
+from backend_api.repository_contract import AsyncCaseRepository, CaseRepository
+
+
+T = TypeVar("T")
+
+
+class ExecutorCaseRepository(AsyncCaseRepository):
+    def __init__(self, repository: CaseRepository, readers: int = 4, writers: int = 1):
+        if readers < 1:
+            raise ValueError("At least one reader thread is required")
+        if writers < 1:
+            raise ValueError("At least one writer thread is required")
+
+        self._repository = repository
+        self._readers = ThreadPoolExecutor(
+            max_workers=readers,
+            thread_name_prefix="case-reader",
+        )
+        self._writer = ThreadPoolExecutor(
+            max_workers=writers,
+            thread_name_prefix="case-writer",
+        )
+
+    @property
+    def inner(self) -> CaseRepository:
+        return self._repository
+
+    async def _run(self, executor: ThreadPoolExecutor, fn: Callable[..., T], *args, **kwargs) -> T:
+        # Context variables (e.g. per-request settings) follow the call
+        # into the worker thread, as they do with FastAPI's threadpool
+        context = contextvars.copy_context()
+        call = functools.partial(context.run, fn, *args, **kwargs)
+        return await asyncio.get_running_loop().run_in_executor(executor, call)
+
+    def _read(self, fn: Callable[..., T], *args, **kwargs):
+        return self._run(self._readers, fn, *args, **kwargs)
+
+    def _write(self, fn: Callable[..., T], *args, **kwargs):
+        return self._run(self._writer, fn, *args, **kwargs)
+
+    def close(self) -> None:
+        self._readers.shutdown(wait=True)
+        self._writer.shutdown(wait=True)
+        self._repository.close()
+
+    # Reads
+
+    async def get_all(self) -> List[Case]:
+        return await self._read(self._repository.get_all)
+
+    async def iter_all(self, batch_size: int = 500) -> AsyncIterator[Case]:
+        iterator = self._repository.iter_all(batch_size=batch_size)
+        try:
+            while True:
+                batch = await self._read(lambda: list(islice(iterator, batch_size)))
+                if not batch:
+                    break
+                for case in batch:
+                    yield case
+        finally:
+            # Release the underlying cursor/connection on a worker thread
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                await self._read(close)
+
+    async def count(self) -> int:
+        return await self._read(self._repository.count)
+
+    async def count_by_status(self) -> Dict[str, int]:
+        return await self._read(self._repository.count_by_status)
+
+    async def get_page(
+        self,
+        limit: int,
+        after: Optional[int] = None,
+        status: Optional[str] = None,
+    ) -> List[Case]:
+        return await self._read(self._repository.get_page, limit, after=after, status=status)
+
+    async def get_by_id(self, case_id: int) -> Optional[Case]:
+        return await self._read(self._repository.get_by_id, case_id)
+
+    async def search(self, query: str, limit: int, offset: int = 0) -> List[SearchHit]:
+        return await self._read(self._repository.search, query, limit, offset=offset)
+
+    async def get_changes(self, after: int, limit: int) -> List[CaseChange]:
+        return await self._read(self._repository.get_changes, after, limit)
+
+    async def last_change(self) -> int:
+        return await self._read(self._repository.last_change)
+
+    async def get_modified_since(self, row_version: int, limit: int) -> CaseDelta:
+        return await self._read(self._repository.get_modified_since, row_version, limit)
+
+    # Writes
+
+    async def create(self, title: str, description: str, status: str) -> Case:
+        return await self._write(self._repository.create, title, description, status)
+
+    async def update(
+        self,
+        case_id: int,
+        title: str,
+        description: str,
+        status: str,
+    ) -> Optional[Case]:
+        return await self._write(self._repository.update, case_id, title, description, status)
+
+    async def delete(self, case_id: int) -> bool:
+        return await self._write(self._repository.delete, case_id)
+
+    async def update_unless_closed(
+        self,
+        case_id: int,
+        title: str,
+        description: str,
+        status: str,
+        expected_version: Optional[int] = None,
+    ) -> Tuple[MutationOutcome, Optional[Case]]:
+        return await self._write(
+            self._repository.update_unless_closed,
+            case_id,
+            title,
+            description,
+            status,
+            expected_version=expected_version,
+        )
+
+    async def delete_unless_closed(self, case_id: int) -> MutationOutcome:
+        return await self._write(self._repository.delete_unless_closed, case_id)
+
+    async def create_many(self, items: Sequence[Tuple[str, str, str]]) -> List[Case]:
+        return await self._write(self._repository.create_many, items)
+
+    async def update_status_many(
+        self,
+        case_ids: Sequence[int],
+        status: str,
+    ) -> Dict[int, MutationOutcome]:
+        return await self._write(self._repository.update_status_many, case_ids, status)
+
+    async def delete_many(self, case_ids: Sequence[int]) -> Dict[int, MutationOutcome]:
+        return await self._write(self._repository.delete_many, case_ids)
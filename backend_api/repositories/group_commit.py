@@ -0,0 +1,339 @@
+# backend_api\repositories\group_commit.py
+"""
+Group-commit write batching for the SQLite backend.
+
+Purpose: raise write throughput when many requests write at once
+- Writes from any thread are queued to ONE writer thread
+- The writer runs a batch of queued writes in a single transaction and
+  commits once, when `max_batch` writes are collected or `max_delay`
+  seconds have passed since the first one
+- Every write runs in its own SAVEPOINT, so a failing write is rolled
+  back alone and the rest of its batch still commits
+- Callers block until the batch containing their write is committed, and
+  get their own result (new ID, outcome, ...) or exception
+Reads go straight to SQLite (to `read_connection_factory` when given) and
+never wait for the writer.
+
+Durability is unchanged: a write is reported only after the COMMIT that
+contains it, under whatever synchronous setting the connection uses.
+"""
+
+import queue
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import (
+    Callable,
+    ContextManager,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+from backend_api.models import Case, CaseChange, CaseDelta, MutationOutcome, SearchHit
+from backend_api.repository_contract import CaseRepository
+from backend_api.repositories.sqlite import SQLiteCaseRepository
+
+
+T = TypeVar("T")
+
+_SAVEPOINT = "case_write"
+
+
+@dataclass
+class GroupCommitStats:
+    batches: int
+    writes: int
+    failed_writes: int
+    failed_commits: int
+    largest_batch: int
+
+
+class _SavepointConnection:
+    """
+    The batch connection as SQLiteCaseRepository sees it during one write.
+
+    The writer owns the transaction, so the repository's own transaction
+    control is mapped onto the write's savepoint: BEGIN is a no-op,
+    commit() keeps the changes for the batch COMMIT, and rollback() undoes
+    only this write.
+    """
+
+    def __init__(self, conn: sqlite3.Connection):
+        self._conn = conn
+
+    def execute(self, sql: str, parameters=()):
+        if sql.lstrip()[:5].upper() == "BEGIN":
+            return self._conn.cursor()
+        return self._conn.execute(sql, parameters)
+
+    def commit(self) -> None:
+        pass
+
+    def rollback(self) -> None:
+        self._conn.execute(f"ROLLBACK TO SAVEPOINT {_SAVEPOINT}")
+
+    def __getattr__(self, name: str):
+        return getattr(self._conn, name)
+
+
+class _Write:
+    __slots__ = ("fn", "args", "kwargs", "future")
+
+    def __init__(self, fn: Callable, args: tuple, kwargs: dict):
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.future: Future = Future()
+
+
+# Queued by close() to stop the writer after the pending writes
+_STOP = object()
+
+
+class GroupCommitCaseRepository(CaseRepository):
+    def __init__(
+        self,
+        connection_factory: Callable[[], ContextManager[sqlite3.Connection]],
+        max_batch: int = 64,
+        max_delay: float = 0.001,
+        read_connection_factory: Optional[
+            Callable[[], ContextManager[sqlite3.Connection]]
+        ] = None,
+    ):
+        if max_batch < 1:
+            raise ValueError("Batch size must be at least 1")
+
+        self._connection_factory = connection_factory
+        self._max_batch = max_batch
+        self._max_delay = max_delay
+
+        self._reader = SQLiteCaseRepository(connection_factory, read_connection_factory)
+        # Same SQL as the reader, but on the writer's batch connection
+        self._batch_connection: Optional[_SavepointConnection] = None
+        self._writer = SQLiteCaseRepository(self._current_batch_connection)
+
+        self._queue: "queue.Queue[object]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._batches = 0
+        self._writes = 0
+        self._failed_writes = 0
+        self._failed_commits = 0
+        self._largest_batch = 0
+
+        self._thread = threading.Thread(
+            target=self._run,
+            name="case-group-commit",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stats(self) -> GroupCommitStats:
+        with self._lock:
+            return GroupCommitStats(
+                batches=self._batches,
+                writes=self._writes,
+                failed_writes=self._failed_writes,
+                failed_commits=self._failed_commits,
+                largest_batch=self._largest_batch,
+            )
+
+    def close(self) -> None:
+        """Commit the queued writes, then stop the writer thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join()
+
+    @contextmanager
+    def _current_batch_connection(self) -> Iterator[_SavepointConnection]:
+        # Only called on the writer thread, while a batch is open
+        yield self._batch_connection
+
+    def _submit(self, fn: Callable[..., T], *args, **kwargs) -> T:
+        write = _Write(fn, args, kwargs)
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Repository is closed")
+            self._queue.put(write)
+        return write.future.result()
+
+    # Writer thread
+
+    def _collect(self, first: _Write) -> Tuple[List[_Write], bool]:
+        """Gather a batch; the flag is True when close() was requested."""
+        batch = [first]
+        deadline = time.monotonic() + self._max_delay
+        while len(batch) < self._max_batch:
+            try:
+                remaining = deadline - time.monotonic()
+                item = self._queue.get(timeout=remaining) if remaining > 0 else (
+                    self._queue.get_nowait()
+                )
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+            batch, stopping = self._collect(item)
+            self._commit_batch(batch)
+
+        # Anything queued behind the stop request still gets written
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _STOP:
+                self._commit_batch([item])
+
+    def _commit_batch(self, batch: List[_Write]) -> None:
+        results: List[Tuple[_Write, object, Optional[BaseException]]] = []
+        failed = 0
+        try:
+            with self._connection_factory() as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                self._batch_connection = _SavepointConnection(conn)
+                try:
+                    for write in batch:
+                        conn.execute(f"SAVEPOINT {_SAVEPOINT}")
+                        try:
+                            result = write.fn(*write.args, **write.kwargs)
+                        except Exception as e:
+                            conn.execute(f"ROLLBACK TO SAVEPOINT {_SAVEPOINT}")
+                            conn.execute(f"RELEASE SAVEPOINT {_SAVEPOINT}")
+                            results.append((write, None, e))
+                            failed += 1
+                            continue
+                        conn.execute(f"RELEASE SAVEPOINT {_SAVEPOINT}")
+                        results.append((write, result, None))
+                    conn.commit()
+                except BaseException:
+                    conn.rollback()
+                    raise
+                finally:
+                    self._batch_connection = None
+        except Exception as e:
+            # Nothing in the batch was committed
+            with self._lock:
+                self._failed_commits += 1
+            for write in batch:
+                write.future.set_exception(e)
+            return
+
+        with self._lock:
+            self._batches += 1
+            self._writes += len(batch)
+            self._failed_writes += failed
+            self._largest_batch = max(self._largest_batch, len(batch))
+
+        for write, result, error in results:
+            if error is not None:
+                write.future.set_exception(error)
+            else:
+                write.future.set_result(result)
+
+    # Reads
+
+    def get_all(self) -> List[Case]:
+        return self._reader.get_all()
+
+    def iter_all(self, batch_size: int = 500) -> Iterator[Case]:
+        return self._reader.iter_all(batch_size=batch_size)
+
+    def count(self) -> int:
+        return self._reader.count()
+
+    def count_by_status(self) -> Dict[str, int]:
+        return self._reader.count_by_status()
+
+    def get_page(
+        self,
+        limit: int,
+        after: Optional[int] = None,
+        status: Optional[str] = None,
+    ) -> List[Case]:
+        return self._reader.get_page(limit, after=after, status=status)
+
+    def get_by_id(self, case_id: int) -> Optional[Case]:
+        return self._reader.get_by_id(case_id)
+
+    def search(self, query: str, limit: int, offset: int = 0) -> List[SearchHit]:
+        return self._reader.search(query, limit, offset=offset)
+
+    def get_changes(self, after: int, limit: int) -> List[CaseChange]:
+        return self._reader.get_changes(after, limit)
+
+    def last_change(self) -> int:
+        return self._reader.last_change()
+
+    def get_modified_since(self, row_version: int, limit: int) -> CaseDelta:
+        return self._reader.get_modified_since(row_version, limit)
+
+    # Writes
+
+    def create(self, title: str, description: str, status: str) -> Case:
+        return self._submit(self._writer.create, title, description, status)
+
+    def update(
+        self,
+        case_id: int,
+        title: str,
+        description: str,
+        status: str,
+    ) -> Optional[Case]:
+        return self._submit(self._writer.update, case_id, title, description, status)
+
+    def delete(self, case_id: int) -> bool:
+        return self._submit(self._writer.delete, case_id)
+
+    def update_unless_closed(
+        self,
+        case_id: int,
+        title: str,
+        description: str,
+        status: str,
+        expected_version: Optional[int] = None,
+    ) -> Tuple[MutationOutcome, Optional[Case]]:
+        return self._submit(
+            self._writer.update_unless_closed,
+            case_id,
+            title,
+            description,
+            status,
+            expected_version=expected_version,
+        )
+
+    def delete_unless_closed(self, case_id: int) -> MutationOutcome:
+        return self._submit(self._writer.delete_unless_closed, case_id)
+
+    def create_many(self, items: Sequence[Tuple[str, str, str]]) -> List[Case]:
+        return self._submit(self._writer.create_many, items)
+
+    def update_status_many(
+        self,
+        case_ids: Sequence[int],
+        status: str,
+    ) -> Dict[int, MutationOutcome]:
+        return self._submit(self._writer.update_status_many, case_ids, status)
+
+    def delete_many(self, case_ids: Sequence[int]) -> Dict[int, MutationOutcome]:
+        return self._submit(self._writer.delete_many, case_ids)
@@ -6,41 +6,393 @@ Used for:
 - Early development
 - Unit tests
 - Fast feedback without external dependencies
+- Load tests and ephemeral environments
+
+Layout:
+- `_cases`: cases keyed by ID, O(1) lookups
+- `_ids`: sorted list of IDs, for keyset pages via bisect
+- `_by_status`: sorted list of IDs per status, for filtered pages
+- `_text`: inverted index over title and description, for search
+- `_changes`: change log; the entry at index N has seq base + N + 1, so
+  reads slice it. Seqs double as row versions for delta sync.
+- `_row_versions`: every case ever written, ordered by row version (the
+  seq of its newest change), so a delta page is a bisect plus a slice
+All access goes through one re-entrant lock, so the repository can be
+shared by the FastAPI threadpool.
+
+Warm starts: with a `snapshot_path`, the repository starts from that
+snapshot file (see memory_snapshot.py) and writes itself back on close.
+Loading maps the file and copies only the ID arrays; each case is decoded
+the first time it is used, and the search index is built on the first
+search (and the row-version index on the first delta sync). The
+snapshot's compacted change log precedes `_changes` (seqs up
+to base), so cursors handed out before the restart stay valid.
 """
 
-from typing import List, Optional
-from backend_api.models import Case
+import os
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+from backend_api.models import (
+    Case,
+    CaseChange,
+    CaseDelta,
+    ChangeOperation,
+    MutationOutcome,
+    SearchHit,
+)
 from backend_api.repository_contract import CaseRepository
+from backend_api.repositories.memory_snapshot import LogEntry, SnapshotFile, write_snapshot
+from backend_api.repositories.text_search import InvertedIndex, make_snippet, tokenize
+
+
+def _insert_sorted(ids: List[int], case_id: int) -> None:
+    # New IDs are the largest so far, so this is usually an append
+    if not ids or ids[-1] < case_id:
+        ids.append(case_id)
+        return
+    position = bisect_left(ids, case_id)
+    if position == len(ids) or ids[position] != case_id:
+        ids.insert(position, case_id)
+
+
+def _remove_sorted(ids: List[int], case_id: int) -> None:
+    position = bisect_left(ids, case_id)
+    if position < len(ids) and ids[position] == case_id:
+        del ids[position]
+
+
+class _CaseTable:
+    """
+    Cases by ID. Rows of a snapshot are decoded into Case objects the
+    first time they are looked up and kept from then on, so edits apply
+    to the same live object as for any other case.
+    """
+
+    def __init__(self, snapshot: Optional[SnapshotFile] = None):
+        self._cases: Dict[int, Case] = {}
+        self._snapshot = snapshot
+        # Snapshot rows that were deleted since loading
+        self._removed: Set[int] = set()
+        self._size = len(snapshot) if snapshot is not None else 0
+
+    def get(self, case_id: int, keep: bool = True) -> Optional[Case]:
+        case = self._cases.get(case_id)
+        if case is None and self._snapshot is not None and case_id not in self._removed:
+            row = self._snapshot.find(case_id)
+            if row is not None:
+                case = self._snapshot.case(row)
+                if keep:
+                    self._cases[case_id] = case
+        return case
+
+    def __getitem__(self, case_id: int) -> Case:
+        case = self.get(case_id)
+        if case is None:
+            raise KeyError(case_id)
+        return case
+
+    def __setitem__(self, case_id: int, case: Case) -> None:
+        # Only new cases are added; their IDs are never in the snapshot
+        self._cases[case_id] = case
+        self._size += 1
+
+    def __delitem__(self, case_id: int) -> None:
+        if self._cases.pop(case_id, None) is None and self.get(case_id, keep=False) is None:
+            raise KeyError(case_id)
+        if self._snapshot is not None:
+            self._removed.add(case_id)
+        self._size -= 1
+
+    def __len__(self) -> int:
+        return self._size
+
+
+class _RowVersions:
+    """
+    Case IDs ordered by row version, deleted cases included.
+
+    A newer change appends the case again; the older entry stays in place
+    (stale) until stale entries outnumber live ones, and then the lists
+    are compacted. A page therefore skips at most as many stale entries
+    as it returns, amortized, instead of rescanning the log.
+    """
+
+    def __init__(self, entries: Iterable[Tuple[int, int]] = ()):
+        # Parallel lists: seqs ascending, and the case each seq belongs to
+        self._seqs: List[int] = []
+        self._case_ids: List[int] = []
+        # Case ID -> row version; an entry is live when its seq matches
+        self._latest: Dict[int, int] = {}
+        self._stale = 0
+        for seq, case_id in entries:
+            self.add(seq, case_id)
+
+    def add(self, seq: int, case_id: int) -> None:
+        if case_id in self._latest:
+            self._stale += 1
+        self._latest[case_id] = seq
+        self._seqs.append(seq)
+        self._case_ids.append(case_id)
+        if self._stale > len(self._latest):
+            self._compact()
+
+    def _compact(self) -> None:
+        latest = self._latest
+        live = [
+            (seq, case_id)
+            for seq, case_id in zip(self._seqs, self._case_ids)
+            if latest[case_id] == seq
+        ]
+        self._seqs = [seq for seq, _ in live]
+        self._case_ids = [case_id for _, case_id in live]
+        self._stale = 0
+
+    def page(self, after: int, limit: int) -> Tuple[List[Tuple[int, int]], bool]:
+        """Up to `limit` (seq, case ID) pairs after seq `after`, and has_more."""
+        seqs = self._seqs
+        case_ids = self._case_ids
+        latest = self._latest
+        page: List[Tuple[int, int]] = []
+        for i in range(bisect_right(seqs, after), len(seqs)):
+            seq, case_id = seqs[i], case_ids[i]
+            if latest[case_id] != seq:
+                continue
+            if len(page) == limit:
+                return page, True
+            page.append((seq, case_id))
+        return page, False
+
 
 class InMemoryCaseRepository(CaseRepository):
-    """Simple in-memory repository implementation."""
+    """Indexed, thread-safe in-memory repository implementation."""
 
-    def __init__(self):
-        self._cases: List[Case] = []
+    def __init__(self, snapshot_path: Optional[str] = None):
+        self._snapshot_path = snapshot_path
+        self._snapshot: Optional[SnapshotFile] = None
+        if snapshot_path is not None and os.path.exists(snapshot_path):
+            self._snapshot = SnapshotFile(snapshot_path)
+
+        self._cases = _CaseTable(self._snapshot)
+        self._ids: List[int] = []
+        self._by_status: Dict[str, List[int]] = {}
+        # None until the first search after loading a snapshot
+        self._text: Optional[InvertedIndex] = InvertedIndex()
+        self._changes: List[CaseChange] = []
+        # None until the first delta sync after loading a snapshot
+        self._row_versions: Optional[_RowVersions] = _RowVersions()
+        self._base_seq = 0
         self._next_id: int = 1
+        self._lock = threading.RLock()
 
-    def create(self, title: str, description: str, status: str) -> Case:
-        case = Case(
-            id=self._next_id,
-            title=title,
-            description=description,
-            status=status,
+        if self._snapshot is not None:
+            # list() of the mapped arrays runs in C; nothing is decoded
+            self._ids = list(self._snapshot.ids)
+            self._by_status = {
+                status: list(self._snapshot.ids_with_status(status))
+                for status in self._snapshot.statuses
+            }
+            self._text = None
+            self._row_versions = None
+            self._base_seq = self._snapshot.last_seq
+            self._next_id = self._snapshot.next_id
+
+    def close(self) -> None:
+        """With a `snapshot_path`, write the repository back to it."""
+        with self._lock:
+            if self._snapshot_path is None:
+                return
+            path, self._snapshot_path = self._snapshot_path, None
+            temporary = path + ".tmp"
+            self._write_snapshot(temporary)
+            # The old file must be unmapped before it can be replaced on Windows
+            if self._snapshot is not None:
+                self._snapshot.close()
+            os.replace(temporary, path)
+
+    def dump(self, path: str) -> None:
+        """Write every case and the compacted change log to a snapshot file."""
+        temporary = path + ".tmp"
+        with self._lock:
+            self._write_snapshot(temporary)
+        os.replace(temporary, path)
+
+    def _write_snapshot(self, path: str) -> None:
+        # Only the newest change per case is kept, in seq order
+        latest: Dict[int, LogEntry] = {}
+        for entry in self._log_entries(0):
+            latest.pop(entry[1], None)
+            latest[entry[1]] = entry
+        write_snapshot(
+            path,
+            # keep=False: rows that were never used are not kept decoded
+            (self._cases.get(case_id, keep=False) for case_id in self._ids),
+            list(latest.values()),
+            self._next_id,
         )
-        self._next_id += 1
-        self._cases.append(case)
-        return case
+
+    # Index maintenance; callers hold the lock
+
+    def _log_entries(self, after: int) -> Iterator[LogEntry]:
+        """The change log after seq `after`, snapshot part included."""
+        if self._snapshot is not None and after < self._base_seq:
+            yield from self._snapshot.log_entries(after)
+            after = self._base_seq
+        for change in self._changes[after - self._base_seq:]:
+            yield change.seq, change.case_id, change.operation, change.changed_at
+
+    def _text_index(self) -> InvertedIndex:
+        if self._text is None:
+            self._text = InvertedIndex()
+            for case_id in self._ids:
+                case = self._cases[case_id]
+                self._text.add(case.id, case.title, case.description)
+        return self._text
+
+    def _row_version_index(self) -> _RowVersions:
+        if self._row_versions is None:
+            self._row_versions = _RowVersions(
+                (seq, case_id) for seq, case_id, _, _ in self._log_entries(0)
+            )
+        return self._row_versions
+
+    def _log(self, operation: ChangeOperation, case: Case) -> None:
+        seq = self._base_seq + len(self._changes) + 1
+        if self._row_versions is not None:
+            self._row_versions.add(seq, case.id)
+        self._changes.append(
+            CaseChange(
+                seq=seq,
+                case_id=case.id,
+                operation=operation,
+                changed_at=time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime()),
+                # A copy: the live case keeps changing
+                case=(
+                    None
+                    if operation is ChangeOperation.delete
+                    else Case(case.id, case.title, case.description, case.status, case.version)
+                ),
+            )
+        )
+
+    def _add(self, case: Case) -> None:
+        self._cases[case.id] = case
+        _insert_sorted(self._ids, case.id)
+        _insert_sorted(self._by_status.setdefault(case.status, []), case.id)
+        if self._text is not None:
+            self._text.add(case.id, case.title, case.description)
+        self._log(ChangeOperation.create, case)
+
+    def _remove(self, case: Case) -> None:
+        del self._cases[case.id]
+        _remove_sorted(self._ids, case.id)
+        _remove_sorted(self._by_status[case.status], case.id)
+        if self._text is not None:
+            self._text.remove(case.id, case.title, case.description)
+        self._log(ChangeOperation.delete, case)
+
+    def _set_status(self, case: Case, status: str) -> None:
+        if case.status != status:
+            _remove_sorted(self._by_status[case.status], case.id)
+            _insert_sorted(self._by_status.setdefault(status, []), case.id)
+        case.status = status
+
+    def create(self, title: str, description: str, status: str) -> Case:
+        with self._lock:
+            case = Case(
+                id=self._next_id,
+                title=title,
+                description=description,
+                status=status,
+            )
+            self._next_id += 1
+            self._add(case)
+            return case
 
     def get_all(self) -> List[Case]:
         """
         Return all cases.
-        
+
         Note: returns live Case objects (mutable references).
         """
-        return list(self._cases)
-    
+        with self._lock:
+            return [self._cases[case_id] for case_id in self._ids]
+
+    def iter_all(self, batch_size: int = 500) -> Iterator[Case]:
+        # Iterate over a snapshot so concurrent writes cannot break the loop
+        return iter(self.get_all())
+
+    def count(self) -> int:
+        with self._lock:
+            return len(self._cases)
+
+    def count_by_status(self) -> Dict[str, int]:
+        with self._lock:
+            return {status: len(ids) for status, ids in self._by_status.items() if ids}
+
+    def get_page(
+            self,
+            limit: int,
+            after: Optional[int] = None,
+            status: Optional[str] = None,
+    ) -> List[Case]:
+        with self._lock:
+            ids = self._ids if status is None else self._by_status.get(status, [])
+            start = 0 if after is None else bisect_right(ids, after)
+            return [self._cases[case_id] for case_id in ids[start:start + limit]]
+
     def get_by_id(self, case_id: int) -> Optional[Case]:
-        return next((c for c in self._cases if c.id == case_id), None)
-    
+        with self._lock:
+            return self._cases.get(case_id)
+
+    def search(self, query: str, limit: int, offset: int = 0) -> List[SearchHit]:
+        terms = tokenize(query)
+        with self._lock:
+            ranked = self._text_index().search(terms)[offset:offset + limit]
+            term_set = set(terms)
+            return [
+                SearchHit(
+                    self._cases[case_id],
+                    score,
+                    make_snippet(
+                        (self._cases[case_id].description, self._cases[case_id].title),
+                        term_set,
+                    ),
+                )
+                for case_id, score in ranked
+            ]
+
+    def get_changes(self, after: int, limit: int) -> List[CaseChange]:
+        with self._lock:
+            changes: List[CaseChange] = []
+            if self._snapshot is not None and after < self._base_seq:
+                changes = self._snapshot.changes(after, limit)
+                after = self._base_seq
+            start = after - self._base_seq
+            return changes + self._changes[start:start + limit - len(changes)]
+
+    def last_change(self) -> int:
+        with self._lock:
+            return self._base_seq + len(self._changes)
+
+    def get_modified_since(self, row_version: int, limit: int) -> CaseDelta:
+        with self._lock:
+            # A case's row version is the seq of its newest change; the
+            # index keeps cases in that order, so a page costs O(limit)
+            page, has_more = self._row_version_index().page(row_version, limit)
+            cases = []
+            deleted = []
+            for _, case_id in page:
+                # IDs are never reused: a missing case was deleted last
+                case = self._cases.get(case_id)
+                if case is None:
+                    deleted.append(case_id)
+                else:
+                    cases.append(case)
+            cursor = page[-1][0] if page else row_version
+            return CaseDelta(cases, deleted, cursor, has_more)
+
     def update(
             self,
             case_id: int,
@@ -48,19 +400,98 @@ class InMemoryCaseRepository(CaseRepository):
             description: str,
             status: str,
     ) -> Optional[Case]:
-        case = self.get_by_id(case_id)
-        if case is None:
-            return None
-        
-        case.title = title
-        case.description = description
-        case.status = status
-        return case
-    
+        with self._lock:
+            case = self._cases.get(case_id)
+            if case is None:
+                return None
+
+            if self._text is not None and (case.title, case.description) != (title, description):
+                self._text.remove(case.id, case.title, case.description)
+                self._text.add(case.id, title, description)
+            case.title = title
+            case.description = description
+            self._set_status(case, status)
+            case.version += 1
+            self._log(ChangeOperation.update, case)
+            return case
+
     def delete(self, case_id: int) -> bool:
-        case = self.get_by_id(case_id)
-        if case is None:
-            return False
-        
-        self._cases.remove(case)
-        return True
\ No newline at end of file
+        with self._lock:
+            case = self._cases.get(case_id)
+            if case is None:
+                return False
+
+            self._remove(case)
+            return True
+
+    def update_unless_closed(
+            self,
+            case_id: int,
+            title: str,
+            description: str,
+            status: str,
+            expected_version: Optional[int] = None,
+    ) -> Tuple[MutationOutcome, Optional[Case]]:
+        with self._lock:
+            case = self._cases.get(case_id)
+            if case is None:
+                return MutationOutcome.not_found, None
+            if case.status == "closed":
+                return MutationOutcome.closed, None
+            if expected_version is not None and case.version != expected_version:
+                return MutationOutcome.conflict, None
+
+            return MutationOutcome.applied, self.update(case_id, title, description, status)
+
+    def delete_unless_closed(self, case_id: int) -> MutationOutcome:
+        with self._lock:
+            case = self._cases.get(case_id)
+            if case is None:
+                return MutationOutcome.not_found
+            if case.status == "closed":
+                return MutationOutcome.closed
+
+            self._remove(case)
+            return MutationOutcome.applied
+
+    def create_many(self, items: Sequence[Tuple[str, str, str]]) -> List[Case]:
+        with self._lock:
+            return [
+                self.create(title, description, status)
+                for title, description, status in items
+            ]
+
+    def _classify(self, case_ids: Sequence[int]) -> Dict[int, MutationOutcome]:
+        outcomes = {}
+        for case_id in dict.fromkeys(case_ids):
+            case = self._cases.get(case_id)
+            if case is None:
+                outcomes[case_id] = MutationOutcome.not_found
+            elif case.status == "closed":
+                outcomes[case_id] = MutationOutcome.closed
+            else:
+                outcomes[case_id] = MutationOutcome.applied
+        return outcomes
+
+    def update_status_many(
+            self,
+            case_ids: Sequence[int],
+            status: str,
+    ) -> Dict[int, MutationOutcome]:
+        with self._lock:
+            outcomes = self._classify(case_ids)
+            for case_id, outcome in outcomes.items():
+                if outcome is MutationOutcome.applied:
+                    case = self._cases[case_id]
+                    self._set_status(case, status)
+                    case.version += 1
+                    self._log(ChangeOperation.update, case)
+            return outcomes
+
+    def delete_many(self, case_ids: Sequence[int]) -> Dict[int, MutationOutcome]:
+        with self._lock:
+            outcomes = self._classify(case_ids)
+            for case_id, outcome in outcomes.items():
+                if outcome is MutationOutcome.applied:
+                    self._remove(self._cases[case_id])
+            return outcomes
@@ -0,0 +1,195 @@
+# backend_api\repositories\instrumented.py
+"""
+Timing decorator for any CaseRepository.
+
+Purpose: per-method storage timings for GET /metrics
+- `case_repository_duration_seconds{method}`: latency histogram
+- `case_repository_rows_total{method}`: cases returned or written
+- `case_repository_errors_total{method}`: calls that raised
+Wraps the storage backend directly, beneath the cache, so the numbers
+are real SQL (or in-memory) work and cache hits do not dilute them.
+"""
+
+import time
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+from backend_api.metrics import MetricsRegistry
+from backend_api.models import Case, CaseChange, CaseDelta, MutationOutcome, SearchHit
+from backend_api.repository_contract import CaseRepository
+
+
+T = TypeVar("T")
+
+
+def _row_count(result: object) -> Optional[int]:
+    if isinstance(result, list):
+        return len(result)
+    if isinstance(result, dict):
+        # Bulk outcomes; count_by_status has no MutationOutcome values
+        return sum(1 for outcome in result.values() if outcome is MutationOutcome.applied)
+    if isinstance(result, Case):
+        return 1
+    if isinstance(result, CaseDelta):
+        return len(result.cases) + len(result.deleted)
+    if isinstance(result, tuple) and len(result) == 2:
+        # (MutationOutcome, Optional[Case]) from update_unless_closed
+        return 0 if result[1] is None else 1
+    if isinstance(result, MutationOutcome):
+        return int(result is MutationOutcome.applied)
+    return None
+
+
+class InstrumentedCaseRepository(CaseRepository):
+    def __init__(self, repository: CaseRepository, metrics: MetricsRegistry):
+        self._repository = repository
+        self._duration = metrics.histogram(
+            "case_repository_duration_seconds",
+            "Time spent in CaseRepository methods.",
+            ("method",),
+        )
+        self._rows = metrics.counter(
+            "case_repository_rows_total",
+            "Cases returned or written by CaseRepository methods.",
+            ("method",),
+        )
+        self._errors = metrics.counter(
+            "case_repository_errors_total",
+            "CaseRepository calls that raised.",
+            ("method",),
+        )
+
+    @property
+    def inner(self) -> CaseRepository:
+        return self._repository
+
+    def close(self) -> None:
+        self._repository.close()
+
+    def _timed(self, method: str, fn: Callable[..., T], *args, **kwargs) -> T:
+        started = time.perf_counter()
+        try:
+            result = fn(*args, **kwargs)
+        except Exception:
+            self._errors.inc(method)
+            raise
+        finally:
+            self._duration.observe(time.perf_counter() - started, method)
+
+        rows = _row_count(result)
+        if rows:
+            self._rows.inc(method, amount=rows)
+        return result
+
+    # Reads
+
+    def get_all(self) -> List[Case]:
+        return self._timed("get_all", self._repository.get_all)
+
+    def iter_all(self, batch_size: int = 500) -> Iterator[Case]:
+        # Timed from the first row to the last, including the consumer's
+        # pauses between batches; rows are counted as they are yielded
+        started = time.perf_counter()
+        rows = 0
+        try:
+            for case in self._repository.iter_all(batch_size=batch_size):
+                rows += 1
+                yield case
+        except Exception:
+            self._errors.inc("iter_all")
+            raise
+        finally:
+            self._duration.observe(time.perf_counter() - started, "iter_all")
+            self._rows.inc("iter_all", amount=rows)
+
+    def count(self) -> int:
+        return self._timed("count", self._repository.count)
+
+    def count_by_status(self) -> Dict[str, int]:
+        return self._timed("count_by_status", self._repository.count_by_status)
+
+    def get_page(
+        self,
+        limit: int,
+        after: Optional[int] = None,
+        status: Optional[str] = None,
+    ) -> List[Case]:
+        return self._timed(
+            "get_page", self._repository.get_page, limit, after=after, status=status
+        )
+
+    def get_by_id(self, case_id: int) -> Optional[Case]:
+        return self._timed("get_by_id", self._repository.get_by_id, case_id)
+
+    def search(self, query: str, limit: int, offset: int = 0) -> List[SearchHit]:
+        return self._timed("search", self._repository.search, query, limit, offset=offset)
+
+    def get_changes(self, after: int, limit: int) -> List[CaseChange]:
+        return self._timed("get_changes", self._repository.get_changes, after, limit)
+
+    def last_change(self) -> int:
+        return self._timed("last_change", self._repository.last_change)
+
+    def get_modified_since(self, row_version: int, limit: int) -> CaseDelta:
+        return self._timed(
+            "get_modified_since",
+            self._repository.get_modified_since,
+            row_version,
+            limit,
+        )
+
+    # Writes
+
+    def create(self, title: str, description: str, status: str) -> Case:
+        return self._timed("create", self._repository.create, title, description, status)
+
+    def update(
+        self,
+        case_id: int,
+        title: str,
+        description: str,
+        status: str,
+    ) -> Optional[Case]:
+        return self._timed(
+            "update", self._repository.update, case_id, title, description, status
+        )
+
+    def delete(self, case_id: int) -> bool:
+        return self._timed("delete", self._repository.delete, case_id)
+
+    def update_unless_closed(
+        self,
+        case_id: int,
+        title: str,
+        description: str,
+        status: str,
+        expected_version: Optional[int] = None,
+    ) -> Tuple[MutationOutcome, Optional[Case]]:
+        return self._timed(
+            "update_unless_closed",
+            self._repository.update_unless_closed,
+            case_id,
+            title,
+            description,
+            status,
+            expected_version=expected_version,
+        )
+
+    def delete_unless_closed(self, case_id: int) -> MutationOutcome:
+        return self._timed(
+            "delete_unless_closed", self._repository.delete_unless_closed, case_id
+        )
+
+    def create_many(self, items: Sequence[Tuple[str, str, str]]) -> List[Case]:
+        return self._timed("create_many", self._repository.create_many, items)
+
+    def update_status_many(
+        self,
+        case_ids: Sequence[int],
+        status: str,
+    ) -> Dict[int, MutationOutcome]:
+        return self._timed(
+            "update_status_many", self._repository.update_status_many, case_ids, status
+        )
+
+    def delete_many(self, case_ids: Sequence[int]) -> Dict[int, MutationOutcome]:
+        return self._timed("delete_many", self._repository.delete_many, case_ids)
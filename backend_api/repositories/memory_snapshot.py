@@ -0,0 +1,302 @@
+# backend_api\repositories\memory_snapshot.py
+"""
+Binary snapshot files for InMemoryCaseRepository warm starts.
+
+Purpose: bring a RAM-only node back with millions of cases in well under
+a second, instead of re-seeding it through the API
+- Columnar layout: fixed-width arrays for IDs, versions and status codes,
+  plus one string heap holding every title and description as UTF-8
+- `SnapshotFile` maps the file read-only (mmap) and reads the arrays in
+  place; a case's strings are decoded only when that case is first used
+- A per-status ID index and the compacted change log (the newest change
+  per case, tombstones included) are stored too, so loading never scans
+  the rows and delta sync keeps working across the restart
+
+File layout (native byte order, every section 8-byte aligned):
+    magic, header length (uint32), JSON header
+    ids            int64[rows]       sorted ascending
+    versions       int64[rows]
+    offsets        int64[2 * rows + 1]  title i = heap[o[2i]:o[2i+1]],
+                                        description i = heap[o[2i+1]:o[2i+2]]
+    status codes   uint8[rows]       index into header "statuses"
+    status index   int64[rows]       IDs per status, in "statuses" order
+    log seq        int64[log]        ascending
+    log case ID    int64[log]
+    log row        int64[log]        row of the case, -1 for a delete
+    log operation  uint8[log]        index into OPERATIONS
+    log time       19 bytes[log]     "YYYY-MM-DD HH:MM:SS"
+    heap           bytes
+
+Rule: files are rewritten whole (write, then rename), never patched.
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from backend_api.models import Case, CaseChange, ChangeOperation
+
+
+MAGIC = b"CASESNAP"
+FORMAT_VERSION = 1
+OPERATIONS = (ChangeOperation.create, ChangeOperation.update, ChangeOperation.delete)
+TIMESTAMP_SIZE = 19
+
+_OPERATION_CODES = {operation: code for code, operation in enumerate(OPERATIONS)}
+_LENGTH = struct.Struct("<I")
+
+# seq, case_id, operation, changed_at
+LogEntry = Tuple[int, int, ChangeOperation, str]
+
+
+def _align(size: int) -> int:
+    return (size + 7) & ~7
+
+
+def _sections(header: dict) -> List[Tuple[str, str, int]]:
+    """(name, array typecode or "s" for raw bytes, item count) in file order."""
+    rows = header["rows"]
+    log = header["log"]
+    return [
+        ("ids", "q", rows),
+        ("versions", "q", rows),
+        ("offsets", "q", 2 * rows + 1),
+        ("status_codes", "B", rows),
+        ("status_index", "q", rows),
+        ("log_seq", "q", log),
+        ("log_case_id", "q", log),
+        ("log_row", "q", log),
+        ("log_operation", "B", log),
+        ("log_time", "s", log * TIMESTAMP_SIZE),
+        ("heap", "s", header["heap"]),
+    ]
+
+
+def write_snapshot(
+    path: str,
+    cases: Iterable[Case],
+    log: Iterable[LogEntry],
+    next_id: int,
+) -> None:
+    """
+    Write `cases` (in ID order) and the compacted change `log` (in seq
+    order, at most one entry per case) to `path`.
+    """
+    ids = array("q")
+    versions = array("q")
+    offsets = array("q", [0])
+    status_codes = array("B")
+    statuses: Dict[str, int] = {}
+    heap = bytearray()
+    rows: Dict[int, int] = {}
+
+    for row, case in enumerate(cases):
+        ids.append(case.id)
+        versions.append(case.version)
+        heap += case.title.encode()
+        offsets.append(len(heap))
+        heap += case.description.encode()
+        offsets.append(len(heap))
+        status_codes.append(statuses.setdefault(case.status, len(statuses)))
+        rows[case.id] = row
+    if len(statuses) > 256:
+        raise ValueError("A snapshot holds at most 256 distinct statuses")
+
+    by_status = [array("q") for _ in statuses]
+    for case_id, code in zip(ids, status_codes):
+        by_status[code].append(case_id)
+    status_index = array("q")
+    for status_ids in by_status:
+        status_index.extend(status_ids)
+
+    log_seq = array("q")
+    log_case_id = array("q")
+    log_row = array("q")
+    log_operation = array("B")
+    log_time = bytearray()
+    for seq, case_id, operation, changed_at in log:
+        log_seq.append(seq)
+        log_case_id.append(case_id)
+        log_row.append(-1 if operation is ChangeOperation.delete else rows[case_id])
+        log_operation.append(_OPERATION_CODES[operation])
+        log_time += changed_at.encode("ascii").ljust(TIMESTAMP_SIZE)[:TIMESTAMP_SIZE]
+
+    header = {
+        "version": FORMAT_VERSION,
+        "byteorder": sys.byteorder,
+        "rows": len(ids),
+        "log": len(log_seq),
+        "heap": len(heap),
+        "next_id": next_id,
+        "last_seq": log_seq[-1] if log_seq else 0,
+        "statuses": list(statuses),
+        "status_counts": [len(status_ids) for status_ids in by_status],
+    }
+    encoded = json.dumps(header).encode()
+    data = {
+        "ids": ids,
+        "versions": versions,
+        "offsets": offsets,
+        "status_codes": status_codes,
+        "status_index": status_index,
+        "log_seq": log_seq,
+        "log_case_id": log_case_id,
+        "log_row": log_row,
+        "log_operation": log_operation,
+        "log_time": log_time,
+        "heap": heap,
+    }
+
+    with open(path, "wb") as f:
+        prefix = MAGIC + _LENGTH.pack(len(encoded)) + encoded
+        f.write(prefix.ljust(_align(len(prefix)), b"\0"))
+        for name, _, _ in _sections(header):
+            size = memoryview(data[name]).nbytes
+            f.write(data[name])
+            f.write(b"\0" * (_align(size) - size))
+        f.flush()
+        os.fsync(f.fileno())
+
+
+class SnapshotFile:
+    """
+    A snapshot mapped read-only. Arrays are read in place; nothing is
+    decoded until a row or log entry is asked for.
+
+    Not thread-safe on its own; the owning repository serializes access.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"Snapshot {path} is empty") from None
+        self._views: List[memoryview] = []
+        try:
+            self._open()
+        except Exception:
+            self.close()
+            raise
+
+    def _open(self) -> None:
+        view = self._view(memoryview(self._map))
+        start = len(MAGIC) + _LENGTH.size
+        if len(view) < start or bytes(view[:len(MAGIC)]) != MAGIC:
+            raise ValueError(f"{self.path} is not a case snapshot")
+        (length,) = _LENGTH.unpack_from(view, len(MAGIC))
+        header = json.loads(bytes(view[start:start + length]))
+        if header["version"] != FORMAT_VERSION:
+            raise ValueError(f"Unsupported snapshot version {header['version']}")
+        if header["byteorder"] != sys.byteorder:
+            raise ValueError("Snapshot was written on a machine with another byte order")
+
+        position = _align(start + length)
+        sections = {}
+        for name, typecode, count in _sections(header):
+            size = count * (array(typecode).itemsize if typecode != "s" else 1)
+            if position + size > len(view):
+                raise ValueError(f"Snapshot {self.path} is truncated")
+            section = self._view(view[position:position + size])
+            if typecode != "s":
+                section = self._view(section.cast(typecode))
+            sections[name] = section
+            position += _align(size)
+
+        self.next_id: int = header["next_id"]
+        self.last_seq: int = header["last_seq"]
+        self.statuses: List[str] = header["statuses"]
+        self.ids: Sequence[int] = sections["ids"]
+        self._versions = sections["versions"]
+        self._offsets = sections["offsets"]
+        self._status_codes = sections["status_codes"]
+        self._log_seq: Sequence[int] = sections["log_seq"]
+        self._log_case_id = sections["log_case_id"]
+        self._log_row = sections["log_row"]
+        self._log_operation = sections["log_operation"]
+        self._log_time = sections["log_time"]
+        self._heap = sections["heap"]
+
+        self._by_status: Dict[str, Sequence[int]] = {}
+        index = sections["status_index"]
+        start = 0
+        for status, count in zip(self.statuses, header["status_counts"]):
+            self._by_status[status] = self._view(index[start:start + count])
+            start += count
+
+    def _view(self, view: memoryview) -> memoryview:
+        # Every view must be released before the map can be closed
+        self._views.append(view)
+        return view
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def find(self, case_id: int) -> Optional[int]:
+        """Row of `case_id`, or None."""
+        row = bisect_left(self.ids, case_id)
+        if row < len(self.ids) and self.ids[row] == case_id:
+            return row
+        return None
+
+    def case(self, row: int) -> Case:
+        """Decode one row into a new Case."""
+        heap = self._heap
+        offsets = self._offsets
+        start, middle, end = offsets[2 * row], offsets[2 * row + 1], offsets[2 * row + 2]
+        return Case(
+            id=self.ids[row],
+            title=str(heap[start:middle], "utf-8"),
+            description=str(heap[middle:end], "utf-8"),
+            status=self.statuses[self._status_codes[row]],
+            version=self._versions[row],
+        )
+
+    def ids_with_status(self, status: str) -> Sequence[int]:
+        return self._by_status.get(status, ())
+
+    def _changed_at(self, i: int) -> str:
+        start = i * TIMESTAMP_SIZE
+        return str(self._log_time[start:start + TIMESTAMP_SIZE], "ascii")
+
+    def log_entries(self, after: int = 0) -> Iterator[LogEntry]:
+        """The log entries after seq `after`, without decoding any case."""
+        for i in range(bisect_right(self._log_seq, after), len(self._log_seq)):
+            yield (
+                self._log_seq[i],
+                self._log_case_id[i],
+                OPERATIONS[self._log_operation[i]],
+                self._changed_at(i),
+            )
+
+    def changes(self, after: int, limit: int) -> List[CaseChange]:
+        """Up to `limit` log entries after seq `after`, cases as of the snapshot."""
+        start = bisect_right(self._log_seq, after)
+        changes = []
+        for i in range(start, min(start + limit, len(self._log_seq))):
+            row = self._log_row[i]
+            changes.append(
+                CaseChange(
+                    seq=self._log_seq[i],
+                    case_id=self._log_case_id[i],
+                    operation=OPERATIONS[self._log_operation[i]],
+                    changed_at=self._changed_at(i),
+                    case=self.case(row) if row >= 0 else None,
+                )
+            )
+        return changes
+
+    def close(self) -> None:
+        for view in reversed(self._views):
+            view.release()
+        self._views.clear()
+        if not self._map.closed:
+            self._map.close()
+        self._file.close()
@@ -3,44 +3,99 @@
 SQLite implementation of the CaseRepository.
 
 Purpose: persistence logic only
+- Writes, and reads inside a write, use `connection_factory` (the primary)
+- Plain reads use `read_connection_factory` when one is given (a
+  read-only pool or snapshot replica), except while read-your-writes is
+  active for the caller (db.read_your_writes)
 """
 
 import sqlite3
-from typing import List, Optional, Callable, ContextManager
-from backend_api.models import Case
+from typing import (
+    Callable,
+    ContextManager,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+from backend_api.db import reads_from_primary
+from backend_api.models import (
+    Case,
+    CaseChange,
+    CaseDelta,
+    ChangeOperation,
+    MutationOutcome,
+    SearchHit,
+)
 from backend_api.repository_contract import CaseRepository
+from backend_api.repositories.text_search import (
+    ELLIPSIS,
+    HIGHLIGHT_END,
+    HIGHLIGHT_START,
+    SNIPPET_TOKENS,
+    fts5_query,
+)
+
+
+# Column list shared by every query that builds a Case; same order as the
+# Case fields, so rows map to cases positionally
+_CASE_COLUMN_NAMES = ("id", "title", "description", "status", "version")
+_CASE_COLUMNS = ", ".join(_CASE_COLUMN_NAMES)
+# Same columns, qualified for queries that join on cases AS c
+_CASE_COLUMNS_C = ", ".join(f"c.{name}" for name in _CASE_COLUMN_NAMES)
+_CASE_WIDTH = len(_CASE_COLUMN_NAMES)
+
+
+# Cursor row factories: build the result straight from the row tuple,
+# without an intermediate sqlite3.Row and lookups by column name
+
+def _case_row(cursor: sqlite3.Cursor, row: tuple) -> Case:
+    return Case(*row)
+
+
+def _search_hit_row(cursor: sqlite3.Cursor, row: tuple) -> SearchHit:
+    return SearchHit(Case(*row[:_CASE_WIDTH]), row[_CASE_WIDTH], row[_CASE_WIDTH + 1])
+
+
+def _change_row(cursor: sqlite3.Cursor, row: tuple) -> CaseChange:
+    seq, case_id, operation, changed_at = row[:4]
+    # Deletes carry no case columns
+    case = Case(case_id, *row[4:]) if operation != "delete" else None
+    return CaseChange(seq, case_id, ChangeOperation(operation), changed_at, case)
+
+
+def _execute(
+    conn: sqlite3.Connection,
+    sql: str,
+    params: Sequence = (),
+    row_factory: Callable[[sqlite3.Cursor, tuple], object] = _case_row,
+) -> sqlite3.Cursor:
+    # The factory is set on this cursor only; the connection keeps
+    # sqlite3.Row for every other query
+    cursor = conn.cursor()
+    cursor.row_factory = row_factory
+    return cursor.execute(sql, params)
 
 
 class SQLiteCaseRepository(CaseRepository):
     def __init__(
         self,
         connection_factory: Callable[[], ContextManager[sqlite3.Connection]],
+        read_connection_factory: Optional[
+            Callable[[], ContextManager[sqlite3.Connection]]
+        ] = None,
     ):
+        # The schema is owned by backend_api.migrations and created at
+        # startup; constructing a repository never touches the database.
         self._connection_factory = connection_factory
-        self._ensure_schema()
+        self._read_connection_factory = read_connection_factory or connection_factory
 
-    def _ensure_schema(self) -> None:
-        # Schema creation must also use a local connection
-        with self._connection_factory() as conn:
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS cases (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    title TEXT NOT NULL,
-                    description TEXT NOT NULL,
-                    status TEXT NOT NULL
-                )
-                """
-            )
-            conn.commit()
-
-    def _row_to_case(self, row: sqlite3.Row) -> Case:
-        return Case(
-            id=row["id"],
-            title=row["title"],
-            description=row["description"],
-            status=row["status"],
-        )
+    def _read_connection(self) -> ContextManager[sqlite3.Connection]:
+        if reads_from_primary():
+            return self._connection_factory()
+        return self._read_connection_factory()
 
     def create(self, title: str, description: str, status: str) -> Case:
         with self._connection_factory() as conn:
@@ -58,21 +113,149 @@ class SQLiteCaseRepository(CaseRepository):
             )
 
     def get_all(self) -> List[Case]:
-        with self._connection_factory() as conn:
+        with self._read_connection() as conn:
+            return _execute(conn, f"SELECT {_CASE_COLUMNS} FROM cases").fetchall()
+
+    def iter_all(self, batch_size: int = 500) -> Iterator[Case]:
+        # Keyset pages, each on its own connection checkout: a slow consumer
+        # never holds a pooled connection or a read transaction (which would
+        # block WAL checkpoints) between batches. Cases written during the
+        # export may or may not be included.
+        after = 0
+        while True:
+            cases = self.get_page(batch_size, after=after)
+            yield from cases
+            if len(cases) < batch_size:
+                break
+            after = cases[-1].id
+
+    def count(self) -> int:
+        with self._read_connection() as conn:
+            return conn.execute("SELECT COUNT(*) FROM cases").fetchone()[0]
+
+    def count_by_status(self) -> Dict[str, int]:
+        # case_stats is kept in step with `cases` by triggers (migration 5)
+        with self._read_connection() as conn:
             rows = conn.execute(
-                "SELECT id, title, description, status FROM cases"
+                "SELECT status, count FROM case_stats WHERE count > 0"
             ).fetchall()
 
-            return [self._row_to_case(row) for row in rows]
+            return {row["status"]: row["count"] for row in rows}
+
+    def get_page(
+        self,
+        limit: int,
+        after: Optional[int] = None,
+        status: Optional[str] = None,
+    ) -> List[Case]:
+        # Served by the primary key, or by idx_cases_status_id when filtering
+        query = f"SELECT {_CASE_COLUMNS} FROM cases WHERE id > ?"
+        params: list = [after if after is not None else 0]
+
+        if status is not None:
+            query += " AND status = ?"
+            params.append(status)
+
+        query += " ORDER BY id LIMIT ?"
+        params.append(limit)
+
+        with self._read_connection() as conn:
+            return _execute(conn, query, params).fetchall()
 
     def get_by_id(self, case_id: int) -> Optional[Case]:
-        with self._connection_factory() as conn:
-            row = conn.execute(
-                "SELECT id, title, description, status FROM cases WHERE id = ?",
+        with self._read_connection() as conn:
+            return _execute(
+                conn,
+                f"SELECT {_CASE_COLUMNS} FROM cases WHERE id = ?",
                 (case_id,),
             ).fetchone()
 
-            return self._row_to_case(row) if row else None
+    def search(self, query: str, limit: int, offset: int = 0) -> List[SearchHit]:
+        match = fts5_query(query)
+        if not match:
+            return []
+
+        # bm25() is lower-is-better; it is negated so higher is better,
+        # like InMemoryCaseRepository
+        with self._read_connection() as conn:
+            return _execute(
+                conn,
+                f"""
+                SELECT {_CASE_COLUMNS_C},
+                       -bm25(cases_fts) AS score,
+                       snippet(cases_fts, -1, ?, ?, ?, ?) AS snippet
+                FROM cases_fts
+                JOIN cases AS c ON c.id = cases_fts.rowid
+                WHERE cases_fts MATCH ?
+                ORDER BY bm25(cases_fts), c.id
+                LIMIT ? OFFSET ?
+                """,
+                (
+                    HIGHLIGHT_START,
+                    HIGHLIGHT_END,
+                    ELLIPSIS,
+                    SNIPPET_TOKENS,
+                    match,
+                    limit,
+                    offset,
+                ),
+                row_factory=_search_hit_row,
+            ).fetchall()
+
+    def get_changes(self, after: int, limit: int) -> List[CaseChange]:
+        with self._read_connection() as conn:
+            return _execute(
+                conn,
+                """
+                SELECT seq, case_id, operation, changed_at,
+                       title, description, status, version
+                FROM case_changes
+                WHERE seq > ?
+                ORDER BY seq
+                LIMIT ?
+                """,
+                (after, limit),
+                row_factory=_change_row,
+            ).fetchall()
+
+    def last_change(self) -> int:
+        with self._read_connection() as conn:
+            row = conn.execute("SELECT MAX(seq) FROM case_changes").fetchone()
+        return row[0] or 0
+
+    def get_modified_since(self, row_version: int, limit: int) -> CaseDelta:
+        # Live rows and tombstones in one statement, so both come from the
+        # same snapshot; row_version is maintained by triggers (migration 7)
+        with self._read_connection() as conn:
+            rows = _execute(
+                conn,
+                f"""
+                SELECT row_version, {_CASE_COLUMNS}
+                FROM cases
+                WHERE row_version > ?
+                UNION ALL
+                SELECT row_version, case_id, NULL, NULL, NULL, NULL
+                FROM case_tombstones
+                WHERE row_version > ?
+                ORDER BY 1
+                LIMIT ?
+                """,
+                (row_version, row_version, limit + 1),
+                row_factory=None,
+            ).fetchall()
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        cases = []
+        deleted = []
+        for row in rows:
+            # title is NOT NULL, so only tombstones have none
+            if row[2] is None:
+                deleted.append(row[1])
+            else:
+                cases.append(Case(*row[1:]))
+        cursor = rows[-1][0] if rows else row_version
+        return CaseDelta(cases, deleted, cursor, has_more)
 
     def update(
         self,
@@ -85,7 +268,7 @@ class SQLiteCaseRepository(CaseRepository):
             cursor = conn.execute(
                 """
                 UPDATE cases
-                SET title = ?, description = ?, status = ?
+                SET title = ?, description = ?, status = ?, version = version + 1
                 WHERE id = ?
                 """,
                 (title, description, status, case_id),
@@ -95,13 +278,12 @@ class SQLiteCaseRepository(CaseRepository):
             if cursor.rowcount == 0:
                 return None
 
-            row = conn.execute(
-                "SELECT id, title, description, status FROM cases WHERE id = ?",
+            return _execute(
+                conn,
+                f"SELECT {_CASE_COLUMNS} FROM cases WHERE id = ?",
                 (case_id,),
             ).fetchone()
 
-            return self._row_to_case(row) if row else None
-
     def delete(self, case_id: int) -> bool:
         with self._connection_factory() as conn:
             cursor = conn.execute(
@@ -110,3 +292,162 @@ class SQLiteCaseRepository(CaseRepository):
             )
             conn.commit()
             return cursor.rowcount > 0
+
+    def _why_not_applied(
+        self,
+        conn: sqlite3.Connection,
+        case_id: int,
+    ) -> MutationOutcome:
+        # Only reached when a guarded write matched nothing; runs in the same
+        # transaction, so the answer is consistent with that write.
+        row = conn.execute(
+            "SELECT status FROM cases WHERE id = ?", (case_id,)
+        ).fetchone()
+        if row is None:
+            return MutationOutcome.not_found
+        if row[0] == "closed":
+            return MutationOutcome.closed
+        return MutationOutcome.conflict
+
+    def update_unless_closed(
+        self,
+        case_id: int,
+        title: str,
+        description: str,
+        status: str,
+        expected_version: Optional[int] = None,
+    ) -> Tuple[MutationOutcome, Optional[Case]]:
+        with self._connection_factory() as conn:
+            cases = _execute(
+                conn,
+                f"""
+                UPDATE cases
+                SET title = ?, description = ?, status = ?, version = version + 1
+                WHERE id = ? AND status != 'closed' AND (? IS NULL OR version = ?)
+                RETURNING {_CASE_COLUMNS}
+                """,
+                (title, description, status, case_id, expected_version, expected_version),
+            ).fetchall()
+
+            if cases:
+                conn.commit()
+                return MutationOutcome.applied, cases[0]
+
+            outcome = self._why_not_applied(conn, case_id)
+            conn.commit()
+            return outcome, None
+
+    def delete_unless_closed(self, case_id: int) -> MutationOutcome:
+        with self._connection_factory() as conn:
+            cursor = conn.execute(
+                "DELETE FROM cases WHERE id = ? AND status != 'closed'",
+                (case_id,),
+            )
+
+            if cursor.rowcount > 0:
+                conn.commit()
+                return MutationOutcome.applied
+
+            outcome = self._why_not_applied(conn, case_id)
+            conn.commit()
+            return outcome
+
+    def create_many(self, items: Sequence[Tuple[str, str, str]]) -> List[Case]:
+        if not items:
+            return []
+
+        with self._connection_factory() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.executemany(
+                    "INSERT INTO cases (title, description, status) VALUES (?, ?, ?)",
+                    items,
+                )
+                last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+        # The write lock is held for the whole batch, so the new IDs are
+        # consecutive and end at last_insert_rowid()
+        first_id = last_id - len(items) + 1
+        return [
+            Case(id=first_id + offset, title=title, description=description, status=status)
+            for offset, (title, description, status) in enumerate(items)
+        ]
+
+    def _lock_and_classify(
+        self,
+        conn: sqlite3.Connection,
+        case_ids: Sequence[int],
+    ) -> Dict[int, MutationOutcome]:
+        """
+        Start a write transaction and classify each ID against current rows.
+        """
+        conn.execute("BEGIN IMMEDIATE")
+        unique_ids = list(dict.fromkeys(case_ids))
+        placeholders = ", ".join("?" for _ in unique_ids)
+        rows = conn.execute(
+            f"SELECT id, status FROM cases WHERE id IN ({placeholders})",
+            unique_ids,
+        ).fetchall()
+        statuses = {row[0]: row[1] for row in rows}
+
+        outcomes = {}
+        for case_id in unique_ids:
+            if case_id not in statuses:
+                outcomes[case_id] = MutationOutcome.not_found
+            elif statuses[case_id] == "closed":
+                outcomes[case_id] = MutationOutcome.closed
+            else:
+                outcomes[case_id] = MutationOutcome.applied
+        return outcomes
+
+    def update_status_many(
+        self,
+        case_ids: Sequence[int],
+        status: str,
+    ) -> Dict[int, MutationOutcome]:
+        if not case_ids:
+            return {}
+
+        with self._connection_factory() as conn:
+            try:
+                outcomes = self._lock_and_classify(conn, case_ids)
+                conn.executemany(
+                    "UPDATE cases SET status = ?, version = version + 1 WHERE id = ?",
+                    [
+                        (status, case_id)
+                        for case_id, outcome in outcomes.items()
+                        if outcome is MutationOutcome.applied
+                    ],
+                )
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+        return outcomes
+
+    def delete_many(self, case_ids: Sequence[int]) -> Dict[int, MutationOutcome]:
+        if not case_ids:
+            return {}
+
+        with self._connection_factory() as conn:
+            try:
+                outcomes = self._lock_and_classify(conn, case_ids)
+                conn.executemany(
+                    "DELETE FROM cases WHERE id = ?",
+                    [
+                        (case_id,)
+                        for case_id, outcome in outcomes.items()
+                        if outcome is MutationOutcome.applied
+                    ],
+                )
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+        return outcomes
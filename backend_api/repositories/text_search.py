@@ -0,0 +1,138 @@
+# backend_api\repositories\text_search.py
+"""
+Full-text search helpers shared by the repositories.
+
+- `tokenize`: the word splitting used for queries and in-memory indexing,
+  close to SQLite FTS5's default unicode61 tokenizer
+- `fts5_query`: turns free text into a safe FTS5 MATCH expression
+- `InvertedIndex`: BM25-ranked index used by InMemoryCaseRepository
+- `make_snippet`: highlighted excerpt in the same format SQLite returns
+"""
+
+import math
+import re
+from collections import Counter
+from typing import Dict, List, Sequence, Set, Tuple
+
+
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_END = "</mark>"
+ELLIPSIS = "…"
+SNIPPET_TOKENS = 12
+
+_WORD = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize(text: str) -> List[str]:
+    return [token.casefold() for token in _WORD.findall(text)]
+
+
+def fts5_query(text: str) -> str:
+    """
+    Build an FTS5 query matching documents that contain every word.
+
+    Each word is quoted, so user input can never be parsed as FTS5
+    syntax (NEAR, column filters, ...).
+    """
+    return " ".join(f'"{token}"' for token in tokenize(text))
+
+
+def make_snippet(texts: Sequence[str], terms: Set[str]) -> str:
+    """
+    Return a short excerpt around the first matching word of the first
+    field that contains one, with matches wrapped in highlight markers.
+    """
+    for text in texts:
+        matches = list(_WORD.finditer(text))
+        hits = [i for i, m in enumerate(matches) if m.group().casefold() in terms]
+        if not hits:
+            continue
+
+        start = max(0, hits[0] - SNIPPET_TOKENS // 2)
+        end = min(len(matches), start + SNIPPET_TOKENS)
+        start = max(0, end - SNIPPET_TOKENS)
+
+        parts = []
+        position = matches[start].start()
+        for match in matches[start:end]:
+            parts.append(text[position:match.start()])
+            word = match.group()
+            if word.casefold() in terms:
+                word = f"{HIGHLIGHT_START}{word}{HIGHLIGHT_END}"
+            parts.append(word)
+            position = match.end()
+
+        prefix = ELLIPSIS if start > 0 else text[:matches[0].start()]
+        suffix = ELLIPSIS if end < len(matches) else text[position:]
+        return prefix + "".join(parts) + suffix
+
+    return ""
+
+
+class InvertedIndex:
+    """
+    Token -> {document id: term frequency} with Okapi BM25 ranking.
+
+    Not thread-safe on its own; the owning repository serializes access.
+    """
+
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(self):
+        self._postings: Dict[str, Dict[int, int]] = {}
+        self._lengths: Dict[int, int] = {}
+        self._total_length = 0
+
+    def add(self, doc_id: int, *fields: str) -> None:
+        tokens = [token for field in fields for token in tokenize(field)]
+        for token, frequency in Counter(tokens).items():
+            self._postings.setdefault(token, {})[doc_id] = frequency
+        self._lengths[doc_id] = len(tokens)
+        self._total_length += len(tokens)
+
+    def remove(self, doc_id: int, *fields: str) -> None:
+        """Remove a document; `fields` must be the text it was added with."""
+        for token in set(token for field in fields for token in tokenize(field)):
+            postings = self._postings.get(token)
+            if postings is not None:
+                postings.pop(doc_id, None)
+                if not postings:
+                    del self._postings[token]
+        self._total_length -= self._lengths.pop(doc_id, 0)
+
+    def search(self, terms: Sequence[str]) -> List[Tuple[int, float]]:
+        """
+        Return (document id, score) for documents containing every term,
+        best match first. Higher scores are better.
+        """
+        unique_terms = list(dict.fromkeys(terms))
+        if not unique_terms:
+            return []
+
+        postings = [self._postings.get(term) for term in unique_terms]
+        if any(p is None for p in postings):
+            return []
+
+        # Intersect starting from the rarest term
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for p in postings[1:]:
+            candidates &= p.keys()
+
+        documents = len(self._lengths)
+        average_length = self._total_length / documents if documents else 0
+        scored = []
+        for doc_id in candidates:
+            length_norm = self.K1 * (
+                1 - self.B + self.B * self._lengths[doc_id] / (average_length or 1)
+            )
+            score = 0.0
+            for p in postings:
+                frequency = p[doc_id]
+                idf = math.log(1 + (documents - len(p) + 0.5) / (len(p) + 0.5))
+                score += idf * frequency * (self.K1 + 1) / (frequency + length_norm)
+            scored.append((doc_id, score))
+
+        scored.sort(key=lambda item: (-item[1], item[0]))
+        return scored
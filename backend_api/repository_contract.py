@@ -7,8 +7,8 @@ Responsibilities:
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
-from backend_api.models import Case
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Sequence, Tuple
+from backend_api.models import Case, CaseChange, CaseDelta, MutationOutcome, SearchHit
 
 
 class CaseRepository(ABC):
@@ -24,11 +24,85 @@ class CaseRepository(ABC):
         """Return all cases."""
         raise NotImplementedError
 
+    @abstractmethod
+    def iter_all(self, batch_size: int = 500) -> Iterator[Case]:
+        """
+        Yield all cases ordered by ID, loading at most `batch_size` at a time.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def count(self) -> int:
+        """Return the number of cases."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def count_by_status(self) -> Dict[str, int]:
+        """
+        Return the number of cases per status, omitting empty statuses.
+
+        Served from maintained counters, not by scanning every case.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_page(
+        self,
+        limit: int,
+        after: Optional[int] = None,
+        status: Optional[str] = None,
+    ) -> List[Case]:
+        """
+        Return up to `limit` cases ordered by ID.
+
+        Only cases with an ID greater than `after` (keyset cursor) and,
+        if given, the matching `status` are included.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def get_by_id(self, case_id: int) -> Optional[Case]:
         """Return a case by ID, or None if not found."""
         raise NotImplementedError
 
+    @abstractmethod
+    def search(self, query: str, limit: int, offset: int = 0) -> List[SearchHit]:
+        """
+        Full-text search over title and description.
+
+        Matches cases containing every word of `query`, best match first,
+        with a highlighted snippet.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_changes(self, after: int, limit: int) -> List[CaseChange]:
+        """
+        Return up to `limit` change-log entries with a sequence number
+        greater than `after`, oldest first.
+
+        Every create, update and delete is logged in the same transaction
+        as the write itself.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def last_change(self) -> int:
+        """Return the sequence number of the newest change, or 0."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_modified_since(self, row_version: int, limit: int) -> CaseDelta:
+        """
+        Return what changed after `row_version`: the current state of up
+        to `limit` created or updated cases plus the IDs of deleted ones,
+        oldest change first.
+
+        Row versions come from one monotonic clock shared by every write;
+        the returned cursor is the `row_version` for the next call.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def update(
         self,
@@ -37,10 +111,179 @@ class CaseRepository(ABC):
         description: str,
         status: str,
     ) -> Optional[Case]:
-        """Update a case and return it, or None if not found."""
+        """
+        Update a case and return it, or None if not found.
+
+        Increments the case version.
+        """
         raise NotImplementedError
 
     @abstractmethod
     def delete(self, case_id: int) -> bool:
         """Delete a case. Return True if deleted, False otherwise."""
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
+
+    @abstractmethod
+    def update_unless_closed(
+        self,
+        case_id: int,
+        title: str,
+        description: str,
+        status: str,
+        expected_version: Optional[int] = None,
+    ) -> Tuple[MutationOutcome, Optional[Case]]:
+        """
+        Atomically update a case unless it is closed.
+
+        When `expected_version` is given, the update only applies if the
+        stored version still matches; otherwise the outcome is conflict.
+        Every applied update increments the version.
+
+        Returns the outcome and, when applied, the updated case.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete_unless_closed(self, case_id: int) -> MutationOutcome:
+        """Atomically delete a case unless it is closed."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def create_many(self, items: Sequence[Tuple[str, str, str]]) -> List[Case]:
+        """
+        Create cases from (title, description, status) tuples in one
+        transaction and return them in input order.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def update_status_many(
+        self,
+        case_ids: Sequence[int],
+        status: str,
+    ) -> Dict[int, MutationOutcome]:
+        """
+        Set `status` on many cases in one transaction.
+
+        Closed cases are immutable: they are left untouched and reported
+        as MutationOutcome.closed.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete_many(self, case_ids: Sequence[int]) -> Dict[int, MutationOutcome]:
+        """
+        Delete many cases in one transaction.
+
+        Closed cases are kept and reported as MutationOutcome.closed.
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release resources such as worker threads; wrappers forward it."""
+
+
+class AsyncCaseRepository(ABC):
+    """
+    Async counterpart of CaseRepository, for the async request path.
+
+    Same methods and semantics; every call is awaitable and must not
+    block the event loop.
+    """
+
+    @abstractmethod
+    async def create(self, title: str, description: str, status: str) -> Case:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_all(self) -> List[Case]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def iter_all(self, batch_size: int = 500) -> AsyncIterator[Case]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def count(self) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def count_by_status(self) -> Dict[str, int]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_page(
+        self,
+        limit: int,
+        after: Optional[int] = None,
+        status: Optional[str] = None,
+    ) -> List[Case]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_by_id(self, case_id: int) -> Optional[Case]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def search(self, query: str, limit: int, offset: int = 0) -> List[SearchHit]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_changes(self, after: int, limit: int) -> List[CaseChange]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def last_change(self) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_modified_since(self, row_version: int, limit: int) -> CaseDelta:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def update(
+        self,
+        case_id: int,
+        title: str,
+        description: str,
+        status: str,
+    ) -> Optional[Case]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete(self, case_id: int) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def update_unless_closed(
+        self,
+        case_id: int,
+        title: str,
+        description: str,
+        status: str,
+        expected_version: Optional[int] = None,
+    ) -> Tuple[MutationOutcome, Optional[Case]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete_unless_closed(self, case_id: int) -> MutationOutcome:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def create_many(self, items: Sequence[Tuple[str, str, str]]) -> List[Case]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def update_status_many(
+        self,
+        case_ids: Sequence[int],
+        status: str,
+    ) -> Dict[int, MutationOutcome]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete_many(self, case_ids: Sequence[int]) -> Dict[int, MutationOutcome]:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release resources such as worker threads."""
@@ -0,0 +1,238 @@
+# backend_api\response_cache.py
+"""
+HTTP response cache for read endpoints.
+
+Purpose: serve repeated reads between writes without touching storage
+- Entries are keyed on route and query parameters and tagged with the
+  service's write generation; once any write bumps it, every entry is stale
+- Each entry keeps the encoded JSON body, its ETag and extra headers,
+  plus gzip (and brotli, when installed) copies compressed on first use
+- `serve` answers If-None-Match with 304, picks the best encoding the
+  client accepts, and honors Cache-Control: no-cache / no-store
+- Framework-free: requests come in as a path, query pairs and headers,
+  and replies go out as a CacheReply that main.py turns into a Response
+- Entries also expire after `ttl` seconds, which bounds staleness from
+  writes the generation cannot see (other processes, a lagging replica)
+
+Rule: bodies must be complete responses; nothing here knows about cases.
+"""
+
+import gzip
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Hashable, Iterable, Mapping, Optional, Tuple
+
+try:
+    import brotli
+except ImportError:  # optional; gzip is always available
+    brotli = None
+
+
+# Smaller bodies are sent as they are; compressing them gains little
+MIN_COMPRESS_SIZE = 1024
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+# Best first
+_ENCODERS: Dict[str, Callable[[bytes], bytes]] = {}
+if brotli is not None:
+    _ENCODERS["br"] = lambda body: brotli.compress(body, quality=BROTLI_QUALITY)
+_ENCODERS["gzip"] = lambda body: gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+@dataclass
+class ResponseCacheStats:
+    hits: int
+    misses: int
+    not_modified: int
+    size: int
+
+
+@dataclass
+class CacheReply:
+    """What to send back; main.py wraps it in a framework response."""
+
+    status_code: int
+    body: bytes
+    headers: Dict[str, str]
+    # None for a 304, which has no body
+    media_type: Optional[str]
+
+
+class CachedResponse:
+    __slots__ = ("body", "etag", "headers", "media_type", "created_at", "_encoded", "_lock")
+
+    def __init__(self, body: bytes, headers: Dict[str, str], media_type: str):
+        self.body = body
+        self.etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+        self.headers = headers
+        self.media_type = media_type
+        self.created_at = time.monotonic()
+        self._encoded: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    def encoded(self, encoding: str) -> bytes:
+        """The body in `encoding`, compressed once and then reused."""
+        with self._lock:
+            body = self._encoded.get(encoding)
+            if body is None:
+                body = self._encoded[encoding] = _ENCODERS[encoding](self.body)
+            return body
+
+
+def accepted_encoding(accept_encoding: str) -> Optional[str]:
+    """The best supported encoding allowed by an Accept-Encoding header."""
+    allowed = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        allowed[name.strip().lower()] = quality
+
+    for encoding in _ENCODERS:
+        if allowed.get(encoding, allowed.get("*", 0.0)) > 0:
+            return encoding
+    return None
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    return etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+
+
+class ResponseCache:
+    def __init__(self, max_entries: int = 256, ttl: Optional[float] = 30.0):
+        if max_entries < 1:
+            raise ValueError("Cache size must be at least 1")
+
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, CachedResponse]" = OrderedDict()
+        self._generation: Optional[int] = None
+        self._hits = 0
+        self._misses = 0
+        self._not_modified = 0
+
+    def stats(self) -> ResponseCacheStats:
+        with self._lock:
+            return ResponseCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                not_modified=self._not_modified,
+                size=len(self._entries),
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _sync_generation(self, generation: int) -> None:
+        # Callers hold the lock. Entries from an older generation can
+        # never be served again, so they are dropped all at once.
+        if generation != self._generation:
+            self._entries.clear()
+            self._generation = generation
+
+    def get(self, key: Hashable, generation: int) -> Optional[CachedResponse]:
+        with self._lock:
+            self._sync_generation(generation)
+            entry = self._entries.get(key)
+            if entry is not None and (
+                self._ttl is not None and time.monotonic() - entry.created_at > self._ttl
+            ):
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry
+
+    def put(
+        self,
+        key: Hashable,
+        generation: int,
+        body: bytes,
+        headers: Optional[Dict[str, str]] = None,
+        media_type: str = "application/json",
+    ) -> CachedResponse:
+        entry = CachedResponse(body, headers or {}, media_type)
+        with self._lock:
+            if self._generation is not None and generation < self._generation:
+                # A write finished while this body was built; it may be stale
+                return entry
+            self._sync_generation(generation)
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    async def serve(
+        self,
+        path: str,
+        query: Iterable[Tuple[str, str]],
+        request_headers: Mapping[str, str],
+        generation: int,
+        build: Callable[[], Awaitable[Tuple[bytes, Dict[str, str]]]],
+        bypass: bool = False,
+    ) -> CacheReply:
+        """
+        Answer a GET from the cache, or call `build` for (body, headers)
+        and cache the result.
+
+        `query` holds the (name, value) pairs of the query string, in any
+        order; `request_headers` are read by lower-case name (Starlette's
+        request.headers qualifies). Cache-Control: no-cache from the client
+        rebuilds the body and refreshes the entry; no-store (or `bypass`)
+        rebuilds it without caching it.
+        """
+        key = (path, tuple(sorted(query)))
+        directives = request_headers.get("cache-control", "").lower()
+        no_store = bypass or "no-store" in directives
+        no_cache = no_store or "no-cache" in directives
+
+        entry = None if no_cache else self.get(key, generation)
+        if entry is None:
+            body, headers = await build()
+            if no_store:
+                entry = CachedResponse(body, headers, "application/json")
+            else:
+                entry = self.put(key, generation, body, headers)
+
+        return self._respond(request_headers, entry)
+
+    def _respond(self, request_headers: Mapping[str, str], entry: CachedResponse) -> CacheReply:
+        headers = {
+            **entry.headers,
+            "ETag": entry.etag,
+            # Shared caches must not serve other clients' or stale copies
+            "Cache-Control": "private, no-cache",
+            "Vary": "Accept-Encoding",
+        }
+
+        if_none_match = request_headers.get("if-none-match")
+        if if_none_match is not None and _etag_matches(if_none_match, entry.etag):
+            with self._lock:
+                self._not_modified += 1
+            return CacheReply(304, b"", headers, None)
+
+        body = entry.body
+        if len(body) >= MIN_COMPRESS_SIZE:
+            encoding = accepted_encoding(request_headers.get("accept-encoding", ""))
+            if encoding is not None:
+                body = entry.encoded(encoding)
+                headers["Content-Encoding"] = encoding
+
+        return CacheReply(200, body, headers, entry.media_type)
@@ -8,14 +8,23 @@ Purpose:
 - Used by FastAPI for request and response validation
 """
 
-from pydantic import BaseModel, ConfigDict, field_validator
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 # If you want to use Enum types in schemas
 from enum import Enum
 
+from backend_api.models import ChangeOperation
+
 class CaseStatus(str, Enum):
     open = "open"
     closed = "closed"
 
+# Output formats for GET /cases/export
+class ExportFormat(str, Enum):
+    ndjson = "ndjson"
+    json = "json"
+
 # Used when the client sends POST (no id yet)
 class CaseCreate(BaseModel):        
     title: str
@@ -38,4 +47,82 @@ class CaseRead(BaseModel):
 
     # It's okay to read values ​​from `object.attribute`
     # not just from dict
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+# Response of GET /cases/stats; every status is listed, even at zero
+class CaseStats(BaseModel):
+    total: int
+    by_status: Dict[CaseStatus, int]
+
+# One ranked result from GET /cases/search
+class CaseSearchHit(BaseModel):
+    case: CaseRead
+    score: float
+    # Matches are wrapped in <mark>...</mark>
+    snippet: str
+
+# One entry of GET /cases/changes
+class CaseChangeRead(BaseModel):
+    seq: int
+    case_id: int
+    operation: ChangeOperation
+    changed_at: str
+    # The case after the change; both None for deletes
+    version: Optional[int] = None
+    case: Optional[CaseRead] = None
+
+# GET /cases/?modified_since=...: what changed, for clients keeping a copy
+class CaseDeltaRead(BaseModel):
+    cases: List[CaseRead]
+    # IDs of deleted cases (tombstones)
+    deleted: List[int]
+    # Pass as modified_since next time
+    cursor: int
+    has_more: bool
+
+# One entry of GET /admin/slow-queries
+class SlowQueryRead(BaseModel):
+    sql: str
+    # Parameter types only, e.g. "(int, str)"; values are never logged
+    params: str
+    rows: int
+    duration_ms: float
+    vm_steps: int
+    plan: List[str]
+    recorded_at: float
+
+# Upper bound for items in one bulk request
+MAX_BULK_ITEMS = 1000
+
+
+def _unique_ids(ids: List[int]) -> List[int]:
+    # A repeated ID would be reported (and counted) once per copy
+    if len(set(ids)) != len(ids):
+        raise ValueError("Case IDs must be unique")
+    return ids
+
+# Used by PATCH-style bulk status updates
+class BulkStatusUpdate(BaseModel):
+    ids: List[int] = Field(min_length=1, max_length=MAX_BULK_ITEMS)
+    status: CaseStatus
+
+    _check_ids = field_validator("ids")(_unique_ids)
+
+# Used by bulk deletes
+class BulkDelete(BaseModel):
+    ids: List[int] = Field(min_length=1, max_length=MAX_BULK_ITEMS)
+
+    _check_ids = field_validator("ids")(_unique_ids)
+
+# One entry per submitted item, in submission order
+class BulkItemRead(BaseModel):
+    index: int
+    id: Optional[int] = None
+    ok: bool
+    case: Optional[CaseRead] = None
+    error: Optional[str] = None
+
+class BulkResponse(BaseModel):
+    succeeded: int
+    failed: int
+    results: List[BulkItemRead]
@@ -0,0 +1,69 @@
+# backend_api\serialization.py
+"""
+Fast JSON encoding for case responses.
+
+Purpose: keep pydantic out of the hot path of list and read endpoints
+- Cases come from the repository, whose input was validated on the way in,
+  so responses are not validated a second time
+- Each case becomes a plain dict and the whole body is encoded by
+  pydantic-core in one call (no per-object model_validate, no
+  jsonable_encoder)
+- Functions return bytes; main.py wraps them in responses
+Rule: `case_to_dict` / `change_to_dict` / `delta_json` must produce exactly
+the CaseRead / CaseChangeRead / CaseDeltaRead shapes; the unit tests
+compare them.
+"""
+
+from typing import Any, Dict, Iterable
+
+import pydantic_core
+
+from backend_api.models import Case, CaseChange, CaseDelta
+
+
+def case_to_dict(case: Case) -> Dict[str, Any]:
+    return {
+        "id": case.id,
+        "title": case.title,
+        "description": case.description,
+        "status": case.status,
+    }
+
+
+def case_json(case: Case) -> bytes:
+    return pydantic_core.to_json(case_to_dict(case))
+
+
+def cases_json(cases: Iterable[Case]) -> bytes:
+    return pydantic_core.to_json([case_to_dict(case) for case in cases])
+
+
+def delta_json(delta: CaseDelta) -> bytes:
+    return pydantic_core.to_json(
+        {
+            "cases": [case_to_dict(case) for case in delta.cases],
+            "deleted": delta.deleted,
+            "cursor": delta.cursor,
+            "has_more": delta.has_more,
+        }
+    )
+
+
+def change_to_dict(change: CaseChange) -> Dict[str, Any]:
+    case = change.case
+    return {
+        "seq": change.seq,
+        "case_id": change.case_id,
+        "operation": change.operation.value,
+        "changed_at": change.changed_at,
+        "version": case.version if case is not None else None,
+        "case": case_to_dict(case) if case is not None else None,
+    }
+
+
+def change_json(change: CaseChange) -> bytes:
+    return pydantic_core.to_json(change_to_dict(change))
+
+
+def changes_json(changes: Iterable[CaseChange]) -> bytes:
+    return pydantic_core.to_json([change_to_dict(change) for change in changes])
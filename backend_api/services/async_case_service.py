@@ -0,0 +1,169 @@
+# backend_api\services\async_case_service.py
+"""
+Async service layer for Case Domain.
+
+Responsibilities:
+- Same business rules as CaseService (shared helpers, not copies)
+- Await an AsyncCaseRepository so request handlers never block
+- Remain free of HTTP concerns
+"""
+
+from typing import AsyncIterator, Dict, List, Optional, Sequence, Tuple
+
+from backend_api.models import Case, CaseChange, CaseDelta, SearchHit
+from backend_api.repository_contract import AsyncCaseRepository
+from backend_api.services.case_service import (
+    BulkItemResult,
+    WriteGeneration,
+    bulk_results,
+    check_delete_outcome,
+    check_update_outcome,
+    clean_title,
+    finish_bulk_create,
+    mutation,
+    prepare_bulk_create,
+    split_page,
+)
+
+
+class AsyncCaseService:
+    def __init__(self, repository: AsyncCaseRepository):
+        self._repository = repository
+        self.generation = WriteGeneration()
+
+    def close(self) -> None:
+        self._repository.close()
+
+    @mutation
+    async def create_case(self, title: str, description: str, status: str) -> Case:
+        return await self._repository.create(
+            title=clean_title(title),
+            description=description,
+            status=status,
+        )
+
+    async def get_case(self, case_id: int) -> Optional[Case]:
+        return await self._repository.get_by_id(case_id)
+
+    async def get_all_cases(self) -> List[Case]:
+        return await self._repository.get_all()
+
+    async def count_cases(self) -> int:
+        return await self._repository.count()
+
+    async def count_cases_by_status(self) -> Dict[str, int]:
+        return await self._repository.count_by_status()
+
+    def export_cases(self, batch_size: int = 500) -> AsyncIterator[Case]:
+        """Stream every case without loading the whole table."""
+        if batch_size < 1:
+            raise ValueError("Batch size must be at least 1")
+
+        return self._repository.iter_all(batch_size=batch_size)
+
+    async def list_cases(
+        self,
+        limit: int,
+        after: Optional[int] = None,
+        status: Optional[str] = None,
+    ) -> Tuple[List[Case], Optional[int]]:
+        if limit < 1:
+            raise ValueError("Limit must be at least 1")
+
+        cases = await self._repository.get_page(limit + 1, after=after, status=status)
+        return split_page(cases, limit)
+
+    async def search_cases(
+        self,
+        query: str,
+        limit: int,
+        offset: int = 0,
+    ) -> Tuple[List[SearchHit], Optional[int]]:
+        """
+        Return one page of ranked search hits and the next offset, or None.
+        """
+        if not query or not query.strip():
+            raise ValueError("Search query cannot be empty")
+        if limit < 1:
+            raise ValueError("Limit must be at least 1")
+
+        hits = await self._repository.search(query, limit + 1, offset=offset)
+        if len(hits) > limit:
+            return hits[:limit], offset + limit
+        return hits, None
+
+    async def list_changes(self, after: int = 0, limit: int = 100) -> List[CaseChange]:
+        """
+        Return the changes after sequence number `after`, oldest first.
+
+        Pass the last returned `seq` as `after` to continue; an empty list
+        means the caller is up to date.
+        """
+        if after < 0:
+            raise ValueError("Change cursor cannot be negative")
+        if limit < 1:
+            raise ValueError("Limit must be at least 1")
+
+        return await self._repository.get_changes(after, limit)
+
+    async def last_change(self) -> int:
+        return await self._repository.last_change()
+
+    async def list_modified_since(self, row_version: int = 0, limit: int = 100) -> CaseDelta:
+        """
+        Return the cases changed and deleted after `row_version`.
+
+        Start with 0 for a full sync, then pass the returned cursor;
+        `has_more` means the next call has more to fetch right away.
+        """
+        if row_version < 0:
+            raise ValueError("Row version cannot be negative")
+        if limit < 1:
+            raise ValueError("Limit must be at least 1")
+
+        return await self._repository.get_modified_since(row_version, limit)
+
+    @mutation
+    async def update_case(
+        self,
+        case_id: int,
+        title: str,
+        description: str,
+        status: str,
+        expected_version: Optional[int] = None,
+    ) -> Optional[Case]:
+        outcome, case = await self._repository.update_unless_closed(
+            case_id,
+            title=clean_title(title),
+            description=description,
+            status=status,
+            expected_version=expected_version,
+        )
+        return check_update_outcome(outcome, case)
+
+    @mutation
+    async def delete_case(self, case_id: int) -> bool:
+        return check_delete_outcome(await self._repository.delete_unless_closed(case_id))
+
+    @mutation
+    async def create_cases(
+        self,
+        items: Sequence[Tuple[str, str, str]],
+    ) -> List[BulkItemResult]:
+        results, valid_indexes, valid_items = prepare_bulk_create(items)
+        created = await self._repository.create_many(valid_items)
+        return finish_bulk_create(results, valid_indexes, created)
+
+    @mutation
+    async def update_case_statuses(
+        self,
+        case_ids: Sequence[int],
+        status: str,
+    ) -> List[BulkItemResult]:
+        outcomes = await self._repository.update_status_many(case_ids, status)
+        return bulk_results(case_ids, outcomes, "Closed cases cannot be updated")
+
+    @mutation
+    async def delete_cases(self, case_ids: Sequence[int]) -> List[BulkItemResult]:
+        outcomes = await self._repository.delete_many(case_ids)
+        return bulk_results(case_ids, outcomes, "Closed cases cannot be deleted")
@@ -8,18 +8,191 @@ Responsibilities:
 - Remain free of HTTP concerns
 """
 
+import functools
+import inspect
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+from backend_api.models import Case, CaseChange, CaseDelta, MutationOutcome, SearchHit
 from backend_api.repository_contract import CaseRepository
 
+
+F = TypeVar("F", bound=Callable)
+
+
+class WriteGeneration:
+    """
+    Counter bumped after every write through the service.
+
+    Anything derived from reads (e.g. cached HTTP responses) can be keyed
+    on the current value and is stale once it moves on.
+    """
+
+    def __init__(self):
+        self._value = 0
+        self._lock = threading.Lock()
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+    def bump(self) -> None:
+        with self._lock:
+            self._value += 1
+
+
+def mutation(method: F) -> F:
+    """
+    Mark a service method as a write: bump the write generation after it.
+
+    Also bumped when the write fails; a needless invalidation is cheap,
+    a missed one serves stale data.
+    """
+    if inspect.iscoroutinefunction(method):
+        @functools.wraps(method)
+        async def async_wrapper(self, *args, **kwargs):
+            try:
+                return await method(self, *args, **kwargs)
+            finally:
+                self.generation.bump()
+
+        return async_wrapper
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self.generation.bump()
+
+    return wrapper
+
+
+class VersionConflictError(Exception):
+    """Raised when a case changed since the version the caller last saw."""
+
+
+@dataclass
+class BulkItemResult:
+    """Outcome of one item in a bulk operation."""
+
+    index: int
+    case_id: Optional[int]
+    case: Optional[Case] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+# Business rules shared by CaseService and AsyncCaseService. They work on
+# repository results only, so both services enforce exactly the same rules.
+
+def clean_title(title: str) -> str:
+    if not title or not title.strip():
+        raise ValueError("Case title cannot be empty")
+    return title.strip()
+
+
+def split_page(
+    cases: List[Case],
+    limit: int,
+) -> Tuple[List[Case], Optional[int]]:
+    """Trim a page fetched with limit + 1 rows and derive the next cursor."""
+    if len(cases) > limit:
+        cases = cases[:limit]
+        return cases, cases[-1].id
+    return cases, None
+
+
+def check_update_outcome(
+    outcome: MutationOutcome,
+    case: Optional[Case],
+) -> Optional[Case]:
+    if outcome is MutationOutcome.not_found:
+        return None
+
+    if outcome is MutationOutcome.closed:
+        raise ValueError("Closed cases cannot be updated")
+
+    if outcome is MutationOutcome.conflict:
+        raise VersionConflictError("Case was modified by another request")
+
+    return case
+
+
+def check_delete_outcome(outcome: MutationOutcome) -> bool:
+    if outcome is MutationOutcome.not_found:
+        return False
+
+    if outcome is MutationOutcome.closed:
+        raise ValueError("Closed cases cannot be deleted")
+
+    return True
+
+
+def prepare_bulk_create(
+    items: Sequence[Tuple[str, str, str]],
+) -> Tuple[List[Optional[BulkItemResult]], List[int], List[Tuple[str, str, str]]]:
+    """
+    Validate bulk create items.
+
+    Returns the result slots (filled for rejected items), the indexes of
+    valid items and the cleaned valid items.
+    """
+    results: List[Optional[BulkItemResult]] = [None] * len(items)
+    valid_indexes = []
+    valid_items = []
+
+    for index, (title, description, status) in enumerate(items):
+        try:
+            title = clean_title(title)
+        except ValueError as e:
+            results[index] = BulkItemResult(index, None, error=str(e))
+            continue
+        valid_indexes.append(index)
+        valid_items.append((title, description, status))
+
+    return results, valid_indexes, valid_items
+
+
+def finish_bulk_create(
+    results: List[Optional[BulkItemResult]],
+    valid_indexes: List[int],
+    created: List[Case],
+) -> List[BulkItemResult]:
+    for index, case in zip(valid_indexes, created):
+        results[index] = BulkItemResult(index, case.id, case=case)
+    return results
+
+
+def bulk_results(
+    case_ids: Sequence[int],
+    outcomes: Dict[int, MutationOutcome],
+    closed_error: str,
+) -> List[BulkItemResult]:
+    errors = {
+        MutationOutcome.applied: None,
+        MutationOutcome.not_found: "Case not found",
+        MutationOutcome.closed: closed_error,
+    }
+    return [
+        BulkItemResult(index, case_id, error=errors[outcomes[case_id]])
+        for index, case_id in enumerate(case_ids)
+    ]
+
+
 class CaseService:
     def __init__(self, repository: CaseRepository):
         self._repository = repository
+        self.generation = WriteGeneration()
 
+    @mutation
     def create_case(self, title: str, description: str, status: str):
-        if not title or not title.strip():
-            raise ValueError("Case title cannot be empty")
-        
         return self._repository.create(
-            title=title.strip(),
+            title=clean_title(title),
             description=description,
             status=status,
         )
@@ -29,31 +202,137 @@ class CaseService:
     
     def get_all_cases(self):
         return self._repository.get_all()
+
+    def count_cases(self) -> int:
+        return self._repository.count()
+
+    def count_cases_by_status(self) -> Dict[str, int]:
+        return self._repository.count_by_status()
+
+    def export_cases(self, batch_size: int = 500) -> Iterator[Case]:
+        """Stream every case without loading the whole table."""
+        if batch_size < 1:
+            raise ValueError("Batch size must be at least 1")
+
+        return self._repository.iter_all(batch_size=batch_size)
+
+    def list_cases(
+        self,
+        limit: int,
+        after: Optional[int] = None,
+        status: Optional[str] = None,
+    ) -> Tuple[List[Case], Optional[int]]:
+        """
+        Return one page of cases and the cursor for the next page.
+
+        The cursor is None when there are no more cases.
+        """
+        if limit < 1:
+            raise ValueError("Limit must be at least 1")
+
+        # Fetch one extra row to know whether another page exists
+        cases = self._repository.get_page(limit + 1, after=after, status=status)
+        return split_page(cases, limit)
     
-    def update_case(self, case_id: int, title: str, description: str, status: str):
-        case = self._repository.get_by_id(case_id)
-        if case is None:
-            return None
-        
-        if case.status.lower() == "closed":
-            raise ValueError("Closed cases cannot be updated")
-        
-        if not title or not title.strip():
-            raise ValueError("Case title cannot be empty")
-        
-        return self._repository.update(
+    def search_cases(
+        self,
+        query: str,
+        limit: int,
+        offset: int = 0,
+    ) -> Tuple[List[SearchHit], Optional[int]]:
+        """
+        Return one page of ranked search hits and the next offset, or None.
+        """
+        if not query or not query.strip():
+            raise ValueError("Search query cannot be empty")
+        if limit < 1:
+            raise ValueError("Limit must be at least 1")
+
+        hits = self._repository.search(query, limit + 1, offset=offset)
+        if len(hits) > limit:
+            return hits[:limit], offset + limit
+        return hits, None
+
+    def list_changes(self, after: int = 0, limit: int = 100) -> List[CaseChange]:
+        """
+        Return the changes after sequence number `after`, oldest first.
+
+        Pass the last returned `seq` as `after` to continue; an empty list
+        means the caller is up to date.
+        """
+        if after < 0:
+            raise ValueError("Change cursor cannot be negative")
+        if limit < 1:
+            raise ValueError("Limit must be at least 1")
+
+        return self._repository.get_changes(after, limit)
+
+    def last_change(self) -> int:
+        return self._repository.last_change()
+
+    def list_modified_since(self, row_version: int = 0, limit: int = 100) -> CaseDelta:
+        """
+        Return the cases changed and deleted after `row_version`.
+
+        Start with 0 for a full sync, then pass the returned cursor;
+        `has_more` means the next call has more to fetch right away.
+        """
+        if row_version < 0:
+            raise ValueError("Row version cannot be negative")
+        if limit < 1:
+            raise ValueError("Limit must be at least 1")
+
+        return self._repository.get_modified_since(row_version, limit)
+
+    @mutation
+    def update_case(
+        self,
+        case_id: int,
+        title: str,
+        description: str,
+        status: str,
+        expected_version: Optional[int] = None,
+    ):
+        # The closed-case and version rules are checked by the repository in
+        # the same statement as the write, so concurrent requests cannot race
+        outcome, case = self._repository.update_unless_closed(
             case_id,
-            title=title.strip(),
+            title=clean_title(title),
             description=description,
             status=status,
+            expected_version=expected_version,
         )
-    
+        return check_update_outcome(outcome, case)
+
+    @mutation
     def delete_case(self, case_id: int) -> bool:
-        case = self._repository.get_by_id(case_id)
-        if case is None:
-            return False
-        
-        if case.status == "closed":
-            raise ValueError("Closed cases cannot be deleted")
-        
-        return self._repository.delete(case_id)
\ No newline at end of file
+        return check_delete_outcome(self._repository.delete_unless_closed(case_id))
+
+    @mutation
+    def create_cases(
+        self,
+        items: Sequence[Tuple[str, str, str]],
+    ) -> List[BulkItemResult]:
+        """
+        Create many cases in one transaction.
+
+        Items that break a rule are reported and skipped; the rest are
+        created together.
+        """
+        results, valid_indexes, valid_items = prepare_bulk_create(items)
+        created = self._repository.create_many(valid_items)
+        return finish_bulk_create(results, valid_indexes, created)
+
+    @mutation
+    def update_case_statuses(
+        self,
+        case_ids: Sequence[int],
+        status: str,
+    ) -> List[BulkItemResult]:
+        outcomes = self._repository.update_status_many(case_ids, status)
+        return bulk_results(case_ids, outcomes, "Closed cases cannot be updated")
+
+    @mutation
+    def delete_cases(self, case_ids: Sequence[int]) -> List[BulkItemResult]:
+        outcomes = self._repository.delete_many(case_ids)
+        return bulk_results(case_ids, outcomes, "Closed cases cannot be deleted")
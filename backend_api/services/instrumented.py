@@ -0,0 +1,58 @@
+# backend_api\services\instrumented.py
+"""
+Timing decorator for AsyncCaseService.
+
+Purpose: per-method service timings for GET /metrics
+- `case_service_duration_seconds{method}`: latency histogram, including
+  the repository work the method awaits
+- `case_service_errors_total{method, error}`: rejected or failed calls,
+  by exception type (ValueError = business rule, ...)
+Every coroutine method of the wrapped service is timed; anything else
+(export_cases' async iterator, close) is passed through.
+"""
+
+import functools
+import inspect
+import time
+
+from backend_api.metrics import MetricsRegistry
+from backend_api.services.async_case_service import AsyncCaseService
+
+
+class InstrumentedCaseService:
+    def __init__(self, service: AsyncCaseService, metrics: MetricsRegistry):
+        self._service = service
+        self._duration = metrics.histogram(
+            "case_service_duration_seconds",
+            "Time spent in CaseService methods.",
+            ("method",),
+        )
+        self._errors = metrics.counter(
+            "case_service_errors_total",
+            "CaseService calls that raised, by exception type.",
+            ("method", "error"),
+        )
+
+    @property
+    def inner(self) -> AsyncCaseService:
+        return self._service
+
+    def __getattr__(self, name: str):
+        attribute = getattr(self._service, name)
+        if not inspect.iscoroutinefunction(attribute):
+            return attribute
+
+        @functools.wraps(attribute)
+        async def timed(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return await attribute(*args, **kwargs)
+            except Exception as e:
+                self._errors.inc(name, type(e).__name__)
+                raise
+            finally:
+                self._duration.observe(time.perf_counter() - started, name)
+
+        # Cache the wrapper; __getattr__ only runs for missing attributes
+        setattr(self, name, timed)
+        return timed
@@ -0,0 +1,169 @@
+# backend_api\settings.py
+"""
+Application settings, read once at startup.
+
+Purpose: choose and tune the storage backend without code changes
+- Every field has a default, so an empty environment behaves as before
+- `load_settings` reads the file named by CASES_SETTINGS_FILE (TOML or
+  JSON) if set, then CASES_<FIELD> environment variables, which win
+- Values are converted to the field's type; unknown keys and bad values
+  raise ValueError at startup instead of being ignored
+
+Examples:
+    CASES_BACKEND=memory                    # RAM only, nothing persisted
+    CASES_DATABASE_PATH=/dev/shm/cases.db   # tmpfs-backed SQLite
+    CASES_PRAGMA_PROFILE=throughput         # fsync at checkpoints only
+"""
+
+import json
+import os
+import tomllib
+import typing
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping, Optional
+
+from backend_api.db import DATABASE_PATH, DEFAULT_PRAGMA_PROFILE, get_pragma_profile
+
+
+ENV_PREFIX = "CASES_"
+SETTINGS_FILE_ENV = "CASES_SETTINGS_FILE"
+
+READ_CONNECTION_MODES = ("primary", "readonly", "snapshot")
+
+_TRUE = ("1", "true", "yes", "on")
+_FALSE = ("0", "false", "no", "off")
+_NONE = ("", "none", "null")
+
+
+@dataclass(frozen=True)
+class Settings:
+    # Storage backend, see backend_api.backends ("sqlite", "sqlite-group", "memory")
+    backend: str = "sqlite"
+    database_path: str = DATABASE_PATH
+    pragma_profile: str = DEFAULT_PRAGMA_PROFILE
+    pool_size: int = 5
+    pool_timeout: float = 30.0
+    # Where plain reads go:
+    # - "primary": the write pool
+    # - "readonly": a separate pool of mode=ro connections to the same file
+    # - "snapshot": a private copy refreshed every snapshot_refresh_interval
+    #   seconds, so reads never touch the file the writers use (reads lag)
+    read_connections: str = "readonly"
+    read_pool_size: int = 4
+    snapshot_refresh_interval: Optional[float] = 5.0
+    # sqlite-group: writes are committed in batches of up to max_batch,
+    # waiting at most max_delay seconds
+    group_commit_max_batch: int = 64
+    group_commit_max_delay: float = 0.001
+    # memory: start from this snapshot file (if it exists) and write the
+    # cases back to it on shutdown; None keeps nothing across restarts
+    memory_snapshot_path: Optional[str] = None
+    # Read-through cache of cases by ID; 0 turns it off
+    case_cache_size: int = 10_000
+    case_cache_ttl: float = 30.0
+    # Executor threads for reads when the backend has no read pool
+    reader_threads: int = 4
+    # Encoded GET /cases/ bodies, reused until the next write (or the TTL)
+    response_cache_enabled: bool = True
+    response_cache_size: int = 256
+    response_cache_ttl: float = 30.0
+    # False: no registry is created, nothing is wrapped and /metrics is 404
+    metrics_enabled: bool = True
+    # Statements slower than the threshold (seconds) are kept, with their
+    # query plan, for GET /admin/slow-queries. Off by default: every
+    # statement pays for the timing when it is on.
+    slow_query_log_enabled: bool = False
+    slow_query_threshold: float = 0.05
+    slow_query_log_size: int = 100
+    # Open change streams share one change-log reader that polls this often
+    change_feed_poll_interval: float = 0.5
+    # Seconds between SSE keep-alive comments on an idle stream
+    change_feed_heartbeat: float = 15.0
+
+    def __post_init__(self):
+        get_pragma_profile(self.pragma_profile)
+        if self.read_connections not in READ_CONNECTION_MODES:
+            raise ValueError(f"Unknown read connections {self.read_connections!r}")
+        for name in ("pool_size", "read_pool_size", "group_commit_max_batch", "reader_threads"):
+            if getattr(self, name) < 1:
+                raise ValueError(f"Setting {name} must be at least 1")
+
+
+_FIELD_TYPES = typing.get_type_hints(Settings)
+
+
+def _convert(name: str, value: Any) -> Any:
+    """Convert a file or environment value to the type of field `name`."""
+    kind = _FIELD_TYPES[name]
+    optional = typing.get_origin(kind) is typing.Union
+    if optional:
+        kind = next(arg for arg in typing.get_args(kind) if arg is not type(None))
+
+    if isinstance(value, str):
+        text = value.strip()
+        if optional and text.lower() in _NONE:
+            return None
+        if kind is bool:
+            if text.lower() in _TRUE:
+                return True
+            if text.lower() in _FALSE:
+                return False
+        elif kind is str:
+            return text
+        else:
+            try:
+                return kind(text)
+            except ValueError:
+                pass
+        raise ValueError(f"Setting {name} expects {kind.__name__}, got {value!r}")
+
+    if value is None and optional:
+        return None
+    # bool is an int subclass; a number is not a valid flag and vice versa
+    if kind is bool and isinstance(value, bool):
+        return value
+    if kind is int and isinstance(value, int) and not isinstance(value, bool):
+        return value
+    if kind is float and isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    raise ValueError(f"Setting {name} expects {kind.__name__}, got {value!r}")
+
+
+def _read_file(path: str) -> Dict[str, Any]:
+    with open(path, "rb") as f:
+        if path.endswith(".json"):
+            values = json.load(f)
+        else:
+            values = tomllib.load(f)
+    if not isinstance(values, dict):
+        raise ValueError(f"Settings file {path} must hold a table of settings")
+    return values
+
+
+def load_settings(
+    environ: Mapping[str, str] = os.environ,
+    path: Optional[str] = None,
+) -> Settings:
+    """
+    Build Settings from a file and the environment.
+
+    `path` defaults to CASES_SETTINGS_FILE; without either, only the
+    environment (and the defaults) apply.
+    """
+    values: Dict[str, Any] = {}
+    path = path or environ.get(SETTINGS_FILE_ENV)
+    if path:
+        for name, value in _read_file(path).items():
+            if name not in _FIELD_TYPES:
+                raise ValueError(f"Unknown setting {name!r} in {path}")
+            values[name] = _convert(name, value)
+
+    for key, value in environ.items():
+        if not key.startswith(ENV_PREFIX) or key == SETTINGS_FILE_ENV:
+            continue
+        name = key[len(ENV_PREFIX):].lower()
+        if name not in _FIELD_TYPES:
+            raise ValueError(f"Unknown setting {key}")
+        values[name] = _convert(name, value)
+
+    return Settings(**values)
@@ -0,0 +1,258 @@
+# backend_api\slow_query_log.py
+"""
+Slow-query log for SQLite connections.
+
+Purpose: catch expensive statements (e.g. full table scans) as they happen
+- `SlowQueryLog.connect()` opens a connection whose cursors time every
+  statement: execute plus every fetch, so lazily stepped SELECTs are
+  measured in full (time the caller spends between fetches is excluded)
+- Statements at or above `threshold` seconds are kept in a bounded ring
+  buffer with their SQL, parameter shape (types only, never values), row
+  count, SQLite VM work and EXPLAIN QUERY PLAN output
+- VM work comes from sqlite3's progress handler, counted per
+  `PROGRESS_STEP` virtual machine instructions
+
+No query is changed: ConnectionPool opens its connections through the
+log when one is configured, so every repository query is covered.
+"""
+
+import sqlite3
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, List, Optional, Sequence
+
+
+# VM instructions between two progress-handler calls
+PROGRESS_STEP = 1000
+
+
+@dataclass(slots=True)
+class SlowQuery:
+    sql: str
+    params: str
+    rows: int
+    duration: float
+    # Approximate SQLite VM instructions (a multiple of PROGRESS_STEP)
+    vm_steps: int
+    plan: List[str]
+    recorded_at: float = field(default_factory=time.time)
+
+
+def params_shape(parameters: Any) -> str:
+    """Describe bound parameters by type, e.g. "(int, str)"; values are never kept."""
+    if parameters is None:
+        return "()"
+    if isinstance(parameters, dict):
+        return "{" + ", ".join(
+            f"{name}: {type(value).__name__}" for name, value in parameters.items()
+        ) + "}"
+    return "(" + ", ".join(type(value).__name__ for value in parameters) + ")"
+
+
+def _many_shape(seq_of_parameters: Any) -> str:
+    if isinstance(seq_of_parameters, Sequence):
+        first = params_shape(seq_of_parameters[0]) if seq_of_parameters else "()"
+        return f"{len(seq_of_parameters)} x {first}"
+    return "iterator"
+
+
+class SlowQueryLog:
+    def __init__(self, threshold: float = 0.05, capacity: int = 100):
+        if capacity < 1:
+            raise ValueError("Capacity must be at least 1")
+
+        self.threshold = threshold
+        self._lock = threading.Lock()
+        self._entries: Deque[SlowQuery] = deque(maxlen=capacity)
+        self._recorded = 0
+
+    @property
+    def recorded(self) -> int:
+        """Slow statements seen since start, including evicted ones."""
+        with self._lock:
+            return self._recorded
+
+    def connect(self, database: str, **kwargs) -> sqlite3.Connection:
+        """Open a connection whose statements are checked against this log."""
+        conn = sqlite3.connect(database, factory=SlowQueryConnection, **kwargs)
+        conn.slow_query_log = self
+        conn.set_progress_handler(conn._count_progress, PROGRESS_STEP)
+        return conn
+
+    def record(self, entry: SlowQuery) -> None:
+        with self._lock:
+            self._entries.append(entry)
+            self._recorded += 1
+
+    def entries(self) -> List[SlowQuery]:
+        """Recorded statements, newest first."""
+        with self._lock:
+            return list(reversed(self._entries))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class _PendingStatement:
+    __slots__ = ("sql", "params", "plan_params", "elapsed", "rows", "steps_at_start")
+
+    def __init__(self, sql, params, plan_params, steps_at_start):
+        self.sql = sql
+        self.params = params
+        self.plan_params = plan_params
+        self.elapsed = 0.0
+        self.rows = 0
+        self.steps_at_start = steps_at_start
+
+
+class TimedCursor(sqlite3.Cursor):
+    """Cursor that reports its statements to the connection's SlowQueryLog."""
+
+    _pending: Optional[_PendingStatement] = None
+
+    def _begin(self, sql: str, params: str, plan_params: Any) -> None:
+        self._finish()
+        self._pending = _PendingStatement(
+            sql, params, plan_params, self.connection._progress_calls
+        )
+
+    def _timed(self, fn, *args):
+        started = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            if self._pending is not None:
+                self._pending.elapsed += time.perf_counter() - started
+
+    def _finish(self) -> None:
+        pending, self._pending = self._pending, None
+        if pending is None:
+            return
+        log = self.connection.slow_query_log
+        if pending.elapsed < log.threshold:
+            return
+
+        log.record(
+            SlowQuery(
+                sql=" ".join(pending.sql.split()),
+                params=pending.params,
+                rows=pending.rows,
+                duration=pending.elapsed,
+                vm_steps=(self.connection._progress_calls - pending.steps_at_start)
+                * PROGRESS_STEP,
+                plan=self.connection.explain(pending.sql, pending.plan_params),
+            )
+        )
+
+    def _after_execute(self) -> None:
+        # Statements without a result set are done once executed
+        if self.description is None and self._pending is not None:
+            self._pending.rows = max(self.rowcount, 0)
+            self._finish()
+
+    def execute(self, sql: str, parameters: Any = ()):
+        self._begin(sql, params_shape(parameters), parameters)
+        self._timed(super().execute, sql, parameters)
+        self._after_execute()
+        return self
+
+    def executemany(self, sql: str, seq_of_parameters: Any):
+        first = (
+            seq_of_parameters[0]
+            if isinstance(seq_of_parameters, Sequence) and seq_of_parameters
+            else None
+        )
+        self._begin(sql, _many_shape(seq_of_parameters), first)
+        self._timed(super().executemany, sql, seq_of_parameters)
+        self._after_execute()
+        return self
+
+    def fetchone(self):
+        row = self._timed(super().fetchone)
+        if row is None:
+            self._finish()
+        elif self._pending is not None:
+            self._pending.rows += 1
+        return row
+
+    def fetchmany(self, size: Optional[int] = None):
+        rows = self._timed(super().fetchmany, self.arraysize if size is None else size)
+        if not rows:
+            self._finish()
+        elif self._pending is not None:
+            self._pending.rows += len(rows)
+        return rows
+
+    def fetchall(self):
+        rows = self._timed(super().fetchall)
+        if self._pending is not None:
+            self._pending.rows += len(rows)
+        self._finish()
+        return rows
+
+    def __next__(self):
+        try:
+            row = self._timed(super().__next__)
+        except StopIteration:
+            self._finish()
+            raise
+        if self._pending is not None:
+            self._pending.rows += 1
+        return row
+
+    def close(self) -> None:
+        self._finish()
+        super().close()
+
+    def __del__(self):
+        # A cursor dropped after fetchone() still reports its statement
+        try:
+            self._finish()
+        except Exception:
+            pass
+
+
+class SlowQueryConnection(sqlite3.Connection):
+    """Connection whose cursors are TimedCursors; created by SlowQueryLog.connect."""
+
+    slow_query_log: SlowQueryLog
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._progress_calls = 0
+
+    def _count_progress(self) -> int:
+        self._progress_calls += 1
+        return 0  # never abort the statement
+
+    def cursor(self, factory=TimedCursor):
+        return super().cursor(factory)
+
+    # sqlite3.Connection.execute does not go through cursor(), so the
+    # shortcuts are routed through a TimedCursor explicitly
+
+    def execute(self, sql: str, parameters: Any = ()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql: str, seq_of_parameters: Any):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def explain(self, sql: str, parameters: Any = None) -> List[str]:
+        """EXPLAIN QUERY PLAN as indented lines; empty if it cannot be produced."""
+        try:
+            # A plain cursor, so explaining is not itself timed
+            rows = sqlite3.Cursor(self).execute(
+                f"EXPLAIN QUERY PLAN {sql}", parameters or ()
+            ).fetchall()
+        except sqlite3.Error:
+            return []
+
+        depth = {0: -1}
+        lines = []
+        for node_id, parent, _, detail in rows:
+            depth[node_id] = depth.get(parent, -1) + 1
+            lines.append("  " * depth[node_id] + detail)
+        return lines
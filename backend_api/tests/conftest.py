@@ -3,15 +3,17 @@
 Docstring for backend_api.tests.conftest
 """
 
+import dataclasses
 import sqlite3
 import pytest
 from contextlib import contextmanager
 from fastapi.testclient import TestClient
 
+from backend_api import main
 from backend_api.main import app
-from backend_api.dependencies import get_case_service
+from backend_api.dependencies import build_case_service, get_case_service
+from backend_api.migrations import run_migrations
 from backend_api.repositories.sqlite import SQLiteCaseRepository
-from backend_api.services.case_service import CaseService
 
 
 @contextmanager
@@ -24,16 +26,7 @@ def test_connection_factory():
     conn.row_factory = sqlite3.Row
 
     # Create schema once per connection
-    conn.executescript(
-        """
-        CREATE TABLE cases (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT NOT NULL,
-            description TEXT NOT NULL,
-            status TEXT NOT NULL
-        );
-        """
-    )
+    run_migrations(conn)
 
     try:
         yield conn
@@ -41,16 +34,29 @@ def test_connection_factory():
         conn.close()
 
 
-def get_test_case_service() -> CaseService:
-    repository = SQLiteCaseRepository(test_connection_factory)
-    return CaseService(repository)
+@pytest.fixture(autouse=True)
+def isolated_database(tmp_path, monkeypatch):
+    """
+    Point the application lifespan at a throwaway database file, so
+    starting the app in tests never migrates the real cases.db.
+    """
+    monkeypatch.setattr(
+        main,
+        "settings",
+        dataclasses.replace(main.settings, database_path=str(tmp_path / "cases.db")),
+    )
 
 
 @pytest.fixture
 def client():
-    app.dependency_overrides[get_case_service] = get_test_case_service
+    service = build_case_service(
+        SQLiteCaseRepository(test_connection_factory),
+        cache_size=0,
+    )
+    app.dependency_overrides[get_case_service] = lambda: service
 
     with TestClient(app) as client:
         yield client
 
     app.dependency_overrides.clear()
+    service.close()
@@ -5,9 +5,9 @@ import pytest
 from fastapi.testclient import TestClient
 
 from backend_api.main import app
-from backend_api.dependencies import get_case_service
+from backend_api.dependencies import build_case_service, get_case_service
+from backend_api.migrations import run_migrations
 from backend_api.repositories.sqlite import SQLiteCaseRepository
-from backend_api.services.case_service import CaseService
 
 
 @pytest.fixture
@@ -21,29 +21,22 @@ def client():
     conn.row_factory = sqlite3.Row
 
     # Create schema once
-    conn.executescript(
-        """
-        CREATE TABLE cases (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT NOT NULL,
-            description TEXT NOT NULL,
-            status TEXT NOT NULL
-        );
-        """
-    )
+    run_migrations(conn)
 
     # Always return the same connection
     def connection_factory():
         return conn
 
-    def get_test_case_service() -> CaseService:
-        repository = SQLiteCaseRepository(connection_factory)
-        return CaseService(repository)
-
-    app.dependency_overrides[get_case_service] = get_test_case_service
+    # No cache, so every request really reaches SQLite
+    service = build_case_service(
+        SQLiteCaseRepository(connection_factory),
+        cache_size=0,
+    )
+    app.dependency_overrides[get_case_service] = lambda: service
 
     with TestClient(app) as test_client:
         yield test_client
 
-    conn.close()
     app.dependency_overrides.clear()
+    service.close()
+    conn.close()
@@ -4,6 +4,8 @@ Integration tests for backend_api.main.
 
 These tests verify the full request -> validation -> service -> repository -> response flow using FastAPI's TestClient.
 """
+import json
+
 from fastapi.testclient import TestClient
 import pytest
 
@@ -101,4 +103,218 @@ def test_delete_case(client):
 
     # This proves:
     # Deletion works
-    # Integration of all parts works
\ No newline at end of file
+    # Integration of all parts works
+
+# Test 6 - GET /cases/ is paginated with a keyset cursor
+def test_get_cases_paginates_with_cursor(client):
+    for i in range(5):
+        client.post(
+            "/cases/",
+            json={"title": f"Case {i}", "description": "Paging", "status": "open"},
+        )
+
+    first = client.get("/cases/", params={"limit": 2})
+    assert [c["id"] for c in first.json()] == [1, 2]
+    assert first.headers["X-Next-Cursor"] == "2"
+
+    second = client.get("/cases/", params={"limit": 2, "after": 2})
+    assert [c["id"] for c in second.json()] == [3, 4]
+
+    last = client.get("/cases/", params={"limit": 2, "after": 4})
+    assert [c["id"] for c in last.json()] == [5]
+    assert "X-Next-Cursor" not in last.headers
+
+    # What this test proves:
+    # Pages follow each other without gaps or overlap
+    # The last page carries no cursor
+
+
+# Test 7 - GET /cases/ filters by status
+def test_get_cases_filters_by_status(client):
+    client.post("/cases/", json={"title": "A", "description": "A", "status": "open"})
+    client.post("/cases/", json={"title": "B", "description": "B", "status": "closed"})
+    client.post("/cases/", json={"title": "C", "description": "C", "status": "open"})
+
+    response = client.get("/cases/", params={"status": "closed"})
+
+    assert response.status_code == 200
+    assert [c["title"] for c in response.json()] == ["B"]
+
+
+# Test 8 - GET /cases/export streams NDJSON
+def test_export_cases_as_ndjson(client):
+    for i in range(3):
+        client.post(
+            "/cases/",
+            json={"title": f"Case {i}", "description": "Export", "status": "open"},
+        )
+
+    response = client.get("/cases/export", params={"batch_size": 2})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert response.headers["X-Total-Count"] == "3"
+    lines = response.text.splitlines()
+    assert [json.loads(line)["id"] for line in lines] == [1, 2, 3]
+
+    # What this test proves:
+    # Batches are joined into one line per case
+
+
+# Test 9 - GET /cases/export streams a JSON array
+def test_export_cases_as_json_array(client):
+    for i in range(3):
+        client.post(
+            "/cases/",
+            json={"title": f"Case {i}", "description": "Export", "status": "open"},
+        )
+
+    response = client.get("/cases/export", params={"format": "json", "batch_size": 2})
+
+    assert response.status_code == 200
+    assert [c["title"] for c in response.json()] == ["Case 0", "Case 1", "Case 2"]
+
+
+# Test 10 - exporting an empty table gives valid output
+def test_export_empty_table(client):
+    assert client.get("/cases/export", params={"format": "json"}).json() == []
+    assert client.get("/cases/export").text == ""
+
+
+# Test 11 - GET /cases/{id} supports ETag / If-None-Match
+def test_get_case_returns_304_when_unchanged(client):
+    client.post(
+        "/cases/",
+        json={"title": "Test", "description": "ETag", "status": "open"},
+    )
+
+    first = client.get("/cases/1")
+    etag = first.headers["ETag"]
+
+    cached = client.get("/cases/1", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+    client.put(
+        "/cases/1",
+        json={"title": "Changed", "description": "ETag", "status": "open"},
+    )
+    changed = client.get("/cases/1", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+
+    # What this test proves:
+    # Polling clients get cheap 304s until the case changes
+
+
+# Test 12 - PUT /cases/{id} with a stale If-Match is rejected
+def test_update_case_with_stale_etag_returns_412(client):
+    client.post(
+        "/cases/",
+        json={"title": "Test", "description": "If-Match", "status": "open"},
+    )
+    etag = client.get("/cases/1").headers["ETag"]
+
+    first = client.put(
+        "/cases/1",
+        headers={"If-Match": etag},
+        json={"title": "Writer A", "description": "If-Match", "status": "open"},
+    )
+    second = client.put(
+        "/cases/1",
+        headers={"If-Match": etag},
+        json={"title": "Writer B", "description": "If-Match", "status": "open"},
+    )
+
+    assert first.status_code == 200
+    assert second.status_code == 412
+    assert client.get("/cases/1").json()["title"] == "Writer A"
+
+    # What this test proves:
+    # The second writer cannot clobber the first one
+
+
+# Test 13 - GET /cases/stats follows creates, status changes and deletes
+def test_case_stats_follow_writes(client):
+    assert client.get("/cases/stats").json() == {
+        "total": 0,
+        "by_status": {"open": 0, "closed": 0},
+    }
+
+    for title in ("One", "Two", "Three"):
+        client.post(
+            "/cases/",
+            json={"title": title, "description": "Stats", "status": "open"},
+        )
+    client.put(
+        "/cases/1",
+        json={"title": "One", "description": "Stats", "status": "closed"},
+    )
+    client.delete("/cases/2")
+
+    assert client.get("/cases/stats").json() == {
+        "total": 2,
+        "by_status": {"open": 1, "closed": 1},
+    }
+
+    # What this test proves:
+    # The trigger-maintained counters stay in step with every write path
+
+
+# Test 14 - GET /cases/?modified_since= returns changes and tombstones
+def test_delta_sync(client):
+    for title in ("One", "Two"):
+        client.post(
+            "/cases/",
+            json={"title": title, "description": "Sync", "status": "open"},
+        )
+    full = client.get("/cases/", params={"modified_since": 0}).json()
+    assert [case["title"] for case in full["cases"]] == ["One", "Two"]
+
+    client.put(
+        "/cases/1",
+        json={"title": "One v2", "description": "Sync", "status": "open"},
+    )
+    client.delete("/cases/2")
+    response = client.get("/cases/", params={"modified_since": full["cursor"]})
+
+    assert response.json() == {
+        "cases": [{"id": 1, "title": "One v2", "description": "Sync", "status": "open"}],
+        "deleted": [2],
+        "cursor": int(response.headers["X-Next-Cursor"]),
+        "has_more": False,
+    }
+    assert (
+        client.get("/cases/", params={"modified_since": 0, "status": "open"}).status_code
+        == 400
+    )
+
+    # What this test proves:
+    # A client refreshes its copy with only what changed since last time
+
+
+# Test 15 - GET /cases/ is cached until the next write, with ETag and gzip
+def test_list_response_cache(client):
+    for i in range(20):
+        client.post(
+            "/cases/",
+            json={"title": f"Case {i}", "description": "Cached " * 20, "status": "open"},
+        )
+
+    first = client.get("/cases/", headers={"Accept-Encoding": "gzip"})
+    second = client.get("/cases/", headers={"Accept-Encoding": "gzip"})
+    assert first.headers["Content-Encoding"] == "gzip"
+    assert second.json() == first.json()
+    assert second.headers["ETag"] == first.headers["ETag"]
+
+    not_modified = client.get("/cases/", headers={"If-None-Match": first.headers["ETag"]})
+    assert not_modified.status_code == 304
+
+    client.delete("/cases/1")
+    after_write = client.get("/cases/", headers={"If-None-Match": first.headers["ETag"]})
+    assert after_write.status_code == 200
+    assert [case["id"] for case in after_write.json()][:1] == [2]
+
+    # What this test proves:
+    # Pollers get cached, compressed bytes or a 304 between writes, and
+    # every write is visible on the next read
@@ -44,4 +44,29 @@ def test_update_case_not_found(client):
 def test_delete_case_not_found(client):
     response = client.delete("/cases/999")
 
-    assert response.status_code == 404
\ No newline at end of file
+    assert response.status_code == 404
+
+
+def test_update_closed_case_is_rejected(client):
+    client.post(
+        "/cases/",
+        json={"title": "Done", "description": "Closed", "status": "closed"},
+    )
+
+    response = client.put(
+        "/cases/1",
+        json={"title": "Reopen", "description": "Nope", "status": "open"},
+    )
+
+    assert response.status_code == 400
+    assert client.get("/cases/1").json()["title"] == "Done"
+
+def test_delete_closed_case_is_rejected(client):
+    client.post(
+        "/cases/",
+        json={"title": "Done", "description": "Closed", "status": "closed"},
+    )
+
+    response = client.delete("/cases/1")
+
+    assert response.status_code == 400
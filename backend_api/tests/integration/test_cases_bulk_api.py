@@ -0,0 +1,91 @@
+# backend_api\tests\integration\test_cases_bulk_api.py
+"""
+Integration tests for the bulk endpoints under /cases/bulk.
+"""
+
+
+def _create(client, title, status="open"):
+    return client.post(
+        "/cases/",
+        json={"title": title, "description": "Bulk", "status": status},
+    ).json()["id"]
+
+
+# Test 1 - POST /cases/bulk creates all items in order
+def test_bulk_create_cases(client):
+    response = client.post(
+        "/cases/bulk",
+        json=[
+            {"title": "A", "description": "A"},
+            {"title": "B", "description": "B", "status": "closed"},
+        ],
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["succeeded"] == 2
+    assert [r["id"] for r in data["results"]] == [1, 2]
+    assert data["results"][1]["case"]["status"] == "closed"
+    assert len(client.get("/cases/").json()) == 2
+
+    # What this test proves:
+    # executemany IDs are mapped back to the right items
+
+
+# Test 2 - POST /cases/bulk/status skips closed and missing cases
+def test_bulk_status_update_reports_per_item(client):
+    open_id = _create(client, "Open")
+    closed_id = _create(client, "Closed", status="closed")
+
+    response = client.post(
+        "/cases/bulk/status",
+        json={"ids": [open_id, closed_id, 999], "status": "closed"},
+    )
+
+    data = response.json()
+    assert data["succeeded"] == 1
+    assert data["failed"] == 2
+    assert [r["error"] for r in data["results"]] == [
+        None,
+        "Closed cases cannot be updated",
+        "Case not found",
+    ]
+    assert client.get(f"/cases/{open_id}").json()["status"] == "closed"
+
+    # What this test proves:
+    # The closed-case rule is enforced per item in a batch
+
+
+# Test 3 - POST /cases/bulk/delete keeps closed cases
+def test_bulk_delete_reports_per_item(client):
+    open_id = _create(client, "Open")
+    closed_id = _create(client, "Closed", status="closed")
+
+    response = client.post("/cases/bulk/delete", json={"ids": [open_id, closed_id]})
+
+    data = response.json()
+    assert [r["ok"] for r in data["results"]] == [True, False]
+    assert client.get(f"/cases/{open_id}").status_code == 404
+    assert client.get(f"/cases/{closed_id}").status_code == 200
+
+
+# Test 4 - an empty bulk request is rejected
+def test_bulk_create_rejects_empty_list(client):
+    assert client.post("/cases/bulk", json=[]).status_code == 422
+
+
+# Test 5 - repeated IDs are rejected instead of being counted twice
+def test_bulk_requests_reject_duplicate_ids(client):
+    case_id = _create(client, "Once")
+
+    delete = client.post("/cases/bulk/delete", json={"ids": [case_id, case_id]})
+    status = client.post(
+        "/cases/bulk/status", json={"ids": [case_id, case_id], "status": "closed"}
+    )
+
+    assert delete.status_code == 422
+    assert status.status_code == 422
+    assert client.get(f"/cases/{case_id}").json()["status"] == "open"
+
+    # What this test proves:
+    # `succeeded` can never count the same case twice
@@ -0,0 +1,71 @@
+# backend_api\tests\integration\test_cases_search_api.py
+"""
+Integration tests for GET /cases/search (SQLite FTS5).
+"""
+
+
+def _create(client, title, description):
+    client.post(
+        "/cases/",
+        json={"title": title, "description": description, "status": "open"},
+    )
+
+
+# Test 1 - search finds matching cases with highlighted snippets
+def test_search_ranks_and_highlights(client):
+    _create(client, "Printer broken", "The printer on floor two is jammed")
+    _create(client, "Network outage", "Nobody can reach the printer server")
+    _create(client, "Coffee machine", "Out of beans")
+
+    response = client.get("/cases/search", params={"q": "printer"})
+
+    assert response.status_code == 200
+    hits = response.json()
+    assert [hit["case"]["id"] for hit in hits] == [1, 2]
+    assert "<mark>printer</mark>" in hits[0]["snippet"].lower()
+    assert hits[0]["score"] >= hits[1]["score"]
+
+    # What this test proves:
+    # Triggers keep the FTS index in sync with inserts
+    # bm25 puts the title match first
+
+
+# Test 2 - every word must match, and updates/deletes are reindexed
+def test_search_follows_updates_and_deletes(client):
+    _create(client, "Printer broken", "Jammed paper")
+    _create(client, "Printer fine", "Nothing to do")
+
+    assert len(client.get("/cases/search", params={"q": "printer jammed"}).json()) == 1
+
+    client.put(
+        "/cases/1",
+        json={"title": "Scanner broken", "description": "Jammed", "status": "open"},
+    )
+    client.delete("/cases/2")
+
+    assert client.get("/cases/search", params={"q": "printer"}).json() == []
+    assert len(client.get("/cases/search", params={"q": "scanner"}).json()) == 1
+
+
+# Test 3 - results are paginated with an offset
+def test_search_is_paginated(client):
+    for i in range(3):
+        _create(client, f"Ticket {i}", "Login problem")
+
+    first = client.get("/cases/search", params={"q": "login", "limit": 2})
+    assert len(first.json()) == 2
+    assert first.headers["X-Next-Offset"] == "2"
+
+    rest = client.get("/cases/search", params={"q": "login", "limit": 2, "offset": 2})
+    assert len(rest.json()) == 1
+    assert "X-Next-Offset" not in rest.headers
+
+
+# Test 4 - FTS syntax in the query is treated as plain words
+def test_search_escapes_query_syntax(client):
+    _create(client, "Quote \"test\"", "NEAR OR AND")
+
+    response = client.get("/cases/search", params={"q": 'NEAR( "test" OR'})
+
+    assert response.status_code == 200
+    assert len(response.json()) == 1
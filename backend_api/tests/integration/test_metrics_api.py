@@ -0,0 +1,40 @@
+# backend_api\tests\integration\test_metrics_api.py
+"""
+Integration tests for GET /metrics.
+"""
+
+from fastapi.testclient import TestClient
+
+from backend_api.main import app
+
+
+# Test 1 - HTTP, service, repository and pool metrics are exposed
+def test_metrics_cover_every_layer():
+    # No dependency override: the lifespan wires the instrumented service
+    # against the throwaway database from the isolated_database fixture
+    with TestClient(app) as client:
+        client.post(
+            "/cases/",
+            json={"title": "Metrics", "description": "Test", "status": "open"},
+        )
+        client.get("/cases/1")
+        client.get("/cases/999")
+
+        response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    text = response.text
+    assert (
+        'http_request_duration_seconds_count{method="GET",route="/cases/{case_id}"} 2'
+        in text
+    )
+    assert 'http_requests_total{method="GET",route="/cases/{case_id}",status="404"} 1' in text
+    assert 'case_service_duration_seconds_count{method="create_case"} 1' in text
+    assert 'case_repository_rows_total{method="create"} 1' in text
+    assert 'case_cache_events_total{event="miss"}' in text
+    assert 'case_db_pool_connections{pool="write",state="open"}' in text
+    assert 'case_db_pool_connections{pool="read",state="open"}' in text
+
+    # What this test proves:
+    # One scrape shows where time goes: HTTP, service, storage and pool
@@ -0,0 +1,57 @@
+# backend_api\tests\integration\test_read_routing_api.py
+"""
+Integration tests for read/write routing in the real application lifespan.
+"""
+
+import dataclasses
+
+from fastapi.testclient import TestClient
+
+from backend_api import main
+
+
+CASE = {"title": "Test", "description": "Routing", "status": "open"}
+
+
+# Test 1 - snapshot reads lag; X-Read-Your-Writes reads the primary
+def test_read_your_writes_header(monkeypatch):
+    # Never refreshed during the test, so the snapshot stays empty
+    monkeypatch.setattr(
+        main,
+        "settings",
+        dataclasses.replace(
+            main.settings, read_connections="snapshot", snapshot_refresh_interval=None
+        ),
+    )
+
+    with TestClient(main.app) as client:
+        case_id = client.post("/cases/", json=CASE).json()["id"]
+
+        stale = client.get(f"/cases/{case_id}")
+        fresh = client.get(f"/cases/{case_id}", headers={"X-Read-Your-Writes": "1"})
+
+    assert stale.status_code == 404
+    assert fresh.status_code == 200
+    assert fresh.json()["title"] == "Test"
+
+    # What this test proves:
+    # Plain reads are served by the replica and a client can opt into
+    # reading its own writes per request
+
+
+# Test 2 - the default read-only pool sees writes immediately
+def test_read_only_pool_sees_writes(monkeypatch):
+    monkeypatch.setattr(
+        main, "settings", dataclasses.replace(main.settings, read_connections="readonly")
+    )
+
+    with TestClient(main.app) as client:
+        case_id = client.post("/cases/", json=CASE).json()["id"]
+        response = client.get(f"/cases/{case_id}")
+        read_pool = main.app.state.storage.pools["read"]
+
+        assert response.status_code == 200
+        assert read_pool.stats().checkouts >= 1
+
+    # What this test proves:
+    # Reads leave the write pool without giving up consistency
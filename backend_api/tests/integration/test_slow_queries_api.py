@@ -0,0 +1,45 @@
+# backend_api\tests\integration\test_slow_queries_api.py
+"""
+Integration tests for GET/DELETE /admin/slow-queries.
+"""
+
+import dataclasses
+
+from fastapi.testclient import TestClient
+
+from backend_api import main
+from backend_api.main import app
+
+
+# Test 1 - with the log enabled, request statements are listed and cleared
+def test_slow_queries_are_listed(monkeypatch):
+    monkeypatch.setattr(
+        main,
+        "settings",
+        dataclasses.replace(
+            main.settings, slow_query_log_enabled=True, slow_query_threshold=0.0
+        ),
+    )
+
+    with TestClient(app) as client:
+        client.post(
+            "/cases/",
+            json={"title": "Slow", "description": "Query", "status": "open"},
+        )
+        client.get("/cases/export")
+
+        entries = client.get("/admin/slow-queries").json()
+        assert any(
+            entry["sql"].startswith("SELECT id, title") and entry["rows"] == 1
+            for entry in entries
+        )
+        assert all("Slow" not in entry["params"] for entry in entries)
+
+        assert client.delete("/admin/slow-queries").status_code == 204
+        assert client.get("/admin/slow-queries").json() == []
+
+
+# Test 2 - the endpoint is hidden while the log is disabled
+def test_slow_queries_disabled_returns_404():
+    with TestClient(app) as client:
+        assert client.get("/admin/slow-queries").status_code == 404
@@ -0,0 +1,31 @@
+# backend_api\tests\integration\test_storage_backends_api.py
+"""
+Integration tests for selecting the storage backend through settings.
+"""
+
+import dataclasses
+import os
+
+from fastapi.testclient import TestClient
+
+from backend_api import main
+
+
+CASE = {"title": "Test", "description": "Backend", "status": "open"}
+
+
+# Test 1 - the whole application runs on the RAM-only backend
+def test_memory_backend(monkeypatch):
+    monkeypatch.setattr(main, "settings", dataclasses.replace(main.settings, backend="memory"))
+
+    with TestClient(main.app) as client:
+        case_id = client.post("/cases/", json=CASE).json()["id"]
+
+        assert client.get(f"/cases/{case_id}").json()["title"] == "Test"
+        assert client.get("/cases/changes").json()[0]["case_id"] == case_id
+        assert "case_db_pool" not in client.get("/metrics").text
+
+    assert not os.path.exists(main.settings.database_path)
+
+    # What this test proves:
+    # Switching backends is configuration only; nothing is written to disk
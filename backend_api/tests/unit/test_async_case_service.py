@@ -0,0 +1,76 @@
+# backend_api\tests\unit\test_async_case_service.py
+# Unit tests for AsyncCaseService on top of ExecutorCaseRepository
+
+import asyncio
+import threading
+
+import pytest
+
+from backend_api.repositories.executor import ExecutorCaseRepository
+from backend_api.repositories.inmemory import InMemoryCaseRepository
+from backend_api.services.async_case_service import AsyncCaseService
+
+
+@pytest.fixture
+def service():
+    service = AsyncCaseService(ExecutorCaseRepository(InMemoryCaseRepository()))
+    yield service
+    service.close()
+
+
+# Test 1 - the async service creates and reads cases
+def test_create_and_get_case(service):
+    async def scenario():
+        created = await service.create_case("  Test ", "Desc", "open")
+        return created, await service.get_case(created.id)
+
+    created, found = asyncio.run(scenario())
+
+    assert created.title == "Test"
+    assert found is created
+
+    # What this test proves:
+    # The same title rule as CaseService applies
+
+
+# Test 2 - business rules are shared with the sync service
+def test_closed_case_cannot_be_updated(service):
+    async def scenario():
+        case = await service.create_case("Done", "Desc", "closed")
+        await service.update_case(case.id, "Reopen", "Desc", "open")
+
+    with pytest.raises(ValueError, match="Closed cases cannot be updated"):
+        asyncio.run(scenario())
+
+
+# Test 3 - writes run on the single writer thread, reads on reader threads
+def test_writes_are_serialized_on_one_thread():
+    threads = set()
+
+    class RecordingRepository(InMemoryCaseRepository):
+        def create(self, title, description, status):
+            threads.add(threading.current_thread().name)
+            return super().create(title, description, status)
+
+    service = AsyncCaseService(ExecutorCaseRepository(RecordingRepository(), readers=4))
+
+    async def scenario():
+        await asyncio.gather(
+            *(service.create_case(f"Case {i}", "Desc", "open") for i in range(20))
+        )
+        return await service.count_cases()
+
+    assert asyncio.run(scenario()) == 20
+    assert len(threads) == 1
+    assert threads.pop().startswith("case-writer")
+    service.close()
+
+
+# Test 4 - export streams every case asynchronously
+def test_export_cases_streams_in_batches(service):
+    async def scenario():
+        for i in range(5):
+            await service.create_case(f"Case {i}", "Desc", "open")
+        return [case.id async for case in service.export_cases(batch_size=2)]
+
+    assert asyncio.run(scenario()) == [1, 2, 3, 4, 5]
@@ -0,0 +1,93 @@
+# backend_api\tests\unit\test_backends.py
+# Unit tests for the storage backend registry
+
+import os
+
+import pytest
+
+from backend_api.backends import Storage, available_backends, open_storage, register_backend
+from backend_api.db import ConnectionPool
+from backend_api.replica import SnapshotReplica
+from backend_api.repositories.group_commit import GroupCommitCaseRepository
+from backend_api.repositories.inmemory import InMemoryCaseRepository
+from backend_api.repositories.sqlite import SQLiteCaseRepository
+from backend_api.settings import Settings
+
+
+# Test 1 - the sqlite backend migrates the file and opens the configured pools
+@pytest.mark.parametrize(
+    "read_connections, read_pool",
+    [("primary", None), ("readonly", ConnectionPool), ("snapshot", SnapshotReplica)],
+)
+def test_sqlite_backend(tmp_path, read_connections, read_pool):
+    settings = Settings(
+        database_path=str(tmp_path / "cases.db"),
+        pool_size=3,
+        read_connections=read_connections,
+        read_pool_size=2,
+        snapshot_refresh_interval=None,
+    )
+
+    storage = open_storage(settings)
+    try:
+        assert isinstance(storage.repository, SQLiteCaseRepository)
+        case = storage.repository.create("Title", "Description", "open")
+        assert storage.pools["write"].size == 3
+        if read_pool is None:
+            assert set(storage.pools) == {"write"}
+        else:
+            assert isinstance(storage.pools["read"], read_pool)
+        # One reader thread per read connection (pool size - 1 without one)
+        assert storage.readers == 2
+    finally:
+        storage.repository.close()
+        storage.close()
+
+    assert case.id == 1
+    assert os.path.exists(settings.database_path)
+
+    # What this test proves:
+    # One settings object decides the repository, its pools and thread counts
+
+
+# Test 2 - group commit and memory backends
+def test_other_builtin_backends(tmp_path):
+    group = open_storage(
+        Settings(
+            backend="sqlite-group",
+            database_path=str(tmp_path / "cases.db"),
+            group_commit_max_batch=8,
+        )
+    )
+    try:
+        assert isinstance(group.repository, GroupCommitCaseRepository)
+        assert group.writers == 8
+    finally:
+        group.repository.close()
+        group.close()
+
+    memory = open_storage(Settings(backend="memory", database_path=str(tmp_path / "unused.db")))
+    assert isinstance(memory.repository, InMemoryCaseRepository)
+    assert memory.pools == {}
+    assert not os.path.exists(tmp_path / "unused.db")
+
+    # What this test proves:
+    # RAM-only storage never touches the database path
+
+
+# Test 3 - new backends plug in by name; unknown names are rejected
+def test_register_backend(monkeypatch):
+    monkeypatch.setattr("backend_api.backends._BACKENDS", {})
+    closed = []
+
+    @register_backend("custom")
+    def custom(settings, slow_query_log):
+        return Storage(InMemoryCaseRepository(), readers=1, cleanups=[lambda: closed.append(1)])
+
+    storage = open_storage(Settings(backend="custom"))
+    storage.close()
+
+    assert available_backends() == ["custom"]
+    assert closed == [1]
+    with pytest.raises(ValueError):
+        open_storage(Settings(backend="postgres"))
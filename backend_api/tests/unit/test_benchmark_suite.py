@@ -0,0 +1,45 @@
+# backend_api\tests\unit\test_benchmark_suite.py
+# Smoke tests for the benchmark suite, so it keeps running as the API grows
+
+import json
+
+from backend_api.benchmarks.report import percentile, summarize, write_results
+from backend_api.benchmarks.suite import run_suite
+
+
+# Test 1 - nearest-rank percentiles and the summary fields
+def test_summarize_reports_percentiles():
+    samples = [i / 1000 for i in range(1, 101)]
+
+    summary = summarize(samples, elapsed=2.0)
+
+    assert percentile(sorted(samples), 0.5) == 0.05
+    assert summary["count"] == 100
+    assert summary["ops_per_sec"] == 50
+    assert round(summary["p95_ms"]) == 95
+    assert round(summary["p99_ms"]) == 99
+
+
+# Test 2 - a tiny run covers every benchmark without errors
+def test_suite_runs_on_every_backend(tmp_path):
+    results = run_suite(rows=50, iterations=5, requests=5, concurrency=2)
+
+    assert set(results) == {
+        "sqlite repository",
+        "sqlite http",
+        "sqlite-group repository",
+        "sqlite-group http",
+        "memory repository",
+        "memory http",
+    }
+    for group in results.values():
+        for summary in group.values():
+            assert summary["errors"] == 0
+            assert summary["count"] > 0
+
+    path = tmp_path / "bench.json"
+    write_results(str(path), results, {"rows": 50})
+    assert json.loads(path.read_text())["results"] == results
+
+    # What this test proves:
+    # Every repository method and endpoint is exercised and results round-trip as JSON
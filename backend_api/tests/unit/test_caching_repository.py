@@ -0,0 +1,108 @@
+# backend_api\tests\unit\test_caching_repository.py
+# Unit tests for the read-through CachingCaseRepository
+
+from unittest.mock import Mock
+
+from backend_api.db import read_your_writes
+from backend_api.models import Case
+from backend_api.repositories.caching import CachingCaseRepository
+from backend_api.repositories.inmemory import InMemoryCaseRepository
+
+
+# Test 1 - repeated reads are served from the cache
+def test_get_by_id_hits_cache_after_first_read():
+    inner = Mock(wraps=InMemoryCaseRepository())
+    repo = CachingCaseRepository(inner)
+    case = repo.create("Test", "Desc", "open")
+
+    assert repo.get_by_id(case.id) is case
+    assert repo.get_by_id(case.id) is case
+
+    inner.get_by_id.assert_called_once_with(case.id)
+    stats = repo.stats()
+    assert (stats.hits, stats.misses) == (1, 1)
+
+    # What this test proves:
+    # Only the first lookup reaches the backend
+
+
+# Test 2 - writes invalidate cached entries
+def test_update_and_delete_invalidate_entry():
+    inner = Mock(wraps=InMemoryCaseRepository())
+    repo = CachingCaseRepository(inner)
+    case = repo.create("Test", "Desc", "open")
+    repo.get_by_id(case.id)
+
+    repo.update_unless_closed(case.id, "New", "Desc", "open")
+    assert repo.get_by_id(case.id).title == "New"
+
+    repo.delete_unless_closed(case.id)
+    assert repo.get_by_id(case.id) is None
+    assert inner.get_by_id.call_count == 3
+
+
+# Test 3 - the least recently used entry is evicted
+def test_lru_eviction():
+    repo = CachingCaseRepository(InMemoryCaseRepository(), max_size=2)
+    a = repo.create("A", "A", "open")
+    b = repo.create("B", "B", "open")
+    c = repo.create("C", "C", "open")
+
+    repo.get_by_id(a.id)
+    repo.get_by_id(b.id)
+    repo.get_by_id(a.id)  # b is now least recently used
+    repo.get_by_id(c.id)
+
+    stats = repo.stats()
+    assert stats.evictions == 1
+    assert stats.size == 2
+
+
+# Test 4 - expired entries are reloaded
+def test_expired_entry_is_reloaded():
+    inner = Mock()
+    inner.get_by_id.return_value = Case(1, "A", "A", "open")
+    repo = CachingCaseRepository(inner, ttl=0)
+
+    repo.get_by_id(1)
+    repo.get_by_id(1)
+
+    assert inner.get_by_id.call_count == 2
+    assert repo.stats().expirations == 1
+
+
+# Test 5 - negative caching remembers unknown IDs until a create
+def test_not_found_is_cached_when_enabled():
+    inner = Mock(wraps=InMemoryCaseRepository())
+    repo = CachingCaseRepository(inner, cache_not_found=True)
+
+    assert repo.get_by_id(1) is None
+    assert repo.get_by_id(1) is None
+    inner.get_by_id.assert_called_once_with(1)
+
+    repo.create("Test", "Desc", "open")
+    assert repo.get_by_id(1) is not None
+
+    # What this test proves:
+    # Repeated 404 lookups stay cheap, and creating the ID clears them
+
+
+# Test 6 - reads routed to the primary bypass the cache
+def test_read_your_writes_skips_cache():
+    inner = Mock()
+    inner.get_by_id.return_value = Case(1, "Old", "A", "open", version=1)
+    repo = CachingCaseRepository(inner)
+    repo.get_by_id(1)
+
+    inner.get_by_id.return_value = Case(1, "New", "A", "open", version=2)
+    with read_your_writes():
+        assert repo.get_by_id(1).version == 2
+    assert inner.get_by_id.call_count == 2
+    assert (repo.stats().hits, repo.stats().misses) == (0, 1)
+
+    # The primary read did not replace the entry cached outside the block
+    assert repo.get_by_id(1).version == 1
+
+    # What this test proves:
+    # A request that must see its own write never gets a cached copy,
+    # and its primary reads are not stored for other requests
@@ -2,7 +2,18 @@
 # Unit tests for CaseRepository class
 
 
+import sqlite3
+import threading
+
+from dataclasses import fields
+
+import pytest
+
+from backend_api.db import ConnectionPool
+from backend_api.migrations import run_migrations
+from backend_api.models import Case, CaseDelta, MutationOutcome
 from backend_api.repositories.inmemory import InMemoryCaseRepository
+from backend_api.repositories.sqlite import _CASE_COLUMN_NAMES, SQLiteCaseRepository
 
 # Test 1 - create() creates case and sets ID
 def test_create_case_assigns_id_and_stores_case():
@@ -127,4 +138,203 @@ def test_delete_removes_case():
     # What this test proves:
     # delete() works
     # Case is actually removed
-    
\ No newline at end of file
+
+# Test 9 - get_page() returns a keyset page filtered by status
+def test_get_page_returns_filtered_page_after_cursor():
+    repo = InMemoryCaseRepository()
+    repo.create("A", "A-desc", "open")
+    repo.create("B", "B-desc", "closed")
+    repo.create("C", "C-desc", "open")
+    repo.create("D", "D-desc", "open")
+
+    page = repo.get_page(limit=2, after=1, status="open")
+
+    assert [c.id for c in page] == [3, 4]
+
+    # What this test proves:
+    # Cursor, filter and limit are applied together
+
+# Test 10 - update_status_many() leaves closed cases untouched
+def test_update_status_many_skips_closed_cases():
+    repo = InMemoryCaseRepository()
+    open_case = repo.create("A", "A-desc", "open")
+    closed_case = repo.create("B", "B-desc", "closed")
+
+    outcomes = repo.update_status_many([open_case.id, closed_case.id, 99], "closed")
+
+    assert outcomes == {
+        open_case.id: MutationOutcome.applied,
+        closed_case.id: MutationOutcome.closed,
+        99: MutationOutcome.not_found,
+    }
+    assert open_case.status == "closed"
+
+    # What this test proves:
+    # Each ID gets its own outcome
+
+# Test 11 - update_unless_closed() checks the expected version
+def test_update_unless_closed_detects_version_conflict():
+    repo = InMemoryCaseRepository()
+    case = repo.create("Test", "Desc", "open")
+
+    outcome, updated = repo.update_unless_closed(case.id, "New", "Desc", "open", expected_version=1)
+    assert outcome is MutationOutcome.applied
+    assert updated.version == 2
+
+    outcome, updated = repo.update_unless_closed(case.id, "Newer", "Desc", "open", expected_version=1)
+    assert outcome is MutationOutcome.conflict
+    assert updated is None
+
+    # What this test proves:
+    # Versions increase on update and stale writers are refused
+
+# Test 12 - the status index follows status changes and deletes
+def test_status_index_follows_updates_and_deletes():
+    repo = InMemoryCaseRepository()
+    a = repo.create("A", "A-desc", "open")
+    b = repo.create("B", "B-desc", "open")
+    c = repo.create("C", "C-desc", "closed")
+
+    repo.update(a.id, "A", "A-desc", "closed")
+    repo.delete(b.id)
+
+    assert [x.id for x in repo.get_page(10, status="closed")] == [a.id, c.id]
+    assert repo.get_page(10, status="open") == []
+    assert [x.id for x in repo.get_all()] == [a.id, c.id]
+
+    # What this test proves:
+    # Filtered pages stay in ID order when a case changes status
+
+
+# Test 13 - concurrent creates get unique IDs
+def test_concurrent_creates_are_thread_safe():
+    repo = InMemoryCaseRepository()
+
+    def worker():
+        for _ in range(200):
+            repo.create("T", "D", "open")
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    ids = [case.id for case in repo.get_all()]
+    assert len(ids) == len(set(ids)) == 1600
+    assert ids == sorted(ids)
+
+# Test 14 - search() ranks matches and keeps the index in sync
+def test_search_uses_inverted_index():
+    repo = InMemoryCaseRepository()
+    repo.create("Printer broken", "The printer is jammed", "open")
+    repo.create("Network", "Printer server unreachable", "open")
+    repo.create("Coffee", "Out of beans", "open")
+
+    hits = repo.search("printer", limit=10)
+    assert [hit.case.id for hit in hits] == [1, 2]
+    assert "<mark>printer</mark>" in hits[0].snippet
+
+    repo.update(1, "Scanner", "Nothing here", "open")
+    assert [hit.case.id for hit in repo.search("printer", limit=10)] == [2]
+
+    # What this test proves:
+    # The in-memory backend honors the same search contract as SQLite
+
+
+# Test 15 - SQLite rows map to slotted cases positionally
+def test_case_fields_match_sqlite_column_order():
+    assert tuple(field.name for field in fields(Case)) == _CASE_COLUMN_NAMES
+    assert not hasattr(Case(1, "Title", "Description", "open"), "__dict__")
+
+    # What this test proves:
+    # Case(*row) cannot silently swap columns, and cases carry no __dict__
+
+
+def _sqlite_repository():
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    run_migrations(conn)
+    return SQLiteCaseRepository(lambda: conn)
+
+
+# Test 16 - get_modified_since() returns changed cases and tombstones
+@pytest.mark.parametrize("make_repo", [InMemoryCaseRepository, _sqlite_repository])
+def test_modified_since_returns_changes_and_tombstones(make_repo):
+    repo = make_repo()
+    for title in ("A", "B", "C"):
+        repo.create(title, "Desc", "open")
+
+    full = repo.get_modified_since(0, limit=10)
+    assert [case.title for case in full.cases] == ["A", "B", "C"]
+    assert full.deleted == [] and not full.has_more
+
+    repo.update(1, "A2", "Desc", "open")
+    repo.update(1, "A3", "Desc", "open")
+    repo.delete(2)
+    delta = repo.get_modified_since(full.cursor, limit=10)
+
+    assert [(case.id, case.title) for case in delta.cases] == [(1, "A3")]
+    assert delta.deleted == [2]
+    assert repo.get_modified_since(delta.cursor, limit=10) == (
+        CaseDelta([], [], delta.cursor, False)
+    )
+
+    first = repo.get_modified_since(0, limit=1)
+    assert [case.id for case in first.cases] == [3] and first.has_more
+
+    # What this test proves:
+    # Both backends report each changed case once, in its latest state,
+    # plus deletions, and page through the changes with a cursor
+
+
+# Test 17 - iter_all() gives the pooled connection back between batches
+def test_iter_all_releases_the_connection_between_batches(tmp_path):
+    pool = ConnectionPool(str(tmp_path / "cases.db"), size=1, timeout=0.1)
+    with pool.connection() as conn:
+        run_migrations(conn)
+    repo = SQLiteCaseRepository(pool.connection)
+    for title in ("A", "B", "C"):
+        repo.create(title, "Desc", "open")
+
+    exported = []
+    for case in repo.iter_all(batch_size=2):
+        exported.append(case.title)
+        if len(exported) <= 3:
+            # Would raise PoolTimeout if the export held the only connection
+            repo.create(f"During {case.title}", "Desc", "open")
+
+    pool.close()
+    assert exported[:3] == ["A", "B", "C"]
+    assert len(exported) == 6
+
+    # What this test proves:
+    # A slow export cannot starve writers of pooled connections
+
+
+# Test 18 - get_modified_since() pages through a rewritten log
+@pytest.mark.parametrize("make_repo", [InMemoryCaseRepository, _sqlite_repository])
+def test_modified_since_pages_through_every_change(make_repo):
+    repo = make_repo()
+    for i in range(10):
+        repo.create(f"Case {i}", "Desc", "open")
+    for n in range(3):
+        for case_id in (1, 3, 5, 7, 9):
+            repo.update(case_id, f"Round {n}", "Desc", "open")
+    repo.delete(4)
+    repo.update(6, "Last", "Desc", "open")
+
+    pages = []
+    cursor, has_more = 0, True
+    while has_more:
+        delta = repo.get_modified_since(cursor, limit=3)
+        pages.append([case.id for case in delta.cases] + [-i for i in delta.deleted])
+        cursor, has_more = delta.cursor, delta.has_more
+
+    # Deleted IDs are negated
+    assert pages == [[2, 8, 10], [1, 3, 5], [7, 9, -4], [6]]
+    assert repo.get_by_id(6).title == "Last"
+
+    # What this test proves:
+    # Each case appears once, at its newest change, however often it was
+    # rewritten, and the pages together cover every change in order
@@ -2,8 +2,10 @@
 
 from unittest.mock import Mock
 
+import pytest
+
 from backend_api.services.case_service import CaseService
-from backend_api.models import Case
+from backend_api.models import Case, MutationOutcome
 
 # Test 1 – create_case calls repo correctly
 def test_create_case_calls_repo_and_returns_case():
@@ -78,17 +80,19 @@ def test_get_case_returns_none_when_not_found():
 def test_update_case_calls_repo_correctly():
     mock_repo = Mock()
 
-    existing_case = Case(1, "Old", "old", "open")
     updated_case = Case(1, "New", "New", "closed")
 
-    mock_repo.get_by_id.return_value = existing_case
-    mock_repo.update.return_value = updated_case
+    mock_repo.update_unless_closed.return_value = (
+        MutationOutcome.applied,
+        updated_case,
+    )
 
     service = CaseService(mock_repo)
 
     result = service.update_case(1, "New", "New", "open")
 
-    mock_repo.update.assert_called_once()
+    mock_repo.update_unless_closed.assert_called_once()
+    mock_repo.get_by_id.assert_not_called()
 
     assert result == updated_case
 
@@ -100,16 +104,80 @@ def test_update_case_calls_repo_correctly():
 # Test 5 - delete_case
 def test_delete_case_calls_repo_and_returns_bool():
     mock_repo = Mock()
-    mock_repo.delete.return_value = True
+    mock_repo.delete_unless_closed.return_value = MutationOutcome.applied
 
     service = CaseService(mock_repo)
 
     result = service.delete_case(1)
 
-    mock_repo.delete.assert_called_once_with(1)
+    mock_repo.delete_unless_closed.assert_called_once_with(1)
     assert result is True
 
     # This test ensures that the service's delete_case method
     # correctly calls the repository's delete method with
     # the provided case_id and returns the boolean result
-    # indicating success or failure of the deletion.
\ No newline at end of file
+    # indicating success or failure of the deletion.
+
+# Test 6 - list_cases returns a next cursor only when more cases exist
+def test_list_cases_returns_next_cursor():
+    mock_repo = Mock()
+    mock_repo.get_page.return_value = [
+        Case(1, "A", "A", "open"),
+        Case(2, "B", "B", "open"),
+        Case(3, "C", "C", "open"),
+    ]
+
+    service = CaseService(mock_repo)
+
+    cases, next_cursor = service.list_cases(2, after=None, status="open")
+
+    mock_repo.get_page.assert_called_once_with(3, after=None, status="open")
+    assert [c.id for c in cases] == [1, 2]
+    assert next_cursor == 2
+
+    # This test verifies that the service asks for one extra row
+    # and turns it into a cursor instead of returning it.
+
+
+# Test 7 - create_cases reports invalid items and creates the rest
+def test_create_cases_skips_items_with_empty_title():
+    mock_repo = Mock()
+    mock_repo.create_many.return_value = [Case(1, "Valid", "Desc", "open")]
+
+    service = CaseService(mock_repo)
+
+    results = service.create_cases([(" ", "Desc", "open"), ("Valid", "Desc", "open")])
+
+    mock_repo.create_many.assert_called_once_with([("Valid", "Desc", "open")])
+    assert [r.ok for r in results] == [False, True]
+    assert results[1].case_id == 1
+
+    # This test verifies that business rules run per item and
+    # only valid items reach the repository batch.
+
+
+# Test 8 - update_case refuses closed cases in one repository call
+def test_update_case_raises_for_closed_case():
+    mock_repo = Mock()
+    mock_repo.update_unless_closed.return_value = (MutationOutcome.closed, None)
+
+    service = CaseService(mock_repo)
+
+    with pytest.raises(ValueError, match="Closed cases cannot be updated"):
+        service.update_case(1, "New", "New", "open")
+
+    # This test verifies that the closed-case rule is decided by the
+    # outcome of the atomic write, not by a separate read.
+
+
+# Test 9 - delete_case distinguishes not found from closed
+def test_delete_case_outcomes():
+    mock_repo = Mock()
+    service = CaseService(mock_repo)
+
+    mock_repo.delete_unless_closed.return_value = MutationOutcome.not_found
+    assert service.delete_case(1) is False
+
+    mock_repo.delete_unless_closed.return_value = MutationOutcome.closed
+    with pytest.raises(ValueError, match="Closed cases cannot be deleted"):
+        service.delete_case(1)
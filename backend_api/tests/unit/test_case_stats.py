@@ -0,0 +1,45 @@
+# backend_api\tests\unit\test_case_stats.py
+# Unit tests for the case_stats summary table and its maintenance helpers
+
+import sqlite3
+
+from backend_api.case_stats import check_case_stats, rebuild_case_stats
+from backend_api.migrations import run_migrations
+
+
+def _database() -> sqlite3.Connection:
+    conn = sqlite3.connect(":memory:", isolation_level=None)
+    run_migrations(conn)
+    return conn
+
+
+# Test 1 - triggers keep the counters in step with bulk writes
+def test_triggers_maintain_counts():
+    conn = _database()
+    conn.executemany(
+        "INSERT INTO cases (title, description, status) VALUES (?, ?, ?)",
+        [("Case", "Stats", "open")] * 5,
+    )
+    conn.execute("UPDATE cases SET status = 'closed' WHERE id <= 2")
+    conn.execute("DELETE FROM cases WHERE id = 5")
+
+    counts = dict(conn.execute("SELECT status, count FROM case_stats"))
+    assert counts == {"open": 2, "closed": 2}
+    assert check_case_stats(conn) == {}
+
+
+# Test 2 - drift is reported and repaired by a rebuild
+def test_rebuild_repairs_drift():
+    conn = _database()
+    conn.execute(
+        "INSERT INTO cases (title, description, status) VALUES ('Case', 'Stats', 'open')"
+    )
+    conn.execute("UPDATE case_stats SET count = 7 WHERE status = 'open'")
+
+    assert check_case_stats(conn) == {"open": (7, 1)}
+
+    assert rebuild_case_stats(conn) == {"open": 1}
+    assert check_case_stats(conn) == {}
+
+    # What this test proves:
+    # Operators can detect and fix counters changed outside the triggers
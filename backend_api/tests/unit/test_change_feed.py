@@ -0,0 +1,179 @@
+# backend_api\tests\unit\test_change_feed.py
+# Unit tests for the case change log and the change-feed broadcaster
+
+import asyncio
+import sqlite3
+
+import pytest
+
+from backend_api.change_feed import ChangeBroadcaster, follow_changes
+from backend_api.migrations import run_migrations
+from backend_api.models import ChangeOperation
+from backend_api.repositories.executor import ExecutorCaseRepository
+from backend_api.repositories.inmemory import InMemoryCaseRepository
+from backend_api.repositories.sqlite import SQLiteCaseRepository
+from backend_api.services.async_case_service import AsyncCaseService
+
+
+def sqlite_repository():
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    run_migrations(conn)
+    return SQLiteCaseRepository(lambda: conn)
+
+
+@pytest.fixture(params=["sqlite", "memory"])
+def repo(request):
+    if request.param == "sqlite":
+        return sqlite_repository()
+    return InMemoryCaseRepository()
+
+
+# Test 1 - every write is logged in order, with the case after the change
+def test_writes_are_logged(repo):
+    first = repo.create("First", "Desc", "open")
+    second, = repo.create_many([("Second", "Desc", "open")])
+    repo.update(first.id, "First v2", "Desc", "in_progress")
+    repo.update_status_many([second.id], "closed")
+    repo.delete(first.id)
+
+    changes = repo.get_changes(0, 100)
+
+    assert [(c.seq, c.case_id, c.operation) for c in changes] == [
+        (1, first.id, ChangeOperation.create),
+        (2, second.id, ChangeOperation.create),
+        (3, first.id, ChangeOperation.update),
+        (4, second.id, ChangeOperation.update),
+        (5, first.id, ChangeOperation.delete),
+    ]
+    assert changes[2].case.title == "First v2"
+    assert changes[2].case.version == 2
+    assert changes[3].case.status == "closed"
+    assert changes[4].case is None
+    assert repo.last_change() == 5
+
+    # What this test proves:
+    # Both backends record creates, updates and deletes, including bulk
+    # writes, with a snapshot of the case as it was after each change
+
+
+# Test 2 - reads resume after a cursor
+def test_changes_after_cursor(repo):
+    for i in range(5):
+        repo.create(f"Case {i}", "Desc", "open")
+
+    page = repo.get_changes(2, 2)
+
+    assert [change.seq for change in page] == [3, 4]
+    assert repo.get_changes(5, 10) == []
+
+    # What this test proves:
+    # A consumer only reads what changed since its last seq
+
+
+# Test 3 - a failed conditional write logs nothing
+def test_rejected_write_is_not_logged():
+    repo = sqlite_repository()
+    case = repo.create("Closed", "Desc", "closed")
+
+    repo.update_unless_closed(case.id, "New", "Desc", "open")
+    repo.delete_unless_closed(case.id)
+
+    assert repo.last_change() == 1
+
+    # What this test proves:
+    # The log is written in the write's transaction, so only committed
+    # changes appear
+
+
+@pytest.fixture
+def service():
+    service = AsyncCaseService(ExecutorCaseRepository(InMemoryCaseRepository()))
+    yield service
+    service.close()
+
+
+# Test 4 - a follower gets the backlog, then live changes, without gaps
+def test_follow_changes_backlog_then_live(service):
+    async def scenario():
+        await service.create_case("Old", "Desc", "open")
+        broadcaster = ChangeBroadcaster(service, poll_interval=0.01)
+        seen = []
+
+        async def follow():
+            async for change in follow_changes(service, broadcaster, after=0):
+                seen.append(change.case_id)
+
+        follower = asyncio.create_task(follow())
+        await asyncio.sleep(0.05)
+        await service.create_case("New", "Desc", "open")
+        await asyncio.sleep(0.05)
+        await broadcaster.close()
+        await follower
+        return seen
+
+    assert asyncio.run(scenario()) == [1, 2]
+
+    # What this test proves:
+    # Replay and live delivery join up at the right seq
+
+
+# Test 5 - many subscribers share one poller
+def test_subscribers_share_one_reader(service):
+    in_flight = []
+    concurrent = 0
+    list_changes = service.list_changes
+
+    async def counting_list_changes(after, limit):
+        nonlocal concurrent
+        concurrent += 1
+        in_flight.append(concurrent)
+        try:
+            return await list_changes(after, limit)
+        finally:
+            concurrent -= 1
+
+    service.list_changes = counting_list_changes
+
+    async def scenario():
+        broadcaster = ChangeBroadcaster(service, poll_interval=0.01)
+        queues = [await broadcaster.subscribe() for _ in range(10)]
+        await service.create_case("Case", "Desc", "open")
+        batches = [await queue.get() for queue in queues]
+        await broadcaster.close()
+        return batches
+
+    batches = asyncio.run(scenario())
+
+    assert all([change.case_id for change in batch] == [1] for batch in batches)
+    assert max(in_flight) == 1
+
+    # What this test proves:
+    # Fan-out happens in memory; storage sees one reader, not one per
+    # subscriber
+
+
+# Test 6 - a subscriber that stops reading is dropped
+def test_lagging_subscriber_is_dropped(service):
+    async def scenario():
+        broadcaster = ChangeBroadcaster(service, poll_interval=0.01, batch_size=1, max_backlog=2)
+        queue = await broadcaster.subscribe()
+        for i in range(5):
+            await service.create_case(f"Case {i}", "Desc", "open")
+        await asyncio.sleep(0.2)
+        subscribers = broadcaster.subscribers
+        await broadcaster.close()
+
+        items = []
+        while not queue.empty():
+            items.append(queue.get_nowait())
+        return subscribers, items
+
+    subscribers, items = asyncio.run(scenario())
+
+    assert subscribers == 0
+    assert items[-1] is None
+
+    # What this test proves:
+    # A slow consumer cannot make the broadcaster buffer without bound;
+    # its stream ends and it resumes from its last seq
@@ -0,0 +1,150 @@
+# backend_api\tests\unit\test_connection_pool.py
+# Unit tests for the SQLite ConnectionPool
+
+import sqlite3
+import threading
+
+import pytest
+
+from backend_api.db import ConnectionPool, PoolTimeout, get_pragma_profile
+
+
+@pytest.fixture
+def pool(tmp_path):
+    pool = ConnectionPool(str(tmp_path / "pool.db"), size=2, timeout=0.2)
+    yield pool
+    pool.close()
+
+
+# Test 1 - connections are reused instead of reopened
+def test_connection_is_reused(pool):
+    with pool.connection() as first:
+        pass
+    with pool.connection() as second:
+        pass
+
+    assert first is second
+    assert pool.stats().created == 1
+    assert pool.stats().checkouts == 2
+
+    # What this test proves:
+    # The pool keeps connections open between checkouts
+
+
+# Test 2 - checkout times out when the pool is exhausted
+def test_checkout_times_out_when_exhausted(pool):
+    with pool.connection(), pool.connection():
+        with pytest.raises(PoolTimeout):
+            with pool.connection():
+                pass
+
+    stats = pool.stats()
+    assert stats.timeouts == 1
+    assert stats.waits == 1
+    assert stats.wait_time > 0
+
+    # What this test proves:
+    # The pool is bounded and waiting is reported in stats
+
+
+# Test 3 - a waiting thread gets the connection when it is released
+def test_waiter_is_served_on_release(pool):
+    pool = ConnectionPool(pool.database, size=1, timeout=5)
+    acquired = []
+
+    def worker_checkout():
+        with pool.connection():
+            acquired.append(True)
+
+    with pool.connection():
+        worker = threading.Thread(target=worker_checkout)
+        worker.start()
+        worker.join(0.05)
+        assert pool.stats().in_use == 1
+        assert not acquired
+
+    worker.join(5)
+    assert len(acquired) == 1
+    pool.close()
+
+
+# Test 4 - open transactions are rolled back on release
+def test_uncommitted_work_is_rolled_back(pool):
+    with pool.connection() as conn:
+        conn.execute("CREATE TABLE t (x INTEGER)")
+        conn.commit()
+        conn.execute("INSERT INTO t VALUES (1)")
+
+    with pool.connection() as conn:
+        assert conn.in_transaction is False
+        assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+
+
+# Test 5 - old connections are recycled
+def test_expired_connection_is_recycled(tmp_path):
+    pool = ConnectionPool(str(tmp_path / "pool.db"), size=1, recycle=0)
+
+    with pool.connection() as first:
+        pass
+    with pool.connection() as second:
+        pass
+
+    assert first is not second
+    assert pool.stats().recycled == 1
+    pool.close()
+
+
+# Test 6 - the pragma profile is applied to pooled connections
+def test_pragma_profile_is_applied(tmp_path):
+    pool = ConnectionPool(
+        str(tmp_path / "pool.db"),
+        pragmas=get_pragma_profile("throughput"),
+    )
+
+    with pool.connection() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        # NORMAL == 1
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+    pool.close()
+
+    # What this test proves:
+    # Presets are applied when the pool opens a connection
+
+
+# Test 7 - unknown presets are rejected
+def test_unknown_pragma_profile_is_rejected():
+    with pytest.raises(ValueError):
+        get_pragma_profile("turbo")
+
+    # What this test proves:
+    # A typo in a preset name fails loudly instead of silently
+
+
+# Test 8 - a read-only pool sees committed data but cannot write
+def test_read_only_pool_rejects_writes(tmp_path):
+    database = str(tmp_path / "pool.db")
+    primary = ConnectionPool(database, pragmas=get_pragma_profile("throughput"))
+    with primary.connection() as conn:
+        conn.execute("CREATE TABLE t (x INTEGER)")
+        conn.commit()
+
+    replica = ConnectionPool(
+        database,
+        pragmas=get_pragma_profile("throughput"),
+        read_only=True,
+    )
+    with primary.connection() as conn:
+        conn.execute("INSERT INTO t VALUES (1)")
+        conn.commit()
+
+    with replica.connection() as conn:
+        assert conn.execute("SELECT x FROM t").fetchone()[0] == 1
+        with pytest.raises(sqlite3.OperationalError):
+            conn.execute("INSERT INTO t VALUES (2)")
+
+    replica.close()
+    primary.close()
+
+    # What this test proves:
+    # Reads can be moved to connections that are unable to write
@@ -0,0 +1,95 @@
+# backend_api\tests\unit\test_group_commit.py
+# Unit tests for group-commit write batching
+
+import threading
+
+import pytest
+
+from backend_api.db import ConnectionPool
+from backend_api.migrations import run_migrations
+from backend_api.models import MutationOutcome
+from backend_api.repositories.group_commit import GroupCommitCaseRepository
+
+
+@pytest.fixture
+def pool(tmp_path):
+    pool = ConnectionPool(str(tmp_path / "cases.db"), size=4)
+    with pool.connection() as conn:
+        run_migrations(conn)
+    yield pool
+    pool.close()
+
+
+# Test 1 - concurrent creates share commits and keep their own IDs
+def test_concurrent_creates_are_batched(pool):
+    repo = GroupCommitCaseRepository(pool.connection, max_batch=50, max_delay=0.05)
+    barrier = threading.Barrier(20)
+    created = []
+
+    def worker(n: int) -> None:
+        barrier.wait()
+        created.append(repo.create(f"Case {n}", "Batched", "open"))
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    repo.close()
+
+    assert sorted(case.id for case in created) == list(range(1, 21))
+    for case in created:
+        assert repo.get_by_id(case.id).title == case.title
+    stats = repo.stats()
+    assert stats.writes == 20
+    assert stats.batches < 20
+
+    # What this test proves:
+    # Callers get their own lastrowid while commits are shared
+
+
+# Test 2 - a failing write is rolled back alone
+def test_failed_write_does_not_affect_its_batch(pool):
+    repo = GroupCommitCaseRepository(pool.connection, max_batch=10, max_delay=0.05)
+    results = {}
+
+    def good() -> None:
+        results["good"] = repo.create("Good", "Kept", "open")
+
+    def bad() -> None:
+        try:
+            repo.create(None, "Violates NOT NULL", "open")
+        except Exception as e:
+            results["bad"] = e
+
+    threads = [threading.Thread(target=fn) for fn in (good, bad)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    repo.close()
+
+    assert isinstance(results["bad"], Exception)
+    assert repo.get_by_id(results["good"].id) is not None
+    assert repo.count() == 1
+
+
+# Test 3 - conditional and bulk writes keep their outcomes
+def test_conditional_writes_through_the_writer(pool):
+    repo = GroupCommitCaseRepository(pool.connection)
+    open_case, closed_case = repo.create_many(
+        [("Open", "Desc", "open"), ("Closed", "Desc", "closed")]
+    )
+
+    outcome, updated = repo.update_unless_closed(open_case.id, "New", "Desc", "open")
+    assert outcome is MutationOutcome.applied
+    assert updated.version == 2
+    assert repo.delete_unless_closed(closed_case.id) is MutationOutcome.closed
+    assert repo.delete_many([open_case.id, 999]) == {
+        open_case.id: MutationOutcome.applied,
+        999: MutationOutcome.not_found,
+    }
+
+    repo.close()
+    with pytest.raises(RuntimeError):
+        repo.create("Late", "Closed repository", "open")
@@ -0,0 +1,77 @@
+# backend_api\tests\unit\test_metrics.py
+# Unit tests for the metrics registry and the timing decorators
+
+import asyncio
+
+import pytest
+
+from backend_api.metrics import MetricsRegistry
+from backend_api.repositories.executor import ExecutorCaseRepository
+from backend_api.repositories.inmemory import InMemoryCaseRepository
+from backend_api.repositories.instrumented import InstrumentedCaseRepository
+from backend_api.services.async_case_service import AsyncCaseService
+from backend_api.services.instrumented import InstrumentedCaseService
+
+
+# Test 1 - counters and histograms render in the Prometheus text format
+def test_registry_renders_text_format():
+    registry = MetricsRegistry()
+    registry.counter("jobs_total", "Jobs.", ("kind",)).inc("a", amount=2)
+    histogram = registry.histogram("work_seconds", "Work.", buckets=(0.1, 1.0))
+    histogram.observe(0.05)
+    histogram.observe(0.5)
+    histogram.observe(5.0)
+
+    text = registry.render()
+
+    assert "# TYPE jobs_total counter" in text
+    assert 'jobs_total{kind="a"} 2' in text
+    assert 'work_seconds_bucket{le="0.1"} 1' in text
+    assert 'work_seconds_bucket{le="1"} 2' in text
+    assert 'work_seconds_bucket{le="+Inf"} 3' in text
+    assert "work_seconds_count 3" in text
+
+
+# Test 2 - the repository decorator records timings, rows and errors
+def test_instrumented_repository_records_calls():
+    registry = MetricsRegistry()
+    repo = InstrumentedCaseRepository(InMemoryCaseRepository(), registry)
+
+    repo.create_many([("A", "Desc", "open"), ("B", "Desc", "open")])
+    repo.get_page(10)
+    list(repo.iter_all())
+    with pytest.raises(TypeError):
+        repo.get_page("not a limit")
+
+    duration = registry.histogram("case_repository_duration_seconds", "", ("method",))
+    rows = registry.counter("case_repository_rows_total", "", ("method",))
+    errors = registry.counter("case_repository_errors_total", "", ("method",))
+    assert duration.count("create_many") == 1
+    assert rows.value("create_many") == 2
+    assert rows.value("get_page") == 2
+    assert rows.value("iter_all") == 2
+    assert duration.count("iter_all") == 1
+    assert errors.value("get_page") == 1
+
+    # What this test proves:
+    # Any backend gets per-method timings by wrapping it
+
+
+# Test 3 - the service decorator times coroutines and counts rejections
+def test_instrumented_service_counts_errors_by_type():
+    registry = MetricsRegistry()
+    executor = ExecutorCaseRepository(InMemoryCaseRepository(), readers=1)
+    service = InstrumentedCaseService(AsyncCaseService(executor), registry)
+
+    async def scenario():
+        await service.create_case("Title", "Desc", "open")
+        with pytest.raises(ValueError):
+            await service.create_case("   ", "Desc", "open")
+
+    asyncio.run(scenario())
+    service.close()
+
+    duration = registry.histogram("case_service_duration_seconds", "", ("method",))
+    errors = registry.counter("case_service_errors_total", "", ("method", "error"))
+    assert duration.count("create_case") == 2
+    assert errors.value("create_case", "ValueError") == 1
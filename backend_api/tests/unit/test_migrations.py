@@ -0,0 +1,88 @@
+# backend_api\tests\unit\test_migrations.py
+# Unit tests for the schema migration runner
+
+import sqlite3
+
+import pytest
+
+from backend_api.migrations import MIGRATIONS, Migration, run_migrations
+
+
+# Test 1 - a fresh database is migrated to the latest version
+def test_fresh_database_is_migrated_to_latest():
+    conn = sqlite3.connect(":memory:")
+
+    version = run_migrations(conn)
+
+    assert version == MIGRATIONS[-1].version
+    tables = {
+        row[0]
+        for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+    }
+    assert {"cases", "schema_version"} <= tables
+
+
+# Test 2 - running twice is a no-op
+def test_migrations_are_applied_once():
+    conn = sqlite3.connect(":memory:")
+
+    run_migrations(conn)
+    run_migrations(conn)
+
+    count = conn.execute("SELECT COUNT(*) FROM schema_version").fetchone()[0]
+    assert count == len(MIGRATIONS)
+
+    # What this test proves:
+    # Startup can run the migrator unconditionally
+
+
+# Test 3 - pending steps are applied in version order
+def test_pending_migrations_run_in_order():
+    conn = sqlite3.connect(":memory:")
+    steps = [
+        Migration(2, "add column", "ALTER TABLE t ADD COLUMN y INTEGER;"),
+        Migration(1, "create table", "CREATE TABLE t (x INTEGER);"),
+    ]
+
+    assert run_migrations(conn, steps) == 2
+    columns = [row[1] for row in conn.execute("PRAGMA table_info(t)")]
+    assert columns == ["x", "y"]
+
+
+# Test 4 - a failing step is rolled back and not recorded
+def test_failed_migration_is_rolled_back():
+    conn = sqlite3.connect(":memory:")
+    steps = [
+        Migration(1, "create table", "CREATE TABLE t (x INTEGER);"),
+        Migration(2, "broken", "CREATE TABLE u (x INTEGER); SELECT * FROM missing;"),
+    ]
+
+    with pytest.raises(sqlite3.OperationalError):
+        run_migrations(conn, steps)
+
+    versions = [row[0] for row in conn.execute("SELECT version FROM schema_version")]
+    assert versions == [1]
+    tables = [
+        row[0]
+        for row in conn.execute("SELECT name FROM sqlite_master WHERE name = 'u'")
+    ]
+    assert tables == []
+
+
+# Test 5 - rows that predate row versions are included in a full sync
+def test_row_versions_are_backfilled():
+    conn = sqlite3.connect(":memory:")
+    run_migrations(conn, [m for m in MIGRATIONS if m.version < 7])
+    conn.execute("INSERT INTO cases (title, description, status) VALUES ('Old', 'D', 'open')")
+    conn.commit()
+
+    run_migrations(conn)
+    conn.execute("INSERT INTO cases (title, description, status) VALUES ('New', 'D', 'open')")
+
+    rows = conn.execute("SELECT title, row_version FROM cases ORDER BY id").fetchall()
+    assert rows == [("Old", 1), ("New", 2)]
+    # Backfilling is not itself a change
+    assert conn.execute("SELECT COUNT(*) FROM case_changes").fetchone()[0] == 2
+
+    # What this test proves:
+    # Existing databases can start delta sync without losing old rows
@@ -0,0 +1,133 @@
+# backend_api\tests\unit\test_response_cache.py
+# Unit tests for the HTTP response cache
+
+import asyncio
+import gzip
+import time
+
+from backend_api.repositories.executor import ExecutorCaseRepository
+from backend_api.repositories.inmemory import InMemoryCaseRepository
+from backend_api.response_cache import ResponseCache, accepted_encoding
+from backend_api.services.async_case_service import AsyncCaseService
+
+
+# Test 1 - entries are served until the generation moves on
+def test_entries_follow_write_generation():
+    cache = ResponseCache()
+    cache.put("key", 0, b"[]")
+
+    assert cache.get("key", 0).body == b"[]"
+    assert cache.get("key", 1) is None
+    assert cache.get("key", 0) is None
+    assert cache.stats().hits == 1
+
+    # What this test proves:
+    # One bump of the write generation invalidates every entry
+
+
+# Test 2 - a body built before a write is not cached after it
+def test_stale_body_is_not_stored():
+    cache = ResponseCache()
+    cache.get("other", 2)
+
+    cache.put("key", 1, b"old")
+
+    assert cache.get("key", 2) is None
+
+    # What this test proves:
+    # A slow build racing a write cannot plant stale data
+
+
+# Test 3 - size and TTL bound the cache
+def test_cache_is_bounded():
+    cache = ResponseCache(max_entries=2, ttl=0.01)
+    for key in ("a", "b", "c"):
+        cache.put(key, 0, b"x")
+
+    assert cache.stats().size == 2
+    time.sleep(0.02)
+    assert cache.get("c", 0) is None
+
+    # What this test proves:
+    # Entries are evicted by count and expire by age
+
+
+# Test 4 - compressed copies are made once and reused
+def test_compressed_body_is_reused():
+    entry = ResponseCache().put("key", 0, b"x" * 5000)
+
+    compressed = entry.encoded("gzip")
+
+    assert gzip.decompress(compressed) == entry.body
+    assert entry.encoded("gzip") is compressed
+
+    # What this test proves:
+    # Repeated responses do not pay for compression again
+
+
+# Test 5 - Accept-Encoding negotiation
+def test_accepted_encoding():
+    assert accepted_encoding("gzip, deflate") == "gzip"
+    assert accepted_encoding("gzip;q=0") is None
+    assert accepted_encoding("*") is not None
+    assert accepted_encoding("") is None
+    assert accepted_encoding("identity") is None
+
+    # What this test proves:
+    # Only encodings the client allows are used
+
+
+# Test 6 - writes through the service bump its generation
+def test_service_writes_bump_generation():
+    service = AsyncCaseService(ExecutorCaseRepository(InMemoryCaseRepository()))
+
+    async def scenario():
+        before = service.generation.value
+        case = await service.create_case("Test", "Desc", "open")
+        await service.get_case(case.id)
+        after_read = service.generation.value
+        await service.delete_case(case.id)
+        return before, after_read, service.generation.value
+
+    try:
+        assert asyncio.run(scenario()) == (0, 1, 2)
+    finally:
+        service.close()
+
+    # What this test proves:
+    # Reads leave the generation alone; every mutation moves it on
+
+
+# Test 7 - serve() answers from plain request data
+def test_serve_negotiates_without_a_framework():
+    cache = ResponseCache()
+    builds = []
+
+    async def build():
+        builds.append(1)
+        return b"x" * 5000, {"X-Next-Cursor": "5"}
+
+    async def scenario():
+        first = await cache.serve(
+            "/cases/", [("limit", "5"), ("after", "0")], {"accept-encoding": "gzip"}, 0, build
+        )
+        second = await cache.serve(
+            "/cases/",
+            [("after", "0"), ("limit", "5")],
+            {"if-none-match": first.headers["ETag"]},
+            0,
+            build,
+        )
+        return first, second
+
+    first, second = asyncio.run(scenario())
+
+    assert first.status_code == 200 and first.headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(first.body) == b"x" * 5000
+    assert first.headers["X-Next-Cursor"] == "5"
+    assert (second.status_code, second.body, second.media_type) == (304, b"", None)
+    assert len(builds) == 1
+
+    # What this test proves:
+    # The cache needs no request or response objects, and query order
+    # does not split entries
@@ -0,0 +1,103 @@
+# backend_api\tests\unit\test_settings.py
+# Unit tests for loading settings from a file and the environment
+
+import pytest
+
+from backend_api.settings import Settings, load_settings
+
+
+# Test 1 - without a file or variables, the defaults apply
+def test_defaults_without_configuration():
+    assert load_settings(environ={}) == Settings()
+
+    # What this test proves:
+    # An unconfigured deployment behaves as before settings existed
+
+
+# Test 2 - environment variables are converted to the field types
+def test_environment_overrides():
+    settings = load_settings(
+        environ={
+            "CASES_BACKEND": "memory",
+            "CASES_POOL_SIZE": "8",
+            "CASES_CASE_CACHE_TTL": "2.5",
+            "CASES_METRICS_ENABLED": "off",
+            "CASES_SNAPSHOT_REFRESH_INTERVAL": "none",
+            "PATH": "/usr/bin",
+        }
+    )
+
+    assert settings.backend == "memory"
+    assert settings.pool_size == 8
+    assert settings.case_cache_ttl == 2.5
+    assert settings.metrics_enabled is False
+    assert settings.snapshot_refresh_interval is None
+
+    # What this test proves:
+    # Every field type can be set from a string; other variables are ignored
+
+
+# Test 3 - a TOML file is read, and the environment wins over it
+def test_file_then_environment(tmp_path):
+    path = tmp_path / "cases.toml"
+    path.write_text(
+        'backend = "sqlite-group"\n'
+        'database_path = "/dev/shm/cases.db"\n'
+        "group_commit_max_batch = 16\n"
+    )
+
+    settings = load_settings(
+        environ={"CASES_SETTINGS_FILE": str(path), "CASES_GROUP_COMMIT_MAX_BATCH": "32"}
+    )
+
+    assert settings.backend == "sqlite-group"
+    assert settings.database_path == "/dev/shm/cases.db"
+    assert settings.group_commit_max_batch == 32
+
+    # What this test proves:
+    # A node is configured by a file, with per-process overrides on top
+
+
+# Test 4 - JSON files are supported too
+def test_json_file(tmp_path):
+    path = tmp_path / "cases.json"
+    path.write_text('{"pragma_profile": "throughput", "response_cache_ttl": 5}')
+
+    settings = load_settings(environ={}, path=str(path))
+
+    assert settings.pragma_profile == "throughput"
+    assert settings.response_cache_ttl == 5.0
+
+
+# Test 5 - mistakes fail at startup instead of being ignored
+@pytest.mark.parametrize(
+    "environ",
+    [
+        {"CASES_POOL_SIZ": "8"},
+        {"CASES_POOL_SIZE": "eight"},
+        {"CASES_POOL_SIZE": "0"},
+        {"CASES_METRICS_ENABLED": "maybe"},
+        {"CASES_PRAGMA_PROFILE": "fastest"},
+        {"CASES_READ_CONNECTIONS": "replica"},
+    ],
+)
+def test_bad_settings_are_rejected(environ):
+    with pytest.raises(ValueError):
+        load_settings(environ=environ)
+
+
+# Test 6 - file values must already have the right type
+def test_bad_file_values_are_rejected(tmp_path):
+    path = tmp_path / "cases.toml"
+    path.write_text("metrics_enabled = 1\n")
+
+    with pytest.raises(ValueError):
+        load_settings(environ={}, path=str(path))
+
+    path.write_text("unknown = 1\n")
+
+    with pytest.raises(ValueError):
+        load_settings(environ={}, path=str(path))
+
+    # What this test proves:
+    # Typos and wrong types in a settings file are reported, not guessed at